@@ -1,5 +1,28 @@
-from flowlayer.core.network import Depends, Network
+from typing import TYPE_CHECKING, Any
 
-Flow = Network
+if TYPE_CHECKING:
+    from flowlayer.core.network import Depends, Map, Network
 
-__all__ = ["Depends", "Flow"]
+    Flow = Network
+
+__all__ = ["Depends", "Flow", "Map"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access, keeps `import flowlayer` cheap."""
+    if name == "Depends":
+        from flowlayer.core.network import Depends
+
+        return Depends
+
+    if name == "Map":
+        from flowlayer.core.network import Map
+
+        return Map
+
+    if name == "Flow":
+        from flowlayer.core.network import Network
+
+        return Network
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
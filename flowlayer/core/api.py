@@ -1,11 +1,15 @@
 import abc
-from typing import Any, Dict, List, Optional, Tuple, Type
-
-import networkx
-import numpy
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 from flowlayer.core.nodes import GearInput, GearNode, GearOutput, OutputNode
 
+if TYPE_CHECKING:
+    import networkx
+    import numpy
+
+    from flowlayer.core.engine import Run, RunHandle
+    from flowlayer.core.retention import RetentionPolicy
+
 
 class NetworkPlotAPI(metaclass=abc.ABCMeta):
     """Network plot actions."""
@@ -24,6 +28,14 @@ class NetworkPlotAPI(metaclass=abc.ABCMeta):
         """Write plot to a file."""
         raise NotImplementedError
 
+    def to_dot(self) -> str:
+        """Return plot as DOT text."""
+        raise NotImplementedError
+
+    def to_svg(self) -> str:
+        """Return plot as SVG."""
+        raise NotImplementedError
+
 
 class NetworkAPI(metaclass=abc.ABCMeta):
     """Abstract class defining network actions."""
@@ -44,7 +56,7 @@ class NetworkAPI(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
     @property
-    def graph(self) -> networkx.MultiDiGraph:
+    def graph(self) -> "networkx.MultiDiGraph":
         """Get computational graph representation."""
         raise NotImplementedError
 
@@ -106,22 +118,68 @@ class EngineAPI(metaclass=abc.ABCMeta):
         """Runs the computational network and returns the result object."""
         raise NotImplementedError
 
+    def execute(self, run: "Run") -> NetworkAPI:
+        """Execute a prepared run and return its computed network."""
+        raise NotImplementedError
+
+    def submit(self, network: NetworkAPI, **kwargs: Any) -> "RunHandle":
+        """Start the computational network in the background and return its handle."""
+        raise NotImplementedError
+
     def teardown(self) -> None:
         """Cleanup phase."""
         raise NotImplementedError
 
+    def register(self, network: NetworkAPI) -> None:
+        """Publish network so that workers of the engine can load it."""
+        raise NotImplementedError
+
+    def get_networks(self) -> List[NetworkAPI]:
+        """Return networks registered with the engine."""
+        raise NotImplementedError
+
 
 class FeatureStoreAPI(metaclass=abc.ABCMeta):
     """Feature store actions."""
 
-    def set(self, tensor: numpy.ndarray, network: NetworkAPI) -> Tuple[str, str]:
+    def set(self, tensor: "numpy.ndarray", network: NetworkAPI, timestamp: Optional[int] = None, entity: Optional[str] = None) -> Tuple[str, str]:
         """Store tensor to the store."""
         raise NotImplementedError
 
-    def get(self, key: str) -> numpy.ndarray:
+    def get(self, key: str) -> "numpy.ndarray":
         """Get tensor from the store."""
         raise NotImplementedError
 
     def get_keys(self, network: NetworkAPI, start: str = "-", end: str = "+", limit: int = 500) -> List[Tuple[str, str]]:
         """Get slice of keys for a given features."""
         raise NotImplementedError
+
+    def latest(self, network: NetworkAPI, n: int = 1) -> List[Tuple[int, str]]:
+        """Get `n` most recent keys of a given feature, newest first."""
+        raise NotImplementedError
+
+    def get_range(self, network: NetworkAPI, start: Optional[int] = None, end: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Get keys of a given feature written within a time window."""
+        raise NotImplementedError
+
+    def as_of(self, network: NetworkAPI, timestamp: int) -> Optional[Tuple[int, str]]:
+        """Get the key of a given feature as it was at a point in time."""
+        raise NotImplementedError
+
+    def set_retention(self, network: NetworkAPI, policy: Optional["RetentionPolicy"]) -> None:
+        """Set retention policy of a given feature."""
+        raise NotImplementedError
+
+    def compact(self, now: Optional[int] = None) -> int:
+        """Drop features outside of their retention policy."""
+        raise NotImplementedError
+
+    def get_outputs(self, network: NetworkAPI, key: str) -> Optional[Dict[str, Any]]:
+        """Get stored network outputs computed for a given input digest."""
+        raise NotImplementedError
+
+    def set_outputs(
+        self, network: NetworkAPI, key: str, outputs: Dict[str, Any], timestamp: Optional[int] = None, entity: Optional[str] = None
+    ) -> None:
+        """Store network outputs computed for a given input digest."""
+        raise NotImplementedError
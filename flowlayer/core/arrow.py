@@ -0,0 +1,138 @@
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Sequence, Union
+
+# NOTE: PyArrow is optional, it is imported on first use and only required by networks exchanging Arrow data.
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+    from flowlayer.core.nodes import DataNode
+
+    ArrowData = Union[pyarrow.Table, pyarrow.RecordBatch]
+
+SHM_DIR = Path("/dev/shm")  # nosec
+IPC_SUFFIX = ".arrow"
+
+
+def require_pyarrow() -> Any:
+    """Import PyArrow or explain how to install it."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("arrow support requires pyarrow - install `flowlayer[arrow]`") from e
+
+    return pyarrow
+
+
+def column_to_numpy(column: Any) -> "numpy.ndarray":
+    """Convert Arrow column to NumPy, buffers are shared when the type and nulls allow it."""
+    if hasattr(column, "num_chunks"):
+        # NOTE: A chunked column is contiguous only when it has a single chunk, others are combined into a copy.
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+
+    try:
+        array: "numpy.ndarray" = column.to_numpy(zero_copy_only=True)
+    except Exception:
+        array = column.to_numpy(zero_copy_only=False)
+
+    return array
+
+
+def arrow_inputs(data: "ArrowData", names: Iterable[str]) -> Dict[str, "numpy.ndarray"]:
+    """Map columns of a table or record batch to network inputs of the same name."""
+    columns = set(data.schema.names)
+    return {name: column_to_numpy(data.column(name)) for name in names if name in columns}
+
+
+def results_to_batch(results: Sequence["DataNode"]) -> "pyarrow.RecordBatch":
+    """Assemble values of result nodes into a record batch, NumPy buffers are wrapped without copying."""
+    import numpy
+
+    pyarrow = require_pyarrow()
+
+    arrays = []
+    for node in results:
+        value = node.value
+        if not isinstance(value, (pyarrow.Array, pyarrow.ChunkedArray)):
+            value = pyarrow.array(numpy.atleast_1d(numpy.asarray(value)))
+
+        arrays.append(value.combine_chunks() if isinstance(value, pyarrow.ChunkedArray) else value)
+
+    return pyarrow.RecordBatch.from_arrays(arrays, names=[node.name for node in results])
+
+
+def write_ipc(data: "ArrowData", path: Union[str, Path]) -> Path:
+    """Write table or record batch as an Arrow IPC file."""
+    pyarrow = require_pyarrow()
+    from pyarrow import ipc
+
+    path = Path(path)
+    with pyarrow.OSFile(str(path), "wb") as sink, ipc.new_file(sink, data.schema) as writer:
+        writer.write(data)
+
+    return path
+
+
+def read_ipc(path: Union[str, Path]) -> "pyarrow.Table":
+    """Memory map an Arrow IPC file, columns point into the mapping instead of being read."""
+    pyarrow = require_pyarrow()
+    from pyarrow import ipc
+
+    source = pyarrow.memory_map(str(path), "r")
+    return ipc.open_file(source).read_all()
+
+
+class SharedBatch:
+    """Arrow data handed between processes through an IPC file, pickles as its path only."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Shared batch constructor."""
+        self._path = Path(path)
+        self._table: Optional["pyarrow.Table"] = None
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"SharedBatch({self._path})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the path, receivers map the file themselves."""
+        return {"_path": self._path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore shared batch."""
+        self._path = state["_path"]
+        self._table = None
+
+    @property
+    def path(self) -> Path:
+        """IPC file of the data."""
+        return self._path
+
+    @property
+    def table(self) -> "pyarrow.Table":
+        """Memory mapped table."""
+        if self._table is None:
+            self._table = read_ipc(self._path)
+
+        return self._table
+
+    def column(self, name: str) -> "numpy.ndarray":
+        """Column as a read-only NumPy array backed by the mapping."""
+        return column_to_numpy(self.table.column(name))
+
+    def release(self) -> None:
+        """Remove the IPC file, arrays already mapped stay valid until dropped."""
+        self._table = None
+        if self._path.exists():
+            os.unlink(self._path)
+
+
+def share(data: "ArrowData", directory: Optional[Union[str, Path]] = None) -> SharedBatch:
+    """Write Arrow data for other processes, into shared memory when available."""
+    if directory is None:
+        directory = SHM_DIR if SHM_DIR.is_dir() else Path(tempfile.gettempdir())
+
+    return SharedBatch(write_ipc(data, Path(directory) / f"flowlayer-{uuid.uuid4().hex}{IPC_SUFFIX}"))
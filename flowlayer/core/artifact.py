@@ -0,0 +1,155 @@
+import importlib
+import inspect
+import pickle
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from flowlayer.core.nodes import DataNode, GearInput, GearInputOutput, GearNode, GearOutput, MapGear, NetworkNode
+
+if TYPE_CHECKING:
+    from flowlayer.core.network import Network
+
+ARTIFACT_FORMAT = 1
+
+# NOTE: Node kinds are stored as tags, classes are never pickled into an artifact.
+DATA_KINDS: Dict[str, type] = {"input": GearInput, "output": GearOutput, "input_output": GearInputOutput}
+KIND_TAGS: Dict[type, str] = {cls: tag for tag, cls in DATA_KINDS.items()}
+
+NodeRecord = Tuple[Any, ...]
+
+
+def func_ref(func: Callable[..., Any]) -> str:
+    """Import path of a gear function."""
+    qualname: str = func.__qualname__
+    if "<locals>" in qualname or "<lambda>" in qualname:
+        raise ValueError(f"gear `{qualname}` cannot be exported - define it at module level")
+
+    return f"{func.__module__}:{qualname}"
+
+
+def resolve_ref(ref: str) -> Callable[..., Any]:
+    """Import gear function from its import path."""
+    module_name, qualname = ref.split(":", 1)
+
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+
+    func: Callable[..., Any] = obj
+    return func
+
+
+def _portable_params(gear: GearNode) -> Dict[str, inspect.Parameter]:
+    """Parameters of a gear with dependencies stripped, edges of the artifact already describe them."""
+    from flowlayer.core.network import Depends
+
+    return {name: param.replace(default=inspect.Parameter.empty) if isinstance(param.default, Depends) else param for name, param in gear.params.items()}
+
+
+class NetworkArtifact:
+    """Compiled network which loads without introspecting gear functions."""
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        """Network artifact constructor."""
+        if payload.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"unsupported artifact format {payload.get('format')} - expected {ARTIFACT_FORMAT}")
+
+        self._payload = payload
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"NetworkArtifact({self.name}-{self.version})"
+
+    @property
+    def name(self) -> str:
+        """Name of the network."""
+        name: str = self._payload["name"]
+        return name
+
+    @property
+    def version(self) -> str:
+        """Version of the network."""
+        version: str = self._payload["version"]
+        return version
+
+    @property
+    def identifier(self) -> int:
+        """Identifier of the network."""
+        identifier: int = self._payload["identifier"]
+        return identifier
+
+    @classmethod
+    def from_network(cls, network: "Network") -> "NetworkArtifact":
+        """Compile network into an artifact."""
+        topology = network.topology
+
+        nodes: List[NodeRecord] = []
+        for node in topology.nodes:
+            if isinstance(node, MapGear):
+                nodes.append(("map", func_ref(node.func), _portable_params(node), node.return_type, node.item))
+            elif isinstance(node, GearNode):
+                nodes.append(("gear", func_ref(node.func), _portable_params(node), node.return_type))
+            else:
+                nodes.append((KIND_TAGS[type(node)], node.name, node.value if isinstance(node, GearInput) else None, node.annotation))
+
+        payload = {
+            "format": ARTIFACT_FORMAT,
+            "name": network.name,
+            "version": network.version,
+            "identifier": network.identifier,
+            "settings": network.settings,
+            "outputs": [func_ref(func) for func in network.outputting_nodes],
+            "nodes": nodes,
+            "indptr": topology.indptr,
+            "indices": topology.indices,
+        }
+
+        return cls(payload)
+
+    def to_bytes(self) -> bytes:
+        """Serialize artifact."""
+        return pickle.dumps(self._payload, protocol=4)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "NetworkArtifact":
+        """Deserialize artifact."""
+        payload = pickle.loads(data)  # nosec
+        if not isinstance(payload, dict):
+            raise ValueError("data is not a network artifact")
+
+        return cls(payload)
+
+    def build(self, **kwargs: Any) -> "Network":
+        """Build network, `kwargs` override stored network settings such as `engine` or `feature_store`."""
+        from flowlayer.core.network import Network
+
+        settings = {**self._payload["settings"], **kwargs}
+        entity_key = settings.pop("entity_key", None)
+
+        network = Network(self.name, version=self.version, **settings)
+        network._outputting_nodes = [resolve_ref(ref) for ref in self._payload["outputs"]]
+        network._entity_key = entity_key
+
+        graph = network.graph
+        validation = network.validation
+
+        nodes: List[NetworkNode] = []
+        for kind, *record in self._payload["nodes"]:
+            if kind == "gear":
+                ref, params, return_type = record
+                nodes.append(GearNode.from_signature(resolve_ref(ref), params, return_type, graph=graph))
+            elif kind == "map":
+                ref, params, return_type, item = record
+                map_gear = MapGear.from_signature(resolve_ref(ref), params, return_type, graph=graph)
+                map_gear._item = item
+                nodes.append(map_gear)
+            else:
+                name, value, annotation = record
+                data_node: DataNode = DATA_KINDS[kind](name, value, annotation, graph=graph, validation=validation)
+                nodes.append(data_node)
+
+        indptr, indices = self._payload["indptr"], self._payload["indices"]
+
+        graph.add_nodes_from(nodes)  # type: ignore
+        graph.add_edges_from((src, nodes[j]) for i, src in enumerate(nodes) for j in indices[indptr[i] : indptr[i + 1]])  # type: ignore
+
+        return network
@@ -0,0 +1,89 @@
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+def input_digest(inputs: Dict[str, Any]) -> str:
+    """Hash network inputs into a stable digest."""
+    digest = hashlib.blake2b(digest_size=16)
+
+    for name in sorted(inputs):
+        value = inputs[name]
+        digest.update(name.encode("utf-8"))
+
+        # NOTE: Hash array buffers directly instead of pickling them, object arrays only hold pointers.
+        dtype = getattr(value, "dtype", None)
+        if hasattr(value, "tobytes") and dtype is not None and not getattr(dtype, "hasobject", True):
+            digest.update(f"{value.dtype}{getattr(value, 'shape', ())}".encode("utf-8"))
+            digest.update(value.tobytes())
+        else:
+            digest.update(pickle.dumps(value, protocol=4))
+
+    return digest.hexdigest()
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe least recently used cache."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """LRU cache constructor."""
+        if maxsize < 0:
+            raise ValueError("maxsize must be positive")
+
+        self._maxsize = maxsize
+        self._data: "OrderedDict[str, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if key is cached without touching its recency."""
+        return key in self._data
+
+    @property
+    def hits(self) -> int:
+        """Number of cache hits."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of cache misses."""
+        return self._misses
+
+    def get(self, key: str) -> Optional[V]:
+        """Return cached value and mark it as recently used."""
+        with self._lock:
+            if key not in self._data:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._data.move_to_end(key)
+
+            return self._data[key]
+
+    def put(self, key: str, value: V) -> None:
+        """Cache value and evict the least recently used one when full."""
+        if self._maxsize == 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._data.clear()
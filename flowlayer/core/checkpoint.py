@@ -0,0 +1,166 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Union
+
+from flowlayer.core.nodes import DataNode, GearInput
+
+if TYPE_CHECKING:
+    from flowlayer.core.api import NetworkAPI
+    from flowlayer.core.engine import Run
+
+MANIFEST_NAME = "manifest.json"
+JOURNAL_NAME = "journal"
+INPUTS_NAME = "inputs.pkl"
+
+
+def checkpoint_key(data_node: DataNode) -> str:
+    """Key of a data node, stable across processes building the same network."""
+    producers = [] if data_node.graph is None else [gear.name for gear in data_node.graph.predecessors(data_node)]  # type: ignore
+    return ".".join([*producers, data_node.name])
+
+
+def _write_atomic(path: Path, write: Callable[[IO[bytes]], Any]) -> None:
+    """Write file through a temporary file, readers never observe a partial write."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class CheckpointStore:
+    """Directory of run checkpoints, every completed data node of a run is persisted on arrival."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Checkpoint store constructor."""
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"CheckpointStore({self._path})"
+
+    @property
+    def path(self) -> Path:
+        """Checkpoint directory."""
+        return self._path
+
+    def runs(self) -> List[str]:
+        """Identifiers of checkpointed runs."""
+        return sorted(manifest.parent.name for manifest in self._path.glob(f"*/{MANIFEST_NAME}"))
+
+    def begin(self, run: "Run") -> None:
+        """Start checkpointing a run, an existing checkpoint of the run is kept."""
+        directory = self._path / run.run_id
+        if (directory / MANIFEST_NAME).exists():
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+        network = run.network
+        manifest = {"run_id": run.run_id, "name": network.name, "version": network.version, "identifier": network.identifier}
+
+        _write_atomic(directory / INPUTS_NAME, lambda f: pickle.dump(run.inputs, f, protocol=4))
+        _write_atomic(directory / MANIFEST_NAME, lambda f: f.write(json.dumps(manifest).encode("utf-8")))
+
+    def record(self, run_id: str, data_node: DataNode) -> None:
+        """Persist value of a computed data node."""
+        if isinstance(data_node, GearInput):
+            return
+
+        directory = self._path / run_id
+        key = checkpoint_key(data_node)
+        value = data_node.value
+
+        # NOTE: Arrays are stored as `.npy` files, so resumed runs memory map them instead of reading them in.
+        dtype = getattr(value, "dtype", None)
+        if hasattr(value, "__array__") and dtype is not None and not dtype.hasobject:
+            import numpy
+
+            filename = f"{key}.npy"
+            _write_atomic(directory / filename, lambda f: numpy.save(f, value, allow_pickle=False))
+        else:
+            filename = f"{key}.pkl"
+            _write_atomic(directory / filename, lambda f: pickle.dump(value, f, protocol=4))
+
+        # NOTE: The journal is appended only after the value file is in place.
+        with self._lock, open(directory / JOURNAL_NAME, "a") as journal:
+            journal.write(json.dumps({"key": key, "file": filename}) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def manifest(self, run_id: str) -> Dict[str, Any]:
+        """Return manifest of a run."""
+        path = self._path / run_id / MANIFEST_NAME
+        if not path.exists():
+            raise KeyError(f"run {run_id} has no checkpoint")
+
+        manifest: Dict[str, Any] = json.loads(path.read_text())
+        return manifest
+
+    def inputs(self, run_id: str) -> Dict[str, Any]:
+        """Return network inputs of a run."""
+        self.manifest(run_id)
+
+        with open(self._path / run_id / INPUTS_NAME, "rb") as f:
+            inputs: Dict[str, Any] = pickle.load(f)  # nosec
+
+        return inputs
+
+    def values(self, run_id: str) -> Dict[str, Any]:
+        """Return persisted values of a run by their checkpoint key."""
+        directory = self._path / run_id
+        files: Dict[str, str] = {}
+
+        journal = directory / JOURNAL_NAME
+        if journal.exists():
+            for line in journal.read_text().splitlines():
+                # NOTE: A crash may leave the last line incomplete, the value is computed again.
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+
+                files[entry["key"]] = entry["file"]
+
+        values: Dict[str, Any] = {}
+        for key, filename in files.items():
+            if filename.endswith(".npy"):
+                import numpy
+
+                values[key] = numpy.load(directory / filename, mmap_mode="r", allow_pickle=False)
+            else:
+                with open(directory / filename, "rb") as f:
+                    values[key] = pickle.load(f)  # nosec
+
+        return values
+
+    def restore(self, run: "Run") -> int:
+        """Fill network of a run with persisted values, returns number of restored data nodes."""
+        values = self.values(run.run_id)
+        network: "NetworkAPI" = run.network
+
+        restored = 0
+        for node in network.graph.nodes:
+            if not isinstance(node, DataNode) or isinstance(node, GearInput):
+                continue
+
+            key = checkpoint_key(node)
+            if key in values:
+                node.set_value(values[key])
+                run.publish(node, persist=False)
+                restored += 1
+
+        return restored
+
+    def complete(self, run_id: str) -> None:
+        """Drop checkpoint of a finished run."""
+        shutil.rmtree(self._path / run_id, ignore_errors=True)
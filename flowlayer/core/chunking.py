@@ -0,0 +1,259 @@
+import math
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+
+import numpy
+from networkx.algorithms.dag import topological_sort
+
+from flowlayer.core.api import NetworkAPI
+from flowlayer.core.engine import call_gear
+from flowlayer.core.hints import DEFAULT_RESOURCES, Chunking, Resources
+from flowlayer.core.nodes import DataNode, GearInput, GearInputOutput, GearNode, MapGear
+
+# NOTE: Parameter sources of a gear in the chunked region, a network input by name or an earlier step by index.
+Step = Tuple[GearNode, Dict[str, Union[str, int]]]
+
+
+def run_chunk(steps: List[Step], inputs: Dict[str, Any], keep: List[int]) -> Dict[int, Any]:
+    """Execute chunked region on a single chunk, only results of steps in `keep` leave the region."""
+    values: List[Any] = []
+    for gear, sources in steps:
+        params = {name: values[source] if isinstance(source, int) else inputs[source] for name, source in sources.items()}
+        values.append(call_gear(gear, params))
+
+    return {i: values[i] for i in keep}
+
+
+def _chunking(gear: Any) -> Optional[Chunking]:
+    """Chunking of a gear node, mapped gears are never chunked."""
+    if not isinstance(gear, GearNode) or isinstance(gear, MapGear):
+        return None
+
+    return gear.chunking
+
+
+def _array_inputs(network: NetworkAPI) -> Dict[str, Tuple[numpy.ndarray, int]]:
+    """Array inputs consumed by chunkable gears with the axis they are chunked along."""
+    arrays: Dict[str, Tuple[numpy.ndarray, int]] = {}
+    for gear in network.graph.nodes:
+        chunking = _chunking(gear)
+        if chunking is None:
+            continue
+
+        node: DataNode
+        for node in network.graph.predecessors(gear):  # type: ignore
+            value = node.value
+            if not isinstance(node, GearInput) or not isinstance(value, numpy.ndarray) or not -value.ndim <= chunking.axis < value.ndim:
+                continue
+
+            axis = chunking.axis % value.ndim
+            if arrays.setdefault(node.name, (value, axis))[1] != axis:
+                raise ValueError(f"input `{node.name}` is chunked along axes {arrays[node.name][1]} and {axis}")
+
+    return arrays
+
+
+class ChunkPlan:
+    """Chunkable region of a network executed chunk by chunk over inputs larger than memory.
+
+    Memory mapped inputs and inputs over `chunk_bytes` lead the split, other array inputs of the same length are split with them.
+    Gears join the region when they are chunkable and consume only network inputs and results of non-reducing gears of the region.
+    Inputs which are not split are passed whole.
+    """
+
+    def __init__(self, network: NetworkAPI, chunk_bytes: int) -> None:
+        """Chunk plan constructor, network inputs must be set."""
+        if chunk_bytes < 1:
+            raise ValueError("chunks must hold at least one byte")
+
+        self._network = network
+        self._split = self._split_inputs(_array_inputs(network), chunk_bytes)
+        self._inputs: Dict[str, Any] = {}
+        self._gears: List[GearNode] = []
+        self._steps: List[Step] = []
+        self._build_region()
+
+        row_bytes = sum(value.nbytes // max(self.length, 1) for value, _ in self._split.values())
+        self._rows = max(1, chunk_bytes // max(row_bytes, 1))
+
+    @staticmethod
+    def _split_inputs(arrays: Dict[str, Tuple[numpy.ndarray, int]], chunk_bytes: int) -> Dict[str, Tuple[numpy.ndarray, int]]:
+        """Select inputs split into chunks."""
+        leading = {name: (value, axis) for name, (value, axis) in arrays.items() if isinstance(value, numpy.memmap) or value.nbytes > chunk_bytes}
+        lengths = {value.shape[axis] for value, axis in leading.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"chunked inputs {sorted(leading)} differ in length along their axes: {sorted(lengths)}")
+
+        if not lengths:
+            return {}
+
+        length = lengths.pop()
+        return {name: (value, axis) for name, (value, axis) in arrays.items() if value.shape[axis] == length}
+
+    def _build_region(self) -> None:
+        """Collect chunked region in topological order, with inputs it receives whole."""
+        graph = self._network.graph
+        index: Dict[GearNode, int] = {}
+
+        for gear in topological_sort(graph):  # type: ignore
+            sources = self._sources(gear, index) if _chunking(gear) is not None else None
+            if sources is None or not any(isinstance(source, int) or source in self._split for source in sources.values()):
+                continue
+
+            index[gear] = len(self._steps)
+            self._gears.append(gear)
+            self._steps.append((gear.detach(), sources))
+
+    def _sources(self, gear: GearNode, index: Dict[GearNode, int]) -> Optional[Dict[str, Union[str, int]]]:
+        """Parameter sources of a gear, `None` when it depends on a gear outside of the region or on a reducing gear."""
+        graph = self._network.graph
+        sources: Dict[str, Union[str, int]] = {}
+
+        node: DataNode
+        for node in graph.predecessors(gear):  # type: ignore
+            if isinstance(node, GearInput):
+                sources[node.name] = node.name
+                if node.name not in self._split:
+                    self._inputs[node.name] = node.value
+                continue
+
+            # NOTE: Results of reducing gears are only known after the fold, their consumers run on the combined value.
+            producers: List[GearNode] = list(graph.predecessors(node))  # type: ignore
+            if len(producers) != 1 or producers[0] not in index or self._chunking(index[producers[0]]).reduce is not None:
+                return None
+
+            sources[node.name] = index[producers[0]]
+
+        return sources
+
+    @property
+    def gears(self) -> List[GearNode]:
+        """Gears of the chunked region in execution order."""
+        return list(self._gears)
+
+    @property
+    def split(self) -> Dict[str, int]:
+        """Inputs split into chunks with their axes."""
+        return {name: axis for name, (_, axis) in self._split.items()}
+
+    @property
+    def length(self) -> int:
+        """Length of split inputs along their axes."""
+        value, axis = next(iter(self._split.values()), (numpy.empty(0), 0))
+        return int(value.shape[axis])
+
+    @property
+    def rows(self) -> int:
+        """Length of a single chunk."""
+        return self._rows
+
+    @property
+    def chunks(self) -> int:
+        """Number of chunks, no chunking is needed below two."""
+        return math.ceil(self.length / self._rows) if self._steps else 0
+
+    @property
+    def reduced(self) -> List[GearNode]:
+        """Gears of the region whose results are used outside of it."""
+        region: Set[GearNode] = set(self._gears)
+        graph = self._network.graph
+
+        def leaves_region(gear: GearNode) -> bool:
+            for node in graph.successors(gear):  # type: ignore
+                if not isinstance(node, GearInputOutput) or any(consumer not in region for consumer in graph.successors(node)):  # type: ignore
+                    return True
+
+            return False
+
+        return [gear for gear in self._gears if leaves_region(gear)]
+
+    @property
+    def resources(self) -> Resources:
+        """Resources claimed by a chunk, gears of the region run one after another within it."""
+        if not self._gears:
+            return DEFAULT_RESOURCES
+
+        claims = [gear.resources for gear in self._gears]
+        return Resources(
+            cpus=max(claim.cpus for claim in claims),
+            memory=max(claim.memory for claim in claims),
+            exclusive=any(claim.exclusive for claim in claims),
+        )
+
+    @property
+    def known(self) -> bool:
+        """Check if all results leaving the region are already set, such as restored from a checkpoint."""
+        graph = self._network.graph
+        return all(not node.is_empty for gear in self.reduced for node in graph.successors(gear))
+
+    def chunk_inputs(self, chunk: int) -> Dict[str, Any]:
+        """Inputs of the region for a chunk, split inputs are views so memory mapped data is read only when used."""
+        start = chunk * self._rows
+        inputs = dict(self._inputs)
+
+        for name, (value, axis) in self._split.items():
+            inputs[name] = value[(slice(None),) * axis + (slice(start, start + self._rows),)]
+
+        return inputs
+
+    def execute(self, executor: Optional[Executor] = None, window: int = 1, check: Callable[[], None] = lambda: None) -> Dict[GearNode, Any]:
+        """Compute results leaving the region, at most `window` chunks are in flight on `executor`, without it chunks run in process.
+
+        Partial results are folded in chunk order as soon as possible, so only results concatenated by default grow with the input.
+        """
+        reduced = self.reduced
+        keep = [self._gears.index(gear) for gear in reduced]
+        partial: Dict[int, List[Any]] = {i: [] for i in keep}
+        pending: Deque["Future[Dict[int, Any]]"] = deque()
+
+        try:
+            for chunk in range(self.chunks):
+                check()
+                if executor is None:
+                    self._fold(partial, run_chunk(self._steps, self.chunk_inputs(chunk), keep))
+                    continue
+
+                pending.append(executor.submit(run_chunk, self._steps, self.chunk_inputs(chunk), keep))
+                if len(pending) >= window:
+                    self._fold(partial, pending.popleft().result())
+
+            while pending:
+                self._fold(partial, pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return {gear: self._combine(i, partial[i]) for gear, i in zip(reduced, keep)}
+
+    def _fold(self, partial: Dict[int, List[Any]], results: Dict[int, Any]) -> None:
+        """Combine results of a chunk with results of previous chunks."""
+        for i, value in results.items():
+            reduce = self._chunking(i).reduce
+            if reduce is None or not partial[i]:
+                partial[i].append(value)
+            else:
+                partial[i][0] = reduce(partial[i][0], value)
+
+    def _chunking(self, i: int) -> Chunking:
+        """Chunking of a step."""
+        chunking = self._gears[i].chunking
+        assert chunking is not None  # nosec
+        return chunking
+
+    def _combine(self, i: int, parts: List[Any]) -> Any:
+        """Final result of a step from its partial results."""
+        chunking = self._chunking(i)
+        if chunking.reduce is not None:
+            return parts[0]
+
+        return numpy.concatenate(parts, axis=chunking.axis)
+
+
+def plan_chunks(network: NetworkAPI, chunk_bytes: int) -> Optional[ChunkPlan]:
+    """Plan chunked execution of a network with inputs set.
+
+    Returns `None` when no chunkable gear consumes inputs over `chunk_bytes` or results of the region are already known.
+    """
+    plan = ChunkPlan(network, chunk_bytes)
+    return plan if plan.chunks > 1 and not plan.known else None
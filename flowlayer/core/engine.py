@@ -1,36 +1,456 @@
-from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from networkx.algorithms.dag import topological_sort
 
 from flowlayer.core.api import EngineAPI, NetworkAPI
-from flowlayer.core.nodes import DataNode, GearNode, InvalidGraph, OutputNode
+from flowlayer.core.hints import Resources
+from flowlayer.core.metrics import MetricsRegistry
+from flowlayer.core.nodes import DataNode, GearException, GearNode, GearOutput, InvalidGraph, MapGear, OutputNode
+from flowlayer.core.profiling import MemoryProfile, profiled
 
+if TYPE_CHECKING:
+    from flowlayer.core.checkpoint import CheckpointStore
+    from flowlayer.core.registry import NetworkRegistry
 
-class SerialEngine(EngineAPI):
-    """Serial engine executor."""
 
-    def __init__(self) -> None:
-        """Serial engine constructor."""
-        self._network: Optional[NetworkAPI] = None
+def call_gear(gear: GearNode, params: Dict[str, Any]) -> Any:
+    """Execute a detached gear with given parameters, failed attempts are retried by the gear policy."""
+    policy = gear.retry
+    attempt = 1
 
-    def _submit_next(self) -> bool:
-        """Submit next batch of jobs to the pool."""
-        if self._network is None:
-            raise ValueError
+    while True:
+        try:
+            return gear.call(**params)
+        except GearException as e:
+            if not policy.should_retry(e.raised_exception, attempt):
+                e.attempts = attempt
+                raise
+
+            time.sleep(policy.delay(attempt))
+            attempt += 1
+
+
+def call_mapped(gear: GearNode, params: Dict[str, Any]) -> Any:
+    """Execute a gear in the calling process, a mapped gear is executed for every element in order."""
+    if isinstance(gear, MapGear):
+        return [call_gear(gear, element) for element in gear.expand(params)]
+
+    return call_gear(gear, params)
+
+
+def map_on_workers(gear: MapGear, params: Dict[str, Any]) -> List[Any]:
+    """Fan a mapped gear out from a dask task, the task leaves the worker thread pool while elements run."""
+    from dask.distributed import worker_client  # type: ignore[import]
+
+    elements = gear.expand(params)
+    with worker_client() as client:
+        futures = client.map(call_gear, [gear] * len(elements), elements, pure=False)
+        results: List[Any] = client.gather(futures)
+
+    return results
+
+
+class RunCancelled(Exception):
+    """Run was cancelled before all outputs were computed."""
+
+    def __init__(self, run_id: str) -> None:
+        """Run cancelled exception constructor."""
+        self.run_id = run_id
+
+        super().__init__(f"run {run_id} cancelled")
+
+
+class Run:
+    """Single invocation of a network on an engine."""
+
+    def __init__(
+        self,
+        network: NetworkAPI,
+        inputs: Dict[str, Any],
+        run_id: Optional[str] = None,
+        checkpoints: Optional["CheckpointStore"] = None,
+    ) -> None:
+        """Run constructor, `network` is owned by the run until it finishes."""
+        self._network = network
+        self._inputs = inputs
+        self._run_id = run_id or uuid.uuid4().hex
+        self._checkpoints = checkpoints
+
+        self._cancelled = threading.Event()
+        self._outputs: Dict[str, Any] = {}
+        self._published = threading.Condition()
+        self._profile: Optional[MemoryProfile] = None
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"Run({self._network}, {self._run_id})"
+
+    @property
+    def run_id(self) -> str:
+        """Unique identifier of the run."""
+        return self._run_id
+
+    @property
+    def network(self) -> NetworkAPI:
+        """Network computed by the run."""
+        return self._network
+
+    @property
+    def inputs(self) -> Dict[str, Any]:
+        """Network inputs of the run."""
+        return self._inputs
+
+    @property
+    def outputs(self) -> Dict[str, Any]:
+        """Network results computed so far."""
+        with self._published:
+            return dict(self._outputs)
+
+    @property
+    def cancelled(self) -> bool:
+        """Check if cancellation was requested."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation, engines stop before starting further gears."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise if the run was cancelled."""
+        if self._cancelled.is_set():
+            raise RunCancelled(self._run_id)
+
+    @property
+    def checkpoints(self) -> Optional["CheckpointStore"]:
+        """Store persisting computed data nodes of the run."""
+        return self._checkpoints
+
+    @property
+    def profile(self) -> Optional[MemoryProfile]:
+        """Memory profile of the run, `None` unless profiled."""
+        return self._profile
+
+    def start_profiling(self) -> MemoryProfile:
+        """Record memory used by gears executed for the run."""
+        if self._profile is None:
+            self._profile = MemoryProfile(self._run_id, self._network.name)
+
+        return self._profile
+
+    def publish(self, data_node: DataNode, persist: bool = True) -> None:
+        """Record a computed data node and wake up readers of network results."""
+        if persist and self._checkpoints is not None:
+            self._checkpoints.record(self._run_id, data_node)
+
+        if not isinstance(data_node, GearOutput):
+            return
+
+        with self._published:
+            self._outputs[data_node.name] = data_node.value
+            self._published.notify_all()
+
+    def publish_gear(self, gear: GearNode, value: Any) -> None:
+        """Set and record result of a gear on all its empty outputs, a gear shared by several consumers runs once."""
+        data_node: DataNode
+        for data_node in self._network.graph.successors(gear):  # type: ignore
+            if data_node.is_empty:
+                data_node.set_value(value)
+                self.publish(data_node)
+
+    def wait_output(self, name: str, timeout: Optional[float] = None) -> Any:
+        """Block until a network result is computed."""
+        with self._published:
+            if not self._published.wait_for(lambda: name in self._outputs, timeout=timeout):
+                raise TimeoutError(f"output `{name}` of run {self._run_id} not ready")
+
+            return self._outputs[name]
+
+
+class RunHandle:
+    """Future-like handle of a run executing in the background."""
+
+    def __init__(self, run: Run, target: Callable[[Run], NetworkAPI]) -> None:
+        """Run handle constructor, starts the run right away."""
+        self._run = run
+        self._future: "Future[NetworkAPI]" = Future()
+
+        self._thread = threading.Thread(target=self._work, args=(target,), name=f"flowlayer-run-{run.run_id}", daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"RunHandle({self._run.run_id})"
+
+    def _work(self, target: Callable[[Run], NetworkAPI]) -> None:
+        """Execute run and resolve the future."""
+        if not self._future.set_running_or_notify_cancel():
+            return
+
+        try:
+            self._future.set_result(target(self._run))
+        except BaseException as e:
+            self._future.set_exception(e)
+
+    @property
+    def profile(self) -> Optional[MemoryProfile]:
+        """Memory profile of the run, `None` unless the engine profiles runs."""
+        return self._run.profile
+
+    @property
+    def run_id(self) -> str:
+        """Identifier of the run."""
+        return self._run.run_id
+
+    @property
+    def outputs(self) -> Dict[str, Any]:
+        """Network results computed so far."""
+        return self._run.outputs
+
+    def output(self, name: str, timeout: Optional[float] = None) -> Any:
+        """Wait for a single network result, available before the whole run completes."""
+        return self._run.wait_output(name, timeout=timeout)
+
+    def done(self) -> bool:
+        """Check if run finished, failed or was cancelled."""
+        return self._future.done()
+
+    def cancel(self) -> bool:
+        """Request cancellation, returns `False` when the run already finished."""
+        if self._future.done():
+            return False
+
+        self._run.cancel()
+        return True
+
+    def cancelled(self) -> bool:
+        """Check if run stopped because of cancellation."""
+        return self._future.done() and isinstance(self._future.exception(), RunCancelled)
+
+    def result(self, timeout: Optional[float] = None) -> NetworkAPI:
+        """Wait for the computed network, raises `TimeoutError` when `timeout` seconds pass first."""
+        return self._future.result(timeout=timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Wait for the run and return its exception."""
+        return self._future.exception(timeout=timeout)
+
+    def add_done_callback(self, callback: Callable[["RunHandle"], Any]) -> None:
+        """Call `callback` with the handle once the run finishes."""
+        self._future.add_done_callback(lambda _: callback(self))
+
+
+# NOTE: Number of memory profiles of finished runs kept by an engine.
+PROFILE_HISTORY = 32
+
+
+class RunMixin(EngineAPI):
+    """Track runs in flight, state of a run never lives on the engine so runs may overlap."""
+
+    def __init__(self, metrics: Optional[MetricsRegistry] = None, profile: bool = False, chunk_bytes: Optional[int] = None) -> None:
+        """Run mixin constructor, engines may share `metrics`, `profile` records memory of every run.
+
+        Chunkable gears consuming memory mapped inputs or inputs over `chunk_bytes` are executed chunk by chunk, no chunking happens without it.
+        """
+        if chunk_bytes is not None and chunk_bytes < 1:
+            raise ValueError("chunks must hold at least one byte")
+
+        self._chunk_bytes = chunk_bytes
+        self._runs: Dict[str, Run] = {}
+        self._runs_lock = threading.Lock()
+        self._metrics = metrics if metrics is not None else MetricsRegistry()
+        self._profile = profile
+        self._profiles: Deque[MemoryProfile] = deque(maxlen=PROFILE_HISTORY)
+
+    @property
+    def profiles(self) -> List[MemoryProfile]:
+        """Memory profiles of recently finished runs, oldest first."""
+        with self._runs_lock:
+            return list(self._profiles)
 
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Metrics recorded by the engine."""
+        return self._metrics
+
+    @property
+    def runs(self) -> List[str]:
+        """Identifiers of runs in flight."""
+        with self._runs_lock:
+            return list(self._runs)
+
+    def run(self, network: NetworkAPI, **kwargs: Any) -> NetworkAPI:
+        """Runs the computational network and returns the result object."""
+        if network is None:
+            raise ValueError("cannot execute empty network")
+
+        return self.execute(Run(network, kwargs))
+
+    def submit(self, network: NetworkAPI, **kwargs: Any) -> RunHandle:
+        """Start the computational network in the background and return its handle."""
+        if network is None:
+            raise ValueError("cannot execute empty network")
+
+        return RunHandle(Run(network, kwargs), self.execute)
+
+    def execute(self, run: Run) -> NetworkAPI:
+        """Execute a run, safe to call from many threads at once."""
+        with self._runs_lock:
+            if run.run_id in self._runs:
+                raise ValueError(f"run {run.run_id} already in flight")
+
+            self._runs[run.run_id] = run
+            self._metrics.add("flowlayer_runs_active", 1)
+
+        name = run.network.name
+        start = time.monotonic()
+        status = "failed"
+        if self._profile:
+            run.start_profiling()
+
+        try:
+            run.network.set_input(run.inputs)
+            if self._chunk_bytes is not None:
+                self._execute_chunked(run, self._chunk_bytes)
+
+            self._execute(run)
+            status = "completed"
+        except RunCancelled:
+            status = "cancelled"
+            raise
+        finally:
+            with self._runs_lock:
+                del self._runs[run.run_id]
+                self._metrics.add("flowlayer_runs_active", -1)
+                if run.profile is not None:
+                    self._profiles.append(run.profile)
+
+            self._metrics.inc("flowlayer_runs_total", network=name, status=status)
+            self._metrics.observe("flowlayer_run_duration_seconds", time.monotonic() - start, network=name)
+
+        return run.network
+
+    def _observe_gear(self, run: Run, gear: GearNode, seconds: float) -> None:
+        """Record latency of a gear."""
+        self._metrics.observe("flowlayer_gear_duration_seconds", seconds, network=run.network.name, gear=gear.name)
+
+    def _gear_failed(self, run: Run, gear: GearNode) -> None:
+        """Record failure of a gear."""
+        self._metrics.inc("flowlayer_gear_failures_total", network=run.network.name, gear=gear.name)
+
+    def _chunk_executor(self, resources: Resources) -> Tuple[Optional[Executor], int]:
+        """Executor of chunks claiming `resources` each, with the number of chunks kept in flight, chunks run in process without it."""
+        return None, 1
+
+    def _execute_chunked(self, run: Run, chunk_bytes: int) -> None:
+        """Compute the chunkable region of a run chunk by chunk, the rest of the network consumes its combined results."""
+        from flowlayer.core.chunking import plan_chunks
+
+        plan = plan_chunks(run.network, chunk_bytes)
+        if plan is None:
+            return
+
+        executor, window = self._chunk_executor(plan.resources)
+        try:
+            results = plan.execute(executor, window, check=run.check)
+        except GearException as e:
+            self._gear_failed(run, e.gear)
+            raise
+
+        for gear, value in results.items():
+            run.publish_gear(gear, value)
+
+    def _execute(self, run: Run) -> None:
+        """Compute all outputs of a run."""
+        raise NotImplementedError
+
+
+class RegistryMixin(EngineAPI):
+    """Register networks of an engine in a network registry."""
+
+    def _bind_registry(self, registry: Optional["NetworkRegistry"]) -> None:
+        """Attach registry, networks it loads are executed by this engine."""
+        self._registry = registry
+        if registry is not None:
+            registry.bind(self)
+
+    @property
+    def registry(self) -> Optional["NetworkRegistry"]:
+        """Registry holding networks of the engine."""
+        return self._registry
+
+    def register(self, network: NetworkAPI) -> None:
+        """Publish network into the registry of the engine."""
+        if self._registry is None:
+            raise ValueError("engine has no network registry")
+
+        self._registry.publish(network)  # type: ignore
+
+    def get_networks(self) -> List[NetworkAPI]:
+        """Return latest version of every registered network."""
+        if self._registry is None:
+            raise ValueError("engine has no network registry")
+
+        return list(self._registry.networks())
+
+
+class SerialEngine(RunMixin, RegistryMixin):
+    """Serial engine executor."""
+
+    def __init__(
+        self,
+        registry: Optional["NetworkRegistry"] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        profile: bool = False,
+        chunk_bytes: Optional[int] = None,
+    ) -> None:
+        """Serial engine constructor, chunks of `chunk_bytes` are computed one after another."""
+        super().__init__(metrics, profile, chunk_bytes)
+        self._bind_registry(registry)
+
+    def _call(self, run: Run, gear: GearNode) -> Any:
+        """Execute a gear in process, memory is measured for profiled runs."""
+        if run.profile is None:
+            return call_mapped(gear, gear.input_values)
+
+        result, measurement = profiled(call_mapped, gear, gear.input_values)
+        run.profile.record(gear.name, measurement, result)
+        return result
+
+    def _submit_next(self, run: Run) -> bool:
+        """Submit next batch of jobs to the pool."""
         computed: Dict[GearNode, Any] = {}
+        network = run.network
 
         data_node: OutputNode
-        for data_node in self._network.compute_next():
-            predeccesors: List[GearNode] = list(self._network.graph.predecessors(data_node))  # type: ignore
+        for data_node in network.compute_next():
+            predeccesors: List[GearNode] = list(network.graph.predecessors(data_node))  # type: ignore
             if len(predeccesors) != 1:
                 raise InvalidGraph(f"found a data node produced by multiple gears: {predeccesors}", gears=predeccesors)
 
             gear = predeccesors[0]
-            result = gear(gear.input_values)
+            if gear in computed:
+                continue
+
+            run.check()
+
+            start = time.monotonic()
+            try:
+                result = self._call(run, gear)
+            except GearException:
+                self._gear_failed(run, gear)
+                raise
+
+            self._observe_gear(run, gear, time.monotonic() - start)
 
             computed[gear] = result
-            data_node.set_value(result)
+            run.publish_gear(gear, result)
 
         return bool(computed)
 
@@ -46,86 +466,469 @@ class SerialEngine(EngineAPI):
         """Check if engine is ready for computation."""
         return True
 
-    def run(self, network: NetworkAPI, **kwargs: Any) -> NetworkAPI:
-        """Runs the computational network and returns the result object."""
-        if network is None:
-            raise ValueError("cannot execute empty network")
+    def _execute(self, run: Run) -> None:
+        """Compute all outputs of a run."""
+        while self._submit_next(run):
+            pass
 
-        self._network = network
-        self._network.set_input(kwargs)
 
-        while self._submit_next():
-            pass
+def total_memory() -> Optional[int]:
+    """Physical memory of the machine in bytes, if it can be determined."""
+    try:
+        return int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"))
+    except (AttributeError, ValueError, OSError):
+        return None
 
-        return self._network
 
+class ResourceBudget:
+    """Track cpus and memory claimed by gears running on an engine."""
 
-class PoolEngine(EngineAPI):
-    """Pool engine executor."""
+    def __init__(self, cpus: int, memory: Optional[int] = None) -> None:
+        """Resource budget constructor, `memory` of `None` is not limited."""
+        self._cpus = cpus
+        self._memory = memory
+
+        self._used_cpus = 0
+        self._used_memory = 0
+        self._exclusive = False
+
+    @property
+    def cpus(self) -> int:
+        """Cpus of the budget."""
+        return self._cpus
+
+    @property
+    def used_cpus(self) -> int:
+        """Cpus claimed by running gears."""
+        return self._used_cpus
+
+    @property
+    def used_memory(self) -> int:
+        """Memory claimed by running gears."""
+        return self._used_memory
+
+    @property
+    def idle(self) -> bool:
+        """Check if no gear holds resources."""
+        return self._used_cpus == 0
+
+    def fits(self, resources: Resources) -> bool:
+        """Check if gear can start without oversubscribing the budget."""
+        if self._exclusive:
+            return False
+
+        # NOTE: An idle budget admits any gear, so gears larger than the machine still run alone.
+        if self.idle:
+            return True
+
+        if resources.exclusive:
+            return False
+
+        if self._used_cpus + resources.cpus > self._cpus:
+            return False
+
+        return self._memory is None or self._used_memory + resources.memory <= self._memory
+
+    def acquire(self, resources: Resources) -> None:
+        """Claim resources of a started gear."""
+        self._used_cpus += resources.cpus
+        self._used_memory += resources.memory
+        self._exclusive = self._exclusive or resources.exclusive
+
+    def release(self, resources: Resources) -> None:
+        """Return resources of a finished gear."""
+        self._used_cpus -= resources.cpus
+        self._used_memory -= resources.memory
+        if resources.exclusive:
+            self._exclusive = False
+
+    def slots(self, resources: Resources, limit: int) -> int:
+        """Number of executions claiming `resources` the idle budget holds at once, at most `limit` and at least one."""
+        if resources.exclusive:
+            return 1
+
+        slots = min(limit, self._cpus // resources.cpus)
+        if self._memory is not None and resources.memory:
+            slots = min(slots, self._memory // resources.memory)
+
+        return max(slots, 1)
+
+
+class DurationHistory:
+    """Recent execution times of gears, shared by all runs of an engine."""
+
+    def __init__(self, size: int = 100, min_samples: int = 5) -> None:
+        """Duration history constructor, `size` durations are kept per gear."""
+        self._size = size
+        self._min_samples = min_samples
+        self._durations: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record execution time of a gear."""
+        with self._lock:
+            self._durations.setdefault(name, deque(maxlen=self._size)).append(seconds)
+
+    def percentile(self, name: str, q: float) -> Optional[float]:
+        """Return `q`-th percentile of gear durations, `None` until enough of them are recorded."""
+        with self._lock:
+            durations = sorted(self._durations.get(name, ()))
+
+        if len(durations) < self._min_samples:
+            return None
+
+        # NOTE: Nearest rank, so the threshold is always an observed duration.
+        rank = max(int(-(-q * len(durations) // 100)), 1)
+        return durations[rank - 1]
+
+
+class Gather:
+    """Collect results of a gear executed on a pool, a mapped gear is executed once per element."""
+
+    def __init__(self, gear: GearNode, params: Dict[str, Any]) -> None:
+        """Gather constructor."""
+        self._gear = gear
+        self._params = gear.expand(params) if isinstance(gear, MapGear) else [params]
+        self._values: List[Any] = [None] * len(self._params)
+        self._remaining = len(self._params)
+
+    def __len__(self) -> int:
+        """Number of gear executions."""
+        return len(self._params)
+
+    @property
+    def gear(self) -> GearNode:
+        """Executed gear."""
+        return self._gear
+
+    @property
+    def done(self) -> bool:
+        """Check if all executions finished."""
+        return self._remaining == 0
+
+    @property
+    def value(self) -> Any:
+        """Gear result, results of a mapped gear are listed in order of elements."""
+        return self._values if isinstance(self._gear, MapGear) else self._values[0]
+
+    def params(self, index: int) -> Dict[str, Any]:
+        """Parameters of an execution."""
+        return self._params[index]
+
+    def set(self, index: int, value: Any) -> bool:
+        """Store result of an execution, returns `True` once all of them finished."""
+        self._values[index] = value
+        self._remaining -= 1
+        return self.done
+
+
+# NOTE: Single execution on a pool, index of the element for mapped gears.
+Task = Tuple[Gather, int]
+
+
+class PoolEngine(RunMixin, RegistryMixin):
+    """Pool engine executor, concurrent runs share a single worker pool and resource budget."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        memory_limit: Optional[int] = None,
+        registry: Optional["NetworkRegistry"] = None,
+        speculate: Optional[float] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        profile: bool = False,
+        chunk_bytes: Optional[int] = None,
+    ) -> None:
+        """Pool engine constructor, `memory_limit` defaults to physical memory of the machine.
+
+        Pure gears running longer than `speculate`-th percentile of their past durations are duplicated, the first result wins.
+        Profiled runs measure memory of gears inside the workers.
+        Chunks of `chunk_bytes` run on all workers, with a chunk per worker in flight.
+        """
+        super().__init__(metrics, profile, chunk_bytes)
+
+        if speculate is not None and not 0 < speculate <= 100:
+            raise ValueError("speculation percentile must be within (0, 100]")
 
-    def __init__(self, max_workers: int = 4) -> None:
-        """Pool engine constructor."""
-        self._network: Optional[NetworkAPI] = None
         self._executor: Optional[ProcessPoolExecutor] = None
         self._max_workers = max_workers
+        self._budget = ResourceBudget(max_workers, memory_limit if memory_limit is not None else total_memory())
+        self._capacity = threading.Condition()
+        self._speculate = speculate
+        self._durations = DurationHistory()
+        self._bind_registry(registry)
+        # NOTE: Engines may share a registry, pool gauges are changed by deltas so they add up across engines.
+        self._reported = (0, 0)
+        self._metrics.add("flowlayer_pool_cpus", max_workers)
+
+    @property
+    def durations(self) -> DurationHistory:
+        """Execution times of gears run by the engine."""
+        return self._durations
+
+    def _report_budget(self) -> None:
+        """Record change in utilization of the budget, called with the capacity lock held."""
+        cpus, memory = self._reported
+        self._reported = (self._budget.used_cpus, self._budget.used_memory)
+        self._metrics.add("flowlayer_pool_cpus_used", self._budget.used_cpus - cpus)
+        self._metrics.add("flowlayer_pool_memory_used_bytes", self._budget.used_memory - memory)
+
+    def _submit(self, run: Run, task: Task) -> "Future[Any]":
+        """Submit a single execution to the pool."""
+        if self._executor is None:
+            raise ValueError("engine not ready")
 
-    def _submit_next(self) -> Dict[str, Any]:
-        """Submit next batch of jobs to the pool."""
-        if self._network is None:
-            raise ValueError("computational graph not found")
+        gather, index = task
+        if run.profile is None:
+            return self._executor.submit(call_gear, gather.gear.detach(), gather.params(index))
+
+        return self._executor.submit(profiled, call_gear, gather.gear.detach(), gather.params(index))
 
+    def _start_fitting(self, run: Run, pending: List[Task], running: Dict["Future[Any]", Task]) -> None:
+        """Submit pending gears which fit into the budget, waits while other runs hold all of it."""
         if self._executor is None:
             raise ValueError("engine not ready")
 
-        results: Dict[str, Any] = {}
-        futures: Dict[Future[Any], Tuple[DataNode, GearNode]] = {}
+        run.check()
+        queued = len(pending)
+
+        with self._capacity:
+            for task in list(pending):
+                gather, index = task
+                if not self._budget.fits(gather.gear.resources):
+                    continue
+
+                self._budget.acquire(gather.gear.resources)
+                running[self._submit(run, task)] = task
+                pending.remove(task)
+
+            self._report_budget()
+            self._metrics.add("flowlayer_queued_gears", len(pending) - queued, network=run.network.name)
+
+            # NOTE: Nothing of this run is running, so other runs hold the budget and release it eventually.
+            if pending and not running:
+                self._capacity.wait()
+
+    def _finish(self, futures: Iterable["Future[Any]"], running: Dict["Future[Any]", Task]) -> List[Task]:
+        """Release resources of finished gears and wake up runs waiting for them."""
+        finished = [running.pop(future) for future in futures]
+
+        with self._capacity:
+            for gather, _ in finished:
+                self._budget.release(gather.gear.resources)
+
+            self._report_budget()
+            self._capacity.notify_all()
+
+        return finished
+
+    def _stragglers(
+        self, running: Dict["Future[Any]", Task], started: Dict["Future[Any]", float], speculated: Set[Task]
+    ) -> Tuple[List["Future[Any]"], Optional[float]]:
+        """Return pure gears running past their duration percentile and seconds until the next one does."""
+        stragglers: List["Future[Any]"] = []
+        timeout: Optional[float] = None
+        if self._speculate is None:
+            return stragglers, timeout
+
+        now = time.monotonic()
+        for future, task in running.items():
+            gear_node = task[0].gear
+            if task in speculated or not gear_node.pure:
+                continue
+
+            threshold = self._durations.percentile(gear_node.name, self._speculate)
+            if threshold is None:
+                continue
+
+            remaining = started[future] + threshold - now
+            if remaining <= 0:
+                stragglers.append(future)
+            else:
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+        return stragglers, timeout
+
+    def _duplicate(
+        self,
+        run: Run,
+        stragglers: List["Future[Any]"],
+        running: Dict["Future[Any]", Task],
+        started: Dict["Future[Any]", float],
+        speculated: Set[Task],
+    ) -> None:
+        """Launch a second execution of straggling gears which fit into the budget."""
+        with self._capacity:
+            for future in stragglers:
+                task = running[future]
+                gather = task[0]
+                if not self._budget.fits(gather.gear.resources):
+                    continue
+
+                self._budget.acquire(gather.gear.resources)
+                duplicate = self._submit(run, task)
+                running[duplicate] = task
+                started[duplicate] = time.monotonic()
+                speculated.add(task)
+
+            self._report_budget()
+
+    def _abandon(self, future: "Future[Any]", running: Dict["Future[Any]", Task]) -> None:
+        """Drop a duplicate execution whose twin finished first."""
+        gather, _ = running.pop(future)
+        resources = gather.gear.resources
+
+        def release(_: "Future[Any]") -> None:
+            with self._capacity:
+                self._budget.release(resources)
+                self._report_budget()
+                self._capacity.notify_all()
+
+        # NOTE: A started worker cannot be interrupted, its resources return to the budget once it finishes.
+        future.cancel()
+        future.add_done_callback(release)
+
+    def _collect(
+        self, run: Run, done: Iterable["Future[Any]"], running: Dict["Future[Any]", Task], started: Dict["Future[Any]", float], results: Dict[str, Any]
+    ) -> None:
+        """Publish values of finished gears, duplicates still running are abandoned."""
+        for future in done:
+            # NOTE: Both executions of a gear may finish together, the other one is already abandoned.
+            if future not in running:
+                continue
+
+            [task] = self._finish([future], running)
+            gather, index = task
+            try:
+                value = future.result()
+            except GearException:
+                self._gear_failed(run, gather.gear)
+                raise
+
+            if run.profile is not None:
+                value, measurement = value
+                run.profile.record(gather.gear.name, measurement, value)
+
+            elapsed = time.monotonic() - started.pop(future)
+            self._durations.record(gather.gear.name, elapsed)
+            self._observe_gear(run, gather.gear, elapsed)
+
+            for twin in [twin for twin, other in running.items() if other is task]:
+                started.pop(twin, None)
+                self._abandon(twin, running)
+
+            if gather.set(index, value):
+                run.publish_gear(gather.gear, gather.value)
+                results[gather.gear.name] = gather.value
+
+    def _pending(self, run: Run, results: Dict[str, Any]) -> List[Task]:
+        """Return executions of gears ready to run, heaviest first."""
+        network = run.network
+        pending: List[Task] = []
+        gears: Set[GearNode] = set()
 
         data_node: DataNode
-        gear_node: GearNode
-        for data_node in self._network.compute_next():
-            predeccesors: List[GearNode] = list(self._network.graph.predecessors(data_node))  # type: ignore
+        for data_node in network.compute_next():
+            predeccesors: List[GearNode] = list(network.graph.predecessors(data_node))  # type: ignore
             if len(predeccesors) != 1:
                 raise InvalidGraph(f"found a data node produced by multiple gears: {predeccesors}", gears=predeccesors)
 
+            # NOTE: Outputs of a shared gear are ready together, the gear is executed once for all of them.
             gear_node = predeccesors[0]
-            future = self._executor.submit(gear_node, kwargs=gear_node.input_values)
-            futures[future] = (data_node, gear_node)
+            if gear_node in gears:
+                continue
+
+            gears.add(gear_node)
+            gather = Gather(gear_node, gear_node.input_values)
+            pending.extend((gather, index) for index in range(len(gather)))
+
+            # NOTE: A gear mapped over an empty collection has nothing to execute.
+            if gather.done:
+                run.publish_gear(gear_node, gather.value)
+                results[gear_node.name] = gather.value
 
-        for future in as_completed(futures):
-            result_tpl: Tuple[DataNode, GearNode] = futures[future]
-            data_node, gear_node = result_tpl
-            value = future.result()
+        # NOTE: Start the heaviest gears first, lighter ones fill the remaining capacity.
+        pending.sort(key=lambda task: (task[0].gear.resources.exclusive, task[0].gear.resources.memory, task[0].gear.resources.cpus), reverse=True)
+        return pending
 
-            data_node.set_value(value)
-            results[gear_node.name] = value
+    def _submit_next(self, run: Run) -> Dict[str, Any]:
+        """Submit next batch of jobs to the pool, packing gears by their declared resources."""
+        if self._executor is None:
+            raise ValueError("engine not ready")
+
+        results: Dict[str, Any] = {}
+        pending = self._pending(run, results)
+        self._metrics.add("flowlayer_queued_gears", len(pending), network=run.network.name)
+        running: Dict["Future[Any]", Task] = {}
+        started: Dict["Future[Any]", float] = {}
+        speculated: Set[Task] = set()
+
+        try:
+            while pending or running:
+                self._start_fitting(run, pending, running)
+                now = time.monotonic()
+                for future in running:
+                    started.setdefault(future, now)
+
+                if not running:
+                    continue
+
+                stragglers, timeout = self._stragglers(running, started, speculated)
+                if stragglers:
+                    self._duplicate(run, stragglers, running, started, speculated)
+
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                self._collect(run, done, running, started, results)
+        finally:
+            self._metrics.add("flowlayer_queued_gears", -len(pending), network=run.network.name)
+
+            # NOTE: A failed gear must not leak resources of its siblings, the budget is shared with other runs.
+            if running:
+                if run.cancelled:
+                    for future in running:
+                        future.cancel()
+
+                wait(running)
+                self._finish(list(running), running)
 
         return results
 
+    def _chunk_executor(self, resources: Resources) -> Tuple[Optional[Executor], int]:
+        """Workers of the pool execute chunks, each chunk claims `resources` from the budget shared with other runs."""
+        if self._executor is None:
+            raise ValueError("engine not running")
+
+        return BudgetedExecutor(self, resources), self._budget.slots(resources, self._max_workers)
+
+    def _claim(self, resources: Resources) -> None:
+        """Block until `resources` fit into the budget and claim them."""
+        with self._capacity:
+            self._capacity.wait_for(lambda: self._budget.fits(resources))
+            self._budget.acquire(resources)
+            self._report_budget()
+
+    def _release(self, resources: Resources) -> None:
+        """Return claimed `resources` and wake up runs waiting for them."""
+        with self._capacity:
+            self._budget.release(resources)
+            self._report_budget()
+            self._capacity.notify_all()
+
     def is_ready(self) -> bool:
         """Check if engine is ready for computation."""
         return self._executor is not None
 
     def setup(self) -> None:
         """Prepare the given computation for executor."""
-        self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        with self._capacity:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
 
-    def run(self, network: NetworkAPI, **kwargs: Any) -> NetworkAPI:
-        """Runs the computational network and returns the result object."""
-        if network is None:
-            raise ValueError("cannot execute empty network")
-
-        self._network = network
-        self._network.set_input(kwargs)
-
-        while self._submit_next():
+    def _execute(self, run: Run) -> None:
+        """Compute all outputs of a run."""
+        while self._submit_next(run):
             pass
 
-        return self._network
-
-    def register(self) -> None:
-        """Registers the computational network with external executor."""
-        raise NotImplementedError
-
     def teardown(self) -> None:
         """Cleanup phase."""
         if self._executor is None:
@@ -134,76 +937,136 @@ class PoolEngine(EngineAPI):
         self._executor.shutdown(wait=True)
 
 
-class DaskEngine(EngineAPI):
+class BudgetedExecutor(Executor):
+    """Submit calls to the workers of a pool engine, every call claims resources from the engine budget while it runs."""
+
+    def __init__(self, engine: PoolEngine, resources: Resources) -> None:
+        """Budgeted executor constructor."""
+        self._engine = engine
+        self._resources = resources
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> "Future[Any]":  # type: ignore[override]
+        """Wait for the budget and submit a call."""
+        if self._engine._executor is None:
+            raise ValueError("engine not running")
+
+        self._engine._claim(self._resources)
+        try:
+            future = self._engine._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._engine._release(self._resources)
+            raise
+
+        future.add_done_callback(lambda _: self._engine._release(self._resources))
+        return future
+
+
+class DaskEngine(RunMixin, RegistryMixin):
     """Dask engine executor."""
 
-    def __init__(self, address: str, requirements: List[str], egg_path: Path, **config: Any) -> None:
+    def __init__(
+        self,
+        address: str,
+        requirements: List[str],
+        egg_path: Optional[Path],
+        registry: Optional["NetworkRegistry"] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        **config: Any,
+    ) -> None:
         """Dask engine constructor."""
         from dask.distributed import Client, as_completed  # type: ignore[import]
 
+        super().__init__(metrics)
+
         self.as_completed = as_completed
         self._executor: Optional[Client] = None
-        self._network: Optional[NetworkAPI] = None
+        self._lock = threading.Lock()
 
         self._address = address
         self._requirements = requirements
 
-        self._egg_path = egg_path
+        self._egg_path: Optional[Path] = egg_path
         self._config: Dict[str, Any] = config
+        self._digest: Optional[str] = None
+        self._bind_registry(registry)
 
         self.dask_install = lambda os, aligned: os.system(f"pip install -U {aligned}")  # type: ignore
         self.dask_clean = lambda os: os.system("find . -type f -name '*.egg' -delete")  # type: ignore
         self.dask_update = lambda os: os.system("pip install -U setuptools cloudpickle blosc lz4 msgpack numpy")  # type: ignore
 
-    def _submit_next(self) -> bool:
-        """Submit next batch of jobs to the pool."""
-        if self._network is None:
-            raise ValueError("network not found")
+    def _build_graph(self, run: Run) -> Dict[GearOutput, Any]:
+        """Translate the network into dask delayed tasks, dependent gears receive tasks of their inputs."""
+        from dask import annotate, delayed  # type: ignore[import]
 
-        if self._executor is None:
-            raise ValueError("engine not found")
+        graph = run.network.graph
+        tasks: Dict[DataNode, Any] = {}
+        final: Dict[GearOutput, Any] = {}
 
-        futures = {}
-        gear: GearNode
-        data_node: OutputNode
+        for gear in topological_sort(graph):  # type: ignore
+            # NOTE: Gears with restored outputs are skipped, their consumers receive the values as literals.
+            if not isinstance(gear, GearNode) or not any(node.is_empty for node in graph.successors(gear)):  # type: ignore
+                continue
 
-        for data_node in self._network.compute_next():
-            predeccesors: List[GearNode] = list(self._network.graph.predecessors(data_node))  # type: ignore
-            if len(predeccesors) != 1:
-                raise InvalidGraph(f"found a data node produced by multiple gears: {predeccesors}", gears=predeccesors)
+            params: Dict[str, Any] = {p.name: tasks.get(p, p.value) for p in graph.predecessors(gear)}  # type: ignore
 
-            gear = predeccesors[0]
-            data_node.set_value(gear(gear.input_values))
+            # NOTE: Resource annotations require workers started with matching `--resources`.
+            annotations = {"resources": gear.resources.as_dask()} if self._config.get("resources") else {}
+            with annotate(**annotations):
+                # NOTE: Number of elements is known only at run time, so mapped gears fan out from within their task.
+                call = map_on_workers if isinstance(gear, MapGear) else call_gear
+                task = delayed(call, pure=False)(gear.detach(), params, dask_key_name=f"{gear.name}-{run.run_id}")
 
-            future = self._executor.submit(gear, kwargs=gear.input_values)  # type: ignore
-            futures[future] = (data_node, gear)
+            data_node: OutputNode
+            for data_node in graph.successors(gear):  # type: ignore
+                predeccesors: List[GearNode] = list(graph.predecessors(data_node))  # type: ignore
+                if len(predeccesors) != 1:
+                    raise InvalidGraph(f"found a data node produced by multiple gears: {predeccesors}", gears=predeccesors)
 
-        if not futures:
-            return False
+                tasks[data_node] = task
+                if isinstance(data_node, GearOutput):
+                    final[data_node] = task
 
-        for future in self.as_completed(futures):  # type: ignore
-            data_node, gear = futures[future]  # type: ignore
-            data_node.set_value(future.result())  # type: ignore
+        return final
 
-        return True
+    @property
+    def digest(self) -> Optional[str]:
+        """Content hash of the provisioned worker environment."""
+        return self._digest
 
     def setup(self) -> None:
         """Prepare the given computation for executor."""
-        import importlib
+        from dask.distributed import Client
+
+        with self._lock:
+            if self._executor is None:
+                self._setup(Client(self._address, timeout=30))
+
+    def _setup(self, client: Any) -> None:
+        """Wait for workers of a connected client and provision them."""
+        from flowlayer.core.provision import Provision, environment_digest, is_provisioned, resolve_cache_dir
+
+        self._executor = client
+        self._executor.wait_for_workers(1, timeout=10)  # type: ignore
 
-        from dask.distributed import Client, PipInstall
-        from distributed.diagnostics.plugin import UploadFile  # type: ignore[import]
+        if self._requirements or self._egg_path is not None:
+            cache_dir = resolve_cache_dir(self._config.get("cache_dir"))
+            digest = environment_digest(self._requirements, self._egg_path)
 
-        self._executor = Client(self._address, timeout=30)
-        install_deps = PipInstall(packages=self._requirements, pip_options=["--upgrade"])
-        upload_egg = UploadFile(self._egg_path)
+            # NOTE: Ship the egg only when some worker does not hold this environment yet.
+            provisioned = self._executor.run(is_provisioned, digest, cache_dir)  # type: ignore
+            egg_data = None
+            if self._egg_path is not None and not all(provisioned.values()):
+                egg_data = Path(self._egg_path).read_bytes()
 
-        self._executor.run(lambda ilib: ilib.invalidate_caches(), importlib)  # type: ignore
+            egg_name = Path(self._egg_path).name if self._egg_path is not None else None
+            plugin = Provision(digest, cache_dir, self._requirements, egg_name, egg_data)
 
-        self._executor.register_worker_plugin(install_deps, "install_deps")  # type: ignore
-        self._executor.register_worker_plugin(upload_egg, "upload_egg")  # type: ignore
+            # NOTE: Newer distributed releases renamed `register_worker_plugin`.
+            register = getattr(self._executor, "register_plugin", None) or self._executor.register_worker_plugin  # type: ignore
+            register(plugin, Provision.name)
+
+            self._digest = digest
 
-        self._executor.wait_for_workers(timeout=10)  # type: ignore
         _ = self._executor.get_versions(check=True)  # type: ignore
 
     def is_ready(self) -> bool:
@@ -212,19 +1075,35 @@ class DaskEngine(EngineAPI):
 
     def run(self, network: NetworkAPI, **kwargs: Any) -> NetworkAPI:
         """Runs the computational network and returns the result object."""
-        if network is None:
-            raise ValueError("cannot execute empty network")
-
         if self._executor is None:
             raise ValueError("engine is not ready")
 
-        self._network = network
-        self._network.set_input(kwargs)
-
-        while self._submit_next():
-            pass
-
-        return self._network
+        return super().run(network, **kwargs)
+
+    def _execute(self, run: Run) -> None:
+        """Compute all outputs of a run, keys of concurrent runs never collide on the scheduler."""
+        final = self._build_graph(run)
+        if not final:
+            return
+
+        # NOTE: The whole graph is submitted at once, only network results are pulled back to the client.
+        futures = self._executor.compute(list(final.values()))  # type: ignore
+        outputs = dict(zip(futures, final.keys()))
+
+        try:
+            for future in self.as_completed(futures):
+                run.check()
+
+                data_node = outputs[future]
+                data_node.set_value(future.result())
+                run.publish(data_node)
+        except GearException as e:
+            self._gear_failed(run, e.gear)
+            self._executor.cancel(futures)  # type: ignore
+            raise
+        except BaseException:
+            self._executor.cancel(futures)  # type: ignore
+            raise
 
     def teardown(self) -> None:
         """Enging cleanup phase."""
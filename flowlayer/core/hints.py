@@ -0,0 +1,227 @@
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+RESOURCES_ATTR = "__flowlayer_resources__"
+RETRY_ATTR = "__flowlayer_retry__"
+PURE_ATTR = "__flowlayer_pure__"
+CHUNK_ATTR = "__flowlayer_chunk__"
+
+
+class Resources:
+    """Resources required by a single gear execution."""
+
+    def __init__(self, cpus: int = 1, memory: int = 0, exclusive: bool = False) -> None:
+        """Resources constructor, `memory` is an estimate in bytes."""
+        if cpus < 1:
+            raise ValueError("gear requires at least one cpu")
+
+        if memory < 0:
+            raise ValueError("memory must be positive")
+
+        self._cpus = cpus
+        self._memory = memory
+        self._exclusive = exclusive
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"Resources(cpus={self._cpus}, memory={self._memory}, exclusive={self._exclusive})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare resources."""
+        if not isinstance(other, Resources):
+            return NotImplemented
+
+        return (self._cpus, self._memory, self._exclusive) == (other._cpus, other._memory, other._exclusive)
+
+    @property
+    def cpus(self) -> int:
+        """Number of cpu threads used by the gear."""
+        return self._cpus
+
+    @property
+    def memory(self) -> int:
+        """Estimated peak memory of the gear in bytes."""
+        return self._memory
+
+    @property
+    def exclusive(self) -> bool:
+        """Gear must not share the machine with other gears."""
+        return self._exclusive
+
+    def as_dask(self) -> Dict[str, float]:
+        """Express resources as dask worker resources."""
+        resources: Dict[str, float] = {"CPU": self._cpus}
+
+        if self._memory:
+            resources["MEMORY"] = self._memory
+
+        if self._exclusive:
+            resources["EXCLUSIVE"] = 1
+
+        return resources
+
+
+DEFAULT_RESOURCES = Resources()
+
+
+def resources(cpus: int = 1, memory: int = 0, exclusive: bool = False) -> Callable[[F], F]:
+    """Declare resources a gear function needs."""
+    hint = Resources(cpus=cpus, memory=memory, exclusive=exclusive)
+
+    def decorator(func: F) -> F:
+        setattr(func, RESOURCES_ATTR, hint)
+        return func
+
+    return decorator
+
+
+def get_resources(func: Callable[..., Any]) -> Resources:
+    """Return resources declared on a gear function."""
+    hint: Resources = getattr(func, RESOURCES_ATTR, DEFAULT_RESOURCES)
+    return hint
+
+
+class Retry:
+    """Retry policy of a gear, only the failed gear is executed again."""
+
+    def __init__(
+        self,
+        max_attempts: int = 1,
+        backoff: float = 0.0,
+        factor: float = 2.0,
+        exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    ) -> None:
+        """Retry constructor, `backoff` is the delay in seconds before the second attempt."""
+        if max_attempts < 1:
+            raise ValueError("gear requires at least one attempt")
+
+        if backoff < 0:
+            raise ValueError("backoff must be positive")
+
+        if factor < 1:
+            raise ValueError("backoff factor must be at least one")
+
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._factor = factor
+        self._exceptions = exceptions
+
+    def __repr__(self) -> str:
+        """String representation."""
+        names = ", ".join(exception.__name__ for exception in self._exceptions)
+        return f"Retry(max_attempts={self._max_attempts}, backoff={self._backoff}, factor={self._factor}, exceptions=({names}))"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare retry policies."""
+        if not isinstance(other, Retry):
+            return NotImplemented
+
+        return (self._max_attempts, self._backoff, self._factor, self._exceptions) == (
+            other._max_attempts,
+            other._backoff,
+            other._factor,
+            other._exceptions,
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        """Maximum number of gear executions."""
+        return self._max_attempts
+
+    @property
+    def exceptions(self) -> Tuple[Type[BaseException], ...]:
+        """Exception types which are retried."""
+        return self._exceptions
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after a failed `attempt`, attempts are numbered from one."""
+        return float(self._backoff * self._factor ** (attempt - 1))
+
+    def should_retry(self, raised: BaseException, attempt: int) -> bool:
+        """Check if gear failing on `attempt` is executed again."""
+        return attempt < self._max_attempts and isinstance(raised, self._exceptions)
+
+
+NO_RETRY = Retry()
+
+
+def retry(
+    max_attempts: int = 3,
+    backoff: float = 0.0,
+    factor: float = 2.0,
+    exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+) -> Callable[[F], F]:
+    """Declare retry policy of a gear function."""
+    hint = Retry(max_attempts=max_attempts, backoff=backoff, factor=factor, exceptions=exceptions)
+
+    def decorator(func: F) -> F:
+        setattr(func, RETRY_ATTR, hint)
+        return func
+
+    return decorator
+
+
+def get_retry(func: Callable[..., Any]) -> Retry:
+    """Return retry policy declared on a gear function."""
+    hint: Retry = getattr(func, RETRY_ATTR, NO_RETRY)
+    return hint
+
+
+def pure(func: F) -> F:
+    """Declare gear function free of side effects, so it may be executed more than once."""
+    setattr(func, PURE_ATTR, True)
+    return func
+
+
+def is_pure(func: Callable[..., Any]) -> bool:
+    """Check if gear function is declared pure."""
+    return bool(getattr(func, PURE_ATTR, False))
+
+
+class Chunking:
+    """Axis a gear may be split along and how its results on chunks are combined."""
+
+    def __init__(self, axis: int = 0, reduce: Optional[Callable[[Any, Any], Any]] = None) -> None:
+        """Chunking constructor, `reduce` folds two partial results, results are concatenated along `axis` without it."""
+        self._axis = axis
+        self._reduce = reduce
+
+    def __repr__(self) -> str:
+        """String representation."""
+        reduce = getattr(self._reduce, "__name__", "concatenate") if self._reduce is not None else "concatenate"
+        return f"Chunking(axis={self._axis}, reduce={reduce})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare chunking hints."""
+        if not isinstance(other, Chunking):
+            return NotImplemented
+
+        return (self._axis, self._reduce) == (other._axis, other._reduce)
+
+    @property
+    def axis(self) -> int:
+        """Axis of array inputs and outputs the gear is applied along."""
+        return self._axis
+
+    @property
+    def reduce(self) -> Optional[Callable[[Any, Any], Any]]:
+        """Binary function folding partial results in chunk order, `None` concatenates them."""
+        return self._reduce
+
+
+def chunkable(axis: int = 0, reduce: Optional[Callable[[Any, Any], Any]] = None) -> Callable[[F], F]:
+    """Declare gear function computes the same result on chunks of its array inputs split along `axis`."""
+    hint = Chunking(axis=axis, reduce=reduce)
+
+    def decorator(func: F) -> F:
+        setattr(func, CHUNK_ATTR, hint)
+        return func
+
+    return decorator
+
+
+def get_chunking(func: Callable[..., Any]) -> Optional[Chunking]:
+    """Return chunking declared on a gear function, `None` for gears requiring whole inputs."""
+    hint: Optional[Chunking] = getattr(func, CHUNK_ATTR, None)
+    return hint
@@ -0,0 +1,96 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+IndexEntry = Tuple[int, str]
+
+
+class FeatureIndex:
+    """Secondary index of feature keys ordered by timestamp for every network."""
+
+    def __init__(self) -> None:
+        """Feature index constructor."""
+        self._timestamps: Dict[int, List[int]] = {}
+        self._keys: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of indexed keys across all networks."""
+        return sum(len(keys) for keys in self._keys.values())
+
+    @property
+    def identifiers(self) -> List[int]:
+        """Return identifiers of all indexed networks."""
+        return list(self._keys.keys())
+
+    def count(self, identifier: int) -> int:
+        """Number of indexed keys for a given network."""
+        return len(self._keys.get(identifier, []))
+
+    def add(self, identifier: int, timestamp: int, key: str) -> None:
+        """Index a key under network identifier and timestamp."""
+        with self._lock:
+            timestamps = self._timestamps.setdefault(identifier, [])
+            keys = self._keys.setdefault(identifier, [])
+
+            # NOTE: Writes mostly arrive in order, appending keeps those inserts O(1).
+            if not timestamps or timestamps[-1] <= timestamp:
+                timestamps.append(timestamp)
+                keys.append(key)
+                return
+
+            position = bisect.bisect_right(timestamps, timestamp)
+            timestamps.insert(position, timestamp)
+            keys.insert(position, key)
+
+    def latest(self, identifier: int, n: int = 1) -> List[IndexEntry]:
+        """Return up to `n` most recent entries, newest first."""
+        if n <= 0:
+            return []
+
+        with self._lock:
+            timestamps = self._timestamps.get(identifier, [])
+            keys = self._keys.get(identifier, [])
+
+            start = max(len(keys) - n, 0)
+            return list(zip(reversed(timestamps[start:]), reversed(keys[start:])))
+
+    def between(self, identifier: int, start: Optional[int] = None, end: Optional[int] = None) -> List[IndexEntry]:
+        """Return entries with `start <= timestamp <= end`, oldest first."""
+        with self._lock:
+            timestamps = self._timestamps.get(identifier, [])
+            keys = self._keys.get(identifier, [])
+
+            lo = 0 if start is None else bisect.bisect_left(timestamps, start)
+            hi = len(timestamps) if end is None else bisect.bisect_right(timestamps, end)
+
+            return list(zip(timestamps[lo:hi], keys[lo:hi]))
+
+    def as_of(self, identifier: int, timestamp: int) -> Optional[IndexEntry]:
+        """Return the latest entry written at or before `timestamp`."""
+        with self._lock:
+            timestamps = self._timestamps.get(identifier, [])
+            position = bisect.bisect_right(timestamps, timestamp)
+
+            if position == 0:
+                return None
+
+            return timestamps[position - 1], self._keys[identifier][position - 1]
+
+    def prune(self, identifier: int, keys: Set[str]) -> int:
+        """Rewrite the network segment without the given keys."""
+        with self._lock:
+            timestamps = self._timestamps.get(identifier, [])
+            entries = [(ts, key) for ts, key in zip(timestamps, self._keys.get(identifier, [])) if key not in keys]
+            removed = len(timestamps) - len(entries)
+
+            if not entries:
+                self._timestamps.pop(identifier, None)
+                self._keys.pop(identifier, None)
+                return removed
+
+            # NOTE: Rebuild in a single pass instead of deleting entries one by one.
+            self._timestamps[identifier] = [ts for ts, _ in entries]
+            self._keys[identifier] = [key for _, key in entries]
+
+            return removed
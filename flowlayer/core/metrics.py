@@ -0,0 +1,298 @@
+import bisect
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+
+if TYPE_CHECKING:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRIC_KINDS = ("counter", "gauge", "histogram")
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# NOTE: Metrics recorded by engines, more can be declared through `MetricsRegistry.declare`.
+ENGINE_METRICS: Dict[str, Tuple[str, str]] = {
+    "flowlayer_runs_total": ("counter", "Finished runs by network and status."),
+    "flowlayer_runs_active": ("gauge", "Runs in flight."),
+    "flowlayer_run_duration_seconds": ("histogram", "Run latency by network."),
+    "flowlayer_gear_duration_seconds": ("histogram", "Gear latency by network and gear."),
+    "flowlayer_gear_failures_total": ("counter", "Failed gears by network and gear, after retries."),
+    "flowlayer_queued_gears": ("gauge", "Gears waiting for pool capacity by network."),
+    "flowlayer_pool_cpus": ("gauge", "Cpus of the pool budget."),
+    "flowlayer_pool_cpus_used": ("gauge", "Cpus claimed by running gears."),
+    "flowlayer_pool_memory_used_bytes": ("gauge", "Memory claimed by running gears."),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_value(value: float) -> str:
+    """Format sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    """Format label set."""
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class Histogram:
+    """Cumulative bucket counts of observed values."""
+
+    __slots__ = ("_bounds", "_counts", "_sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        """Histogram constructor."""
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of observed values."""
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._sum += value
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Upper bounds with cumulative counts, the last bound is infinite."""
+        cumulative = 0
+        buckets: List[Tuple[float, int]] = []
+        for bound, count in zip((*self._bounds, math.inf), self._counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+
+        return buckets
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms keyed by metric name and labels, rendered in Prometheus text format."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Metrics registry constructor, `buckets` are upper bounds of histograms in seconds."""
+        self._buckets = tuple(sorted(buckets))
+        self._declared: Dict[str, Tuple[str, str]] = dict(ENGINE_METRICS)
+        self._values: Dict[str, Dict[Labels, Union[float, Histogram]]] = {}
+        self._lock = threading.Lock()
+
+    def declare(self, name: str, kind: str, help_text: str) -> None:
+        """Declare a metric."""
+        if kind not in METRIC_KINDS:
+            raise ValueError(f"unknown metric kind `{kind}` - use one of {METRIC_KINDS}")
+
+        self._declared[name] = (kind, help_text)
+
+    def _kind(self, name: str, kind: str) -> None:
+        """Check metric is declared as `kind`."""
+        if name not in self._declared:
+            raise KeyError(f"metric `{name}` is not declared")
+
+        if self._declared[name][0] != kind:
+            raise ValueError(f"metric `{name}` is a {self._declared[name][0]}")
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Increase a counter."""
+        if amount < 0:
+            raise ValueError("counters only increase")
+
+        self._kind(name, "counter")
+        self._add(name, amount, labels)
+
+    def add(self, name: str, amount: float, **labels: str) -> None:
+        """Change a gauge by `amount`."""
+        self._kind(name, "gauge")
+        self._add(name, amount, labels)
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge."""
+        self._kind(name, "gauge")
+        key = tuple(sorted(labels.items()))
+
+        with self._lock:
+            self._values.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record a value of a histogram."""
+        self._kind(name, "histogram")
+        key = tuple(sorted(labels.items()))
+
+        with self._lock:
+            samples = self._values.setdefault(name, {})
+            histogram = samples.get(key)
+            if not isinstance(histogram, Histogram):
+                histogram = samples[key] = Histogram(self._buckets)
+
+            histogram.observe(value)
+
+    def _add(self, name: str, amount: float, labels: Dict[str, str]) -> None:
+        """Add to a counter or gauge."""
+        key = tuple(sorted(labels.items()))
+
+        with self._lock:
+            samples = self._values.setdefault(name, {})
+            samples[key] = samples.get(key, 0.0) + amount  # type: ignore
+
+    def value(self, name: str, **labels: str) -> Any:
+        """Return current value of a counter or gauge, a histogram for histograms."""
+        return self._values.get(name, {}).get(tuple(sorted(labels.items())))
+
+    def render(self) -> str:
+        """Render all recorded metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+
+        with self._lock:
+            for name in sorted(self._values):
+                kind, help_text = self._declared[name]
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+                for labels, sample in sorted(self._values[name].items()):
+                    if isinstance(sample, Histogram):
+                        for bound, count in sample.buckets():
+                            lines.append(f"{name}_bucket{_format_labels((*labels, ('le', _format_value(bound))))} {count}")
+
+                        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(sample.sum)}")
+                        lines.append(f"{name}_count{_format_labels(labels)} {sample.count}")
+                    else:
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(sample)}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class MetricsExporter:
+    """Expose metrics of a registry to a scraper."""
+
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        """Metrics exporter constructor."""
+        self._metrics = metrics
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Exported metrics."""
+        return self._metrics
+
+    def export(self) -> None:
+        """Expose current state of the metrics."""
+        raise NotImplementedError
+
+
+class FileExporter(MetricsExporter):
+    """Dump metrics into a file, such as a textfile collector directory of a local scraper."""
+
+    def __init__(self, metrics: MetricsRegistry, path: Union[str, Path]) -> None:
+        """File exporter constructor."""
+        super().__init__(metrics)
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        """Metrics file."""
+        return self._path
+
+    def export(self) -> None:
+        """Replace the metrics file, scrapers never read a partial dump."""
+        fd, tmp = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self._metrics.render())
+            os.replace(tmp, self._path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def metrics_handler(metrics: MetricsRegistry, endpoint: str = "/metrics") -> Type["BaseHTTPRequestHandler"]:
+    """Build HTTP request handler serving metrics, pluggable into any `http.server` server."""
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != endpoint:
+                self.send_error(404)
+                return
+
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: Any) -> None:
+            pass
+
+    return MetricsHandler
+
+
+class HTTPExporter(MetricsExporter):
+    """Serve metrics over HTTP from a background thread."""
+
+    def __init__(self, metrics: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464) -> None:
+        """HTTP exporter constructor, port `0` picks a free port."""
+        super().__init__(metrics)
+        self._host = host
+        self._port = port
+        self._server: Optional["ThreadingHTTPServer"] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "HTTPExporter":
+        """Start serving metrics."""
+        self.export()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop serving metrics."""
+        self.stop()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host and port the metrics are served on."""
+        if self._server is None:
+            return self._host, self._port
+
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def export(self) -> None:
+        """Start serving metrics, requests always render the current state."""
+        from http.server import ThreadingHTTPServer
+
+        if self._server is not None:
+            raise ValueError("metrics already served")
+
+        self._server = ThreadingHTTPServer((self._host, self._port), metrics_handler(self._metrics))
+        self._thread = threading.Thread(target=self._server.serve_forever, name="flowlayer-metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is None or self._thread is None:
+            raise ValueError("metrics not served")
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
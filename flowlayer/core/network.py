@@ -1,15 +1,24 @@
+import copy
 import inspect
 import zlib
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union
-
-import numpy
-from networkx import MultiDiGraph
-from networkx.algorithms.dag import descendants
-from networkx.algorithms.traversal.breadth_first_search import bfs_edges
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from flowlayer.core.api import EngineAPI, FeatureStoreAPI, NetworkAPI, NetworkPlotAPI
-from flowlayer.core.engine import SerialEngine
-from flowlayer.core.nodes import DataNode, GearInput, GearInputOutput, GearNode, GearOutput, NetworkNode, OutputNode
+from flowlayer.core.cache import LRUCache, input_digest
+from flowlayer.core.nodes import DataNode, GearInput, GearInputOutput, GearNode, GearOutput, MapGear, NetworkNode, OutputNode
+from flowlayer.core.validation import VALIDATION_MODES
+
+# NOTE: NumPy, NetworkX and engines are imported on first use, `import flowlayer` stays cheap.
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+    from networkx import MultiDiGraph
+
+    from flowlayer.core.arrow import ArrowData
+    from flowlayer.core.artifact import NetworkArtifact
+    from flowlayer.core.checkpoint import CheckpointStore
+    from flowlayer.core.engine import Run, RunHandle
+    from flowlayer.core.topology import Topology
 
 T = TypeVar("T")
 Maybe = Union[Any, T]
@@ -18,23 +27,64 @@ Maybe = Union[Any, T]
 class Depends(Generic[T]):
     """Express gear input dependency."""
 
-    def __init__(self, func: Callable[..., Any]) -> None:
-        """Constructor for dependency edge."""
+    def __init__(self, func: Union[Callable[..., Any], "Network"], output: Optional[str] = None) -> None:
+        """Constructor for dependency edge, a network dependency is inlined through its `output` gear."""
         from flowlayer.core.nodes import GearNode
 
+        if isinstance(func, Network):
+            func = func.output_gear(output)
+        elif output is not None:
+            raise ValueError("output can be selected only from a network dependency")
+
         self._func: Callable[..., Any] = func
         self._gear = GearNode(self._func)
 
+    @property
+    def func(self) -> Callable[..., Any]:
+        """Return function the dependency is computed by."""
+        return self._func
+
     @property
     def gear(self) -> GearNode:
         """Return function dependencies as a gear."""
         return self._gear
 
 
+class Map(Depends[T]):
+    """Express gear input gathered from applying `func` to every element produced by `over`."""
+
+    def __init__(self, func: Callable[..., Any], over: Union[Callable[..., Any], "Network", Depends[Any]], item: Optional[str] = None) -> None:
+        """Constructor for fan-out edge, `item` is the parameter of `func` receiving elements."""
+        self._func = func
+        self._gear: GearNode = MapGear(func, item)
+        self._over = over if isinstance(over, Depends) else Depends(over)
+
+    @property
+    def over(self) -> Depends[Any]:
+        """Return dependency producing the collection."""
+        return self._over
+
+    @property
+    def item(self) -> str:
+        """Return parameter of the mapped function receiving elements."""
+        return self._gear.item  # type: ignore
+
+
+def _inline(outputs: Sequence[Union[Callable[..., Any], "Network"]]) -> List[Callable[..., Any]]:
+    """Replace nested networks by their output gears, every gear is listed once."""
+    funcs: List[Callable[..., Any]] = []
+    for output in outputs:
+        for func in output.outputting_nodes if isinstance(output, Network) else [output]:
+            if func not in funcs:
+                funcs.append(func)
+
+    return funcs
+
+
 class NetworkPropertyMixin(NetworkAPI):
     """Network property mixin."""
 
-    def __init__(self, name: str, version: str, graph: MultiDiGraph) -> None:
+    def __init__(self, name: str, version: str, graph: "MultiDiGraph") -> None:
         """Network property mixin."""
         self._name = name
         self._version = version
@@ -62,7 +112,7 @@ class NetworkPropertyMixin(NetworkAPI):
         return _id
 
     @property
-    def graph(self) -> MultiDiGraph:
+    def graph(self) -> "MultiDiGraph":
         """Get computational graph representation."""
         return self._graph
 
@@ -127,34 +177,61 @@ class Network(NetworkPropertyMixin):
     def __init__(
         self,
         name: str,
-        outputs: Optional[List[Callable[..., numpy.ndarray]]] = None,
+        outputs: Optional[Sequence[Union[Callable[..., "numpy.ndarray"], "Network"]]] = None,
         version: str = "0.1.0",
         engine: Optional[EngineAPI] = None,
         feature_store: Optional[FeatureStoreAPI] = None,
+        entity_key: Optional[str] = None,
+        read_through: bool = False,
+        cache_size: int = 128,
+        validation: str = "fast",
+        checkpoints: Optional["CheckpointStore"] = None,
     ) -> None:
-        """Network constructor."""
-        self._outputting_nodes = outputs or []
-        self._graph: MultiDiGraph = MultiDiGraph(name=name)
+        """Network constructor, `validation` is one of `off`, `fast` or `strict`.
+
+        Networks listed in `outputs` or used in `Depends` are inlined, their gears join the schedule of this network.
+        """
+        from flowlayer.core.topology import NetworkGraph
+
+        if validation not in VALIDATION_MODES:
+            raise ValueError(f"unknown validation mode `{validation}` - use one of {VALIDATION_MODES}")
+
+        self._validation = validation
+        self._outputting_nodes = _inline(outputs or [])
+        self._graph: "MultiDiGraph" = NetworkGraph(name=name)
+        self._gears: Dict[Any, GearNode] = {}
+        self._topology: Optional["Topology"] = None
         self._feature_store = feature_store
+        self._entity_key = entity_key
+        self._checkpoints = checkpoints
+
+        self._read_through = read_through
+        self._cache_size = cache_size
+        self._cache: LRUCache[Dict[str, Any]] = LRUCache(cache_size if read_through else 0)
 
-        self._last_results: List[Tuple[str, str]]
+        self._last_results: List[Tuple[str, str]] = []
 
         for output in self._outputting_nodes:
-            gear = GearNode(output, graph=self._graph)
-            self._attach_output(gear, graph_output=True)
-            self._add_gear(gear)
+            self._add_gear(output)
 
         if engine is None:
-            self._engine = SerialEngine()
+            from flowlayer.core.engine import SerialEngine
+
+            engine = SerialEngine()
+
+        self._engine: EngineAPI = engine
 
         super().__init__(name, version, self._graph)
 
+        if entity_key is not None and entity_key not in self.input_shape:
+            raise ValueError(f"entity key `{entity_key}` is not an input of the network")
+
     def _attach_input(self, param: inspect.Parameter, dst: GearNode) -> None:
         """Attach input to the gear."""
         value = param.default if param.default != param.empty else None
         annotation = param.annotation if param.annotation != param.empty else Any
 
-        gear_input = GearInput(param.name, value, annotation, graph=self._graph)
+        gear_input = GearInput(param.name, value, annotation, graph=self._graph, validation=self._validation)
         self._graph.add_edge(gear_input, dst)  # type: ignore
 
     def _attach_output(self, src_gear: GearNode, name: Optional[str] = None, graph_output: bool = False) -> OutputNode:
@@ -164,60 +241,104 @@ class Network(NetworkPropertyMixin):
 
         src_gear_output: OutputNode
         if graph_output:
-            src_gear_output = GearOutput(name, None, src_gear.output_type, graph=self._graph)
+            src_gear_output = GearOutput(name, None, src_gear.output_type, graph=self._graph, validation=self._validation)
         else:
-            src_gear_output = GearInputOutput(name, None, src_gear.output_type, graph=self._graph)
+            src_gear_output = GearInputOutput(name, None, src_gear.output_type, graph=self._graph, validation=self._validation)
 
         self._graph.add_edge(src_gear, src_gear_output)  # type: ignore
         return src_gear_output
 
-    def _add_gear(self, gear: GearNode) -> None:
-        """Add gear to the graph."""
+    def _add_gear(self, func: Callable[..., Any], dependency: Optional[Depends[Any]] = None, name: Optional[str] = None) -> OutputNode:
+        """Add gear to the graph with output `name`, a gear shared by several consumers is added once."""
+        # NOTE: A mapped gear differs from a plain gear of the same function.
+        key = dependency if isinstance(dependency, Map) else func
+
+        added = key in self._gears
+        gear = self._gears.setdefault(key, dependency.gear if dependency is not None else GearNode(func))
         gear.set_graph(self._graph)
 
-        for name, param in gear.params.items():
-            if param.default and isinstance(param.default, Depends):
-                src_gear = param.default.gear
-                src_gear_output = self._attach_output(src_gear, name=name)
-                self._graph.add_edge(src_gear_output, gear)  # type: ignore
-                self._add_gear(src_gear)
+        gear_output = self._attach_output(gear, name=name, graph_output=name is None)
+        if added:
+            return gear_output
+
+        for param_name, param in gear.params.items():
+            source = param.default if isinstance(param.default, Depends) else None
+            if isinstance(dependency, Map) and param_name == dependency.item:
+                source = dependency.over
+
+            if source is not None:
+                self._graph.add_edge(self._add_gear(source.func, source, name=param_name), gear)  # type: ignore
             else:
                 self._attach_input(param, gear)
 
-    def compute_next(self) -> List[OutputNode]:
-        """Returns next nodes ready for evaluation."""
-        # NOTE: Find all nodes of type `OutputNode`.
-        outputs: Set[OutputNode] = {
-            dst
-            for r in self.roots
-            for _, dst in bfs_edges(self._graph, r)  # type: ignore
-            if (isinstance(dst, GearOutput) or isinstance(dst, GearInputOutput)) and dst.is_empty  # TODO: check for 'OutputNode'
-        }
+        return gear_output
+
+    @property
+    def topology(self) -> "Topology":
+        """Compiled adjacency used for execution, rebuilt whenever the graph changes."""
+        from flowlayer.core.topology import Topology
 
-        # NOTE: For each `DataNode`, build set of descendants.
-        reachable: Set[NetworkNode] = {node for output in outputs for node in descendants(self._graph, output)}  # type: ignore
+        if self._topology is None or self._topology.is_stale(self._graph):
+            self._topology = Topology(self._graph)
 
-        # NOTE: For each `DataNode`, exclude its connected descendant of the same type.
-        result: List[OutputNode] = [node for node in outputs if node not in reachable]
+        return self._topology
 
-        return result
+    def compute_next(self) -> List[OutputNode]:
+        """Returns next nodes ready for evaluation."""
+        return self.topology.compute_next()
 
     def copy(self, name: Optional[str] = None, version: Optional[str] = None) -> "Network":
         """Create a copy of an `Network` instance."""
         _version = version or self._version
         _name = name or self._name
 
-        return Network(_name, outputs=self._outputting_nodes, version=_version, feature_store=self._feature_store)  # type: ignore
+        return Network(
+            _name,
+            outputs=self._outputting_nodes,  # type: ignore
+            version=_version,
+            feature_store=self._feature_store,
+            entity_key=self._entity_key,
+            read_through=self._read_through,
+            cache_size=self._cache_size,
+            validation=self._validation,
+            checkpoints=self._checkpoints,
+        )
+
+    def _clone(self) -> "Network":
+        """Copy the network structure, reusing already introspected gears."""
+        network = Network(
+            self._name,
+            version=self._version,
+            feature_store=self._feature_store,
+            read_through=self._read_through,
+            cache_size=self._cache_size,
+            validation=self._validation,
+            checkpoints=self._checkpoints,
+        )
+        network._outputting_nodes = self._outputting_nodes
+        network._entity_key = self._entity_key
+
+        nodes: Dict[NetworkNode, NetworkNode] = {node: copy.copy(node) for node in self._graph.nodes}  # type: ignore
+        for node in nodes.values():
+            node.set_graph(network.graph)
+            if isinstance(node, (GearOutput, GearInputOutput)):
+                node.clear()
+
+        network.graph.add_nodes_from(nodes.values())  # type: ignore
+        network.graph.add_edges_from((nodes[src], nodes[dst]) for src, dst in self._graph.edges())  # type: ignore
+
+        return network
 
     def set_input(self, input_data: Dict[str, Any]) -> None:
         """Set input data for the graph computation."""
         if input_data.keys() != self.input_shape.keys():
             raise ValueError("input data is wrong format - check `network.input_shape`")
 
-        inputs: Dict[str, DataNode] = {node.name: node for node in self._graph.nodes if isinstance(node, GearInput)}  # type: ignore
-
-        for name, value in input_data.items():
-            inputs[name].set_value(value)
+        # NOTE: Gears sharing a parameter name have separate input nodes, all of them receive the value.
+        node: DataNode
+        for node in self._graph.nodes:  # type: ignore
+            if isinstance(node, GearInput):
+                node.set_value(input_data[node.name])
 
     @property
     def results(self) -> List[GearOutput]:
@@ -226,17 +347,171 @@ class Network(NetworkPropertyMixin):
 
         return _results
 
+    @property
+    def validation(self) -> str:
+        """Validation mode of data nodes."""
+        return self._validation
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Constructor settings carried over to copies and artifacts."""
+        return {
+            "entity_key": self._entity_key,
+            "read_through": self._read_through,
+            "cache_size": self._cache_size,
+            "validation": self._validation,
+        }
+
+    @property
+    def outputting_nodes(self) -> List[Callable[..., Any]]:
+        """Gear functions the network was built from."""
+        return list(self._outputting_nodes)
+
+    def output_gear(self, name: Optional[str] = None) -> Callable[..., Any]:
+        """Gear function computing network output `name`, which may be omitted for networks with a single output."""
+        if name is None:
+            if len(self._outputting_nodes) != 1:
+                raise ValueError(f"network {self} has several outputs - select one of {[func.__name__ for func in self._outputting_nodes]}")
+
+            return self._outputting_nodes[0]
+
+        for func in self._outputting_nodes:
+            if func.__name__ == name:
+                return func
+
+        raise ValueError(f"network {self} has no output `{name}`")
+
+    def export(self) -> "NetworkArtifact":
+        """Compile the network into an artifact, loadable without introspecting gears."""
+        from flowlayer.core.artifact import NetworkArtifact
+
+        return NetworkArtifact.from_network(self)
+
+    @classmethod
+    def load(cls, artifact: Union["NetworkArtifact", bytes], **kwargs: Any) -> "Network":
+        """Build network from an artifact, `kwargs` such as `engine` or `feature_store` override stored settings."""
+        from flowlayer.core.artifact import NetworkArtifact
+
+        if isinstance(artifact, bytes):
+            artifact = NetworkArtifact.from_bytes(artifact)
+
+        return artifact.build(**kwargs)
+
+    def register(self) -> None:
+        """Publish the network through its engine, workers sharing the registry pick it up."""
+        self._engine.register(self)
+
+    @property
+    def cache(self) -> LRUCache[Dict[str, Any]]:
+        """Return in-process cache of read-through results."""
+        return self._cache
+
+    def _lookup(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up outputs in the in-process cache and then in the feature store."""
+        outputs = self._cache.get(cache_key)
+        if outputs is not None or self._feature_store is None:
+            return outputs
+
+        outputs = self._feature_store.get_outputs(self, cache_key)
+        if outputs is not None:
+            self._cache.put(cache_key, outputs)
+
+        return outputs
+
+    def _restore(self, outputs: Dict[str, Any], run: "Run") -> NetworkAPI:
+        """Fill network of a run from previously stored outputs."""
+        network_run = run.network
+        network_run.set_input(run.inputs)
+
+        # NOTE: Hand out copies so callers mutating results in place cannot corrupt the cache.
+        for output_node in network_run.results:
+            output_node.set_value(copy.deepcopy(outputs[output_node.name]))
+            run.publish(output_node, persist=False)
+
+        return network_run
+
     def run(self, **kwargs: Any) -> NetworkAPI:
         """Compute all data nodes of the network."""
+        from flowlayer.core.engine import Run
+
+        return self._execute(Run(self._clone(), kwargs, checkpoints=self._checkpoints))
+
+    def run_arrow(self, data: "ArrowData", **kwargs: Any) -> "pyarrow.RecordBatch":
+        """Compute the network over columns of an Arrow table or record batch, results are assembled into a record batch.
+
+        Columns are handed to gears as NumPy arrays sharing Arrow buffers, `kwargs` provide inputs without a column.
+        """
+        from flowlayer.core.arrow import arrow_inputs, results_to_batch
+
+        network_run = self.run(**arrow_inputs(data, self.input_shape), **kwargs)
+        return results_to_batch(network_run.results)
+
+    def submit(self, **kwargs: Any) -> "RunHandle":
+        """Start computing the network in the background, results are available from the handle as they complete."""
+        from flowlayer.core.engine import Run, RunHandle
+
+        return RunHandle(Run(self._clone(), kwargs, checkpoints=self._checkpoints), self._execute)
+
+    @property
+    def checkpoints(self) -> Optional["CheckpointStore"]:
+        """Store persisting data nodes of runs, runs without it cannot be resumed."""
+        return self._checkpoints
+
+    def resume(self, run_id: str) -> NetworkAPI:
+        """Continue a checkpointed run, only gears without persisted results are executed."""
+        from flowlayer.core.engine import Run
+
+        if self._checkpoints is None:
+            raise ValueError("network has no checkpoint store")
+
+        manifest = self._checkpoints.manifest(run_id)
+        if manifest["identifier"] != self.identifier:
+            raise ValueError(f"run {run_id} belongs to network {manifest['name']}-{manifest['version']}")
+
+        run = Run(self._clone(), self._checkpoints.inputs(run_id), run_id=run_id, checkpoints=self._checkpoints)
+        self._checkpoints.restore(run)
+
+        return self._execute(run)
+
+    def _execute(self, run: "Run") -> NetworkAPI:
+        """Compute a run, serving it from the read-through cache when possible."""
         if self._engine is None:
             raise ValueError("engine not running")
 
+        kwargs = run.inputs
+
+        cache_key: Optional[str] = None
+        if self._read_through:
+            cache_key = f"{self.identifier}-{input_digest(kwargs)}"
+
+            # NOTE: Only network results are restored on a hit, intermediate nodes stay empty.
+            outputs = self._lookup(cache_key)
+            if outputs is not None:
+                self._last_results = []
+                return self._restore(outputs, run)
+
         if not self._engine.is_ready():
             self._engine.setup()
 
-        network_run = self._engine.run(self.copy(), **kwargs)
+        if run.checkpoints is not None:
+            run.checkpoints.begin(run)
+
+        network_run = self._engine.execute(run)
+
+        # NOTE: A failed run keeps its checkpoint, so it can be resumed.
+        if run.checkpoints is not None:
+            run.checkpoints.complete(run.run_id)
+
+        entity = str(kwargs[self._entity_key]) if self._entity_key is not None else None
+
+        if cache_key is not None:
+            outputs = {out.name: copy.deepcopy(out.value) for out in network_run.results}
+            self._cache.put(cache_key, outputs)
+
+            if self._feature_store is not None:
+                self._feature_store.set_outputs(self, cache_key, outputs, entity=entity)
 
         if self._feature_store is not None:
-            self._last_results = [self._feature_store.set(out.value, network_run) for out in network_run.results]
+            self._last_results = [self._feature_store.set(out.value, network_run, entity=entity) for out in network_run.results]
 
         return network_run
@@ -1,20 +1,32 @@
+import copy
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, TypeVar, Union
 
-from networkx.classes.multidigraph import MultiDiGraph
+from flowlayer.core.hints import Chunking, Resources, Retry, get_chunking, get_resources, get_retry, is_pure
+from flowlayer.core.validation import Checker, compile_checker
+
+if TYPE_CHECKING:
+    from networkx.classes.multidigraph import MultiDiGraph
+
+S = TypeVar("S", bound="Signature")
 
 
 class GearException(Exception):
     """Gear exception."""
 
-    def __init__(self, gear: "GearNode", params: Dict[str, Any], raised: BaseException) -> None:
+    def __init__(self, gear: "GearNode", params: Dict[str, Any], raised: BaseException, attempts: int = 1) -> None:
         """ "Gear exception constructor."""
         self.gear = gear
         self.params = params
         self.raised_exception = raised
+        self.attempts = attempts
 
         super().__init__(self.raised_exception)
 
+    def __reduce__(self) -> Any:
+        """Support pickling when raised inside of a worker process."""
+        return (GearException, (self.gear, self.params, self.raised_exception, self.attempts))
+
 
 class InvalidGraph(Exception):
     """Invalid graph structure found."""
@@ -30,16 +42,19 @@ class InvalidGraph(Exception):
 class GraphAssociationMixin:
     """Graph association mixin."""
 
-    def __init__(self, graph: Optional[MultiDiGraph] = None) -> None:
+    # NOTE: Nodes are slotted, large networks hold tens of thousands of them.
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: Optional["MultiDiGraph"] = None) -> None:
         """GraphAssociationMixin constructor."""
         self._graph = graph
 
     @property
-    def graph(self) -> Optional[MultiDiGraph]:
+    def graph(self) -> Optional["MultiDiGraph"]:
         """Return associated graph."""
         return self._graph
 
-    def set_graph(self, graph: Optional[MultiDiGraph]) -> None:
+    def set_graph(self, graph: Optional["MultiDiGraph"]) -> None:
         """Associate/Disassociate graph with/from a node."""
         self._graph = graph
 
@@ -47,16 +62,37 @@ class GraphAssociationMixin:
 class Signature(GraphAssociationMixin):
     """Analyze function signature."""
 
-    def __init__(self, func: Callable[..., Any], graph: Optional[MultiDiGraph] = None) -> None:
+    __slots__ = ("_func", "_name", "_params", "_return_type")
+
+    def __init__(self, func: Callable[..., Any], graph: Optional["MultiDiGraph"] = None) -> None:
         """Signature constructor."""
+        signature = inspect.signature(func)
+
         self._func = func
         self._name = func.__name__
-        self._signature = inspect.signature(func)
-        self._params = dict(self._signature.parameters)
-        self._return_type = self._signature.return_annotation
+        self._params = dict(signature.parameters)
+        self._return_type = signature.return_annotation
 
         super().__init__(graph=graph)
 
+    @classmethod
+    def from_signature(
+        cls: Type[S],
+        func: Callable[..., Any],
+        params: Dict[str, inspect.Parameter],
+        return_type: Any,
+        graph: Optional["MultiDiGraph"] = None,
+    ) -> S:
+        """Build node from an already introspected signature."""
+        node = cls.__new__(cls)
+        node._func = func
+        node._name = func.__name__
+        node._params = params
+        node._return_type = return_type
+        node._graph = graph
+
+        return node
+
     @property
     def name(self) -> str:
         """Returns the name of the wrapped object."""
@@ -67,6 +103,11 @@ class Signature(GraphAssociationMixin):
         """Get output type."""
         return self._return_type
 
+    @property
+    def return_type(self) -> Any:
+        """Return annotation of the wrapped function."""
+        return self._return_type
+
     @property
     def params(self) -> Dict[str, inspect.Parameter]:
         """Get all function input parameters."""
@@ -76,16 +117,45 @@ class Signature(GraphAssociationMixin):
 class GearNode(Signature):
     """Node representing data transformation."""
 
+    __slots__ = ()
+
     shape = "circle"
 
-    def __init__(self, func: Callable[..., Any], graph: Optional[MultiDiGraph] = None) -> None:
+    def __init__(self, func: Callable[..., Any], graph: Optional["MultiDiGraph"] = None) -> None:
         """Gear constructor."""
         super().__init__(func, graph=graph)
 
     def __call__(self, *args: Any, **kwds: Any) -> Any:
         """Execute the given callable with in going nodes as parameters."""
-        params = self.input_values
+        return self.call(**self.input_values)
 
+    @property
+    def func(self) -> Callable[..., Any]:
+        """Return the wrapped callable."""
+        return self._func
+
+    @property
+    def resources(self) -> Resources:
+        """Resources declared by the gear."""
+        return get_resources(self._func)
+
+    @property
+    def retry(self) -> Retry:
+        """Retry policy declared by the gear."""
+        return get_retry(self._func)
+
+    @property
+    def pure(self) -> bool:
+        """Gear is free of side effects and may be executed speculatively."""
+        return is_pure(self._func)
+
+    @property
+    def chunking(self) -> Optional[Chunking]:
+        """Chunking declared by the gear, `None` when it requires whole inputs."""
+        return get_chunking(self._func)
+
+    def call(self, **params: Any) -> Any:
+        """Execute the given callable with explicit parameters."""
         try:
             result = self._func(**params)
         except BaseException as e:
@@ -93,6 +163,13 @@ class GearNode(Signature):
 
         return result
 
+    def detach(self) -> "GearNode":
+        """Return a copy of the gear without associated graph, cheap to ship to workers."""
+        gear = copy.copy(self)
+        gear.set_graph(None)
+
+        return gear
+
     def __repr__(self) -> str:
         """String representation of a gear."""
         return self.name
@@ -112,23 +189,76 @@ class GearNode(Signature):
         return params
 
 
+class MapGear(GearNode):
+    """Gear applied to every element of a collection input, engines may execute elements in parallel."""
+
+    __slots__ = ("_item",)
+
+    def __init__(self, func: Callable[..., Any], item: Optional[str] = None, graph: Optional["MultiDiGraph"] = None) -> None:
+        """Map gear constructor, `item` is the parameter receiving elements and defaults to the first one."""
+        super().__init__(func, graph=graph)
+
+        if item is None:
+            if not self._params:
+                raise ValueError(f"mapped gear {self._name} has no parameter to receive elements")
+
+            item = next(iter(self._params))
+
+        if item not in self._params:
+            raise ValueError(f"mapped gear {self._name} has no parameter `{item}`")
+
+        self._item = item
+
+    @property
+    def item(self) -> str:
+        """Parameter receiving elements of the collection."""
+        return self._item
+
+    @property
+    def output_type(self) -> Any:
+        """Get output type, results of all elements are gathered into a list."""
+        return List[Any] if self._return_type is inspect.Parameter.empty else List[self._return_type]  # type: ignore
+
+    def expand(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Split gear parameters into parameters of every element."""
+        return [{**params, self._item: element} for element in params[self._item]]
+
+
 class DataNode(GraphAssociationMixin):
     """Node representing data."""
 
+    __slots__ = ("_name", "_value", "_annotation", "_validation", "_checker")
+
     def __init__(
         self,
         name: str,
         value: Optional[Any],
         annotation: type,
-        graph: Optional[MultiDiGraph] = None,
+        graph: Optional["MultiDiGraph"] = None,
+        validation: str = "fast",
     ):
         """Data node constructor."""
         self._name: str = name
         self._value: Optional[Any] = value
         self._annotation: type = annotation
+        self._validation = validation
+        self._checker: Optional[Checker] = None if validation == "off" else compile_checker(annotation, validation)
 
         super().__init__(graph=graph)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle node without its compiled checker."""
+        return {"_graph": self._graph, "_name": self._name, "_value": self._value, "_annotation": self._annotation, "_validation": self._validation}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore node and compile its checker again."""
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+        self._checker = None
+        if self._validation != "off":
+            self._checker = compile_checker(self._annotation, self._validation)
+
     def __repr__(self) -> str:
         """String representation."""
         if self._graph is None:
@@ -179,9 +309,13 @@ class DataNode(GraphAssociationMixin):
         """Check if the data node is empty."""
         return self._value is None
 
+    def clear(self) -> None:
+        """Drop node value."""
+        self._value = None
+
     def set_value(self, value: Any) -> None:
         """Sets node value."""
-        if type(value) != self._annotation:
+        if self._checker is not None and not self._checker(value):
             raise TypeError(f"trying to set {type(value)} to {self.annotation}")
 
         self._value = value
@@ -190,18 +324,24 @@ class DataNode(GraphAssociationMixin):
 class GearInput(DataNode):
     """Input to the gear."""
 
+    __slots__ = ()
+
     shape = "invhouse"
 
 
 class GearOutput(DataNode):
     """Output of a gear without additional depedency."""
 
+    __slots__ = ()
+
     shape = "house"
 
 
 class GearInputOutput(DataNode):
     """Gear input and output node."""
 
+    __slots__ = ()
+
     shape = "note"
 
 
@@ -1,6 +1,9 @@
 import contextlib
+import hashlib
 import os
 import shutil
+import tempfile
+import zipfile
 from pathlib import Path
 from typing import Iterator, List, Optional, Union
 
@@ -23,6 +26,11 @@ class Package:
 
     SETUP_NAME = "setup.py"
     BUILD_EGG_CMD = "python setup.py bdist_egg"
+    FINGERPRINT_NAME = ".fingerprint"
+    IGNORED_DIRS = {"build", "dist", "__pycache__"}
+    IGNORED_SUFFIXES = {".lock", ".pyc", ".pyo", ".egg", ".zip"}
+    EXCLUDED_PACKAGES = {"tests"}
+    MANIFESTS = ("setup.py", "setup.cfg", "pyproject.toml", "MANIFEST.in", "requirements*.txt")
 
     def __init__(self, dist_dir: Path = Path("dist")) -> None:
         """Constructor for packager."""
@@ -60,17 +68,78 @@ class Package:
 
         return []
 
+    def sources(self) -> List[Path]:
+        """Return files the package is built from, relative to its root: python packages and dependency manifests."""
+        if self._cwd is None:
+            raise ValueError("cannot find setup.py")
+
+        ignored_dirs = Package.IGNORED_DIRS | {self._dist_dir.name}
+        files: List[Path] = sorted(child.relative_to(self._cwd) for pattern in Package.MANIFESTS for child in self._cwd.glob(pattern) if child.is_file())
+
+        for package in self.packages():
+            for directory, dirs, names in os.walk(self._cwd / package):
+                dirs[:] = sorted(d for d in dirs if d not in ignored_dirs and not d.startswith("."))
+                files += [
+                    Path(directory, name).relative_to(self._cwd)
+                    for name in sorted(names)
+                    if not name.startswith(".") and Path(name).suffix not in Package.IGNORED_SUFFIXES
+                ]
+
+        return files
+
+    def packages(self) -> List[str]:
+        """Return top level python packages shipped with the package."""
+        if self._cwd is None:
+            raise ValueError("cannot find setup.py")
+
+        return sorted(
+            child.name for child in self._cwd.iterdir() if (child / "__init__.py").exists() and child.name not in Package.EXCLUDED_PACKAGES
+        )
+
+    def fingerprint(self, build_cmd: Optional[str] = None) -> str:
+        """Content hash of package sources, dependency manifests and the build command."""
+        if self._cwd is None:
+            raise ValueError("cannot find setup.py")
+
+        digest = hashlib.sha256((Package.BUILD_EGG_CMD if build_cmd is None else build_cmd).encode("utf-8"))
+        for path in self.sources():
+            digest.update(str(path).encode("utf-8"))
+            digest.update((self._cwd / path).read_bytes())
+
+        return digest.hexdigest()
+
+    def _cached_egg(self, fingerprint: str) -> Optional[Path]:
+        """Return previously built egg if it was built from the same sources."""
+        marker = self._dist_dir / Package.FINGERPRINT_NAME
+        if not marker.exists() or marker.read_text() != fingerprint:
+            return None
+
+        eggs = [_child for _child in self.children(self._dist_dir) if _child.endswith(".egg")]
+        if len(eggs) != 1:
+            return None
+
+        return Path(self._cwd / self._dist_dir / eggs[0])  # type: ignore
+
     def make_egg(self) -> Path:
-        """Creates an egg."""
+        """Creates an egg, reusing the previous build when sources did not change."""
         if self._cwd is None:
             raise ValueError("cannot find setup.py")
 
         with chdir(self._cwd), FileLock(str(self._cwd / "egg.lock")):
+            fingerprint = self.fingerprint()
+
+            cached = self._cached_egg(fingerprint)
+            if cached is not None:
+                return cached
+
             if self._dist_dir.exists():
                 shutil.rmtree(self._dist_dir)
 
             os.system(Package.BUILD_EGG_CMD)
 
+            if self._dist_dir.exists():
+                (self._dist_dir / Package.FINGERPRINT_NAME).write_text(fingerprint)
+
         _results: List[Path] = [Path(self._cwd / self._dist_dir / _child) for _child in self.children(self._dist_dir) if _child.endswith(".egg")]
 
         if len(_results) > 1:
@@ -80,3 +149,43 @@ class Package:
             raise ValueError("egg was not built")
 
         return _results[0]
+
+    def make_zip(self) -> Path:
+        """Creates an importable zip of the package in-process, named after its fingerprint."""
+        if self._cwd is None:
+            raise ValueError("cannot find setup.py")
+
+        fingerprint = self.fingerprint(build_cmd="zip")
+        target = self._cwd / self._dist_dir / f"{self._cwd.name}-{fingerprint[:16]}.zip"
+
+        if target.exists():
+            return target
+
+        with FileLock(str(self._cwd / "zip.lock")):
+            # NOTE: Another process might have built the same fingerprint while we waited.
+            if target.exists():
+                return target
+
+            packages = set(self.packages())
+            target.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+            os.close(fd)
+
+            try:
+                with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                    for path in self.sources():
+                        if path.parts[0] in packages:
+                            archive.write(self._cwd / path, arcname=str(path))
+
+                os.replace(tmp, target)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+            # NOTE: Zips of earlier fingerprints are never served again.
+            for stale in target.parent.glob(f"{self._cwd.name}-*.zip"):
+                if stale != target:
+                    stale.unlink()
+
+        return target
@@ -1,19 +1,266 @@
-from typing import Any, Dict
+import html
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import networkx
 
 from flowlayer.core.api import NetworkPlotAPI
-from flowlayer.core.nodes import NetworkNode
+from flowlayer.core.nodes import GearInputOutput, GearNode, NetworkNode
+
+# NOTE: Larger graphs are plotted in fast mode unless asked otherwise, graphviz does not cope with them.
+FAST_PLOT_NODES = 500
+DETAIL_LEVELS = ("nodes", "gears", "modules")
+GEAR_DETAIL_NODES = 5000
+
+NODE_WIDTH = 140
+NODE_HEIGHT = 36
+NODE_GAP = 24
+LEVEL_GAP = 64
+
+SketchNode = Tuple[str, str, Optional[str]]
+SketchEdge = Tuple[str, str, str]
+
+
+class Sketch:
+    """Graph reduced to a level of detail, nodes carry label, shape and cluster."""
+
+    def __init__(self, name: str) -> None:
+        """Sketch constructor."""
+        self._name = name
+        self._nodes: Dict[str, SketchNode] = {}
+        self._edges: Dict[Tuple[str, str], List[str]] = {}
+
+    @property
+    def name(self) -> str:
+        """Name of the sketched graph."""
+        return self._name
+
+    @property
+    def nodes(self) -> Dict[str, SketchNode]:
+        """Nodes by their identifier."""
+        return self._nodes
+
+    @property
+    def edges(self) -> List[SketchEdge]:
+        """Edges with labels of all data they carry."""
+        return [(src, dst, ", ".join(labels)) for (src, dst), labels in self._edges.items()]
+
+    def add_node(self, key: str, label: str, shape: str, cluster: Optional[str] = None) -> None:
+        """Add node, existing nodes are kept."""
+        self._nodes.setdefault(key, (label, shape, cluster))
+
+    def add_edge(self, src: str, dst: str, label: str = "") -> None:
+        """Add edge, parallel edges merge their labels."""
+        labels = self._edges.setdefault((src, dst), [])
+        if label and label not in labels:
+            labels.append(label)
+
+    def levels(self) -> Dict[str, int]:
+        """Longest path layering, nodes of a cycle share a level."""
+        graph = networkx.DiGraph()
+        graph.add_nodes_from(self._nodes)
+        graph.add_edges_from((src, dst) for src, dst in self._edges if src != dst)
+
+        condensed = networkx.condensation(graph)
+        component_levels: Dict[int, int] = {}
+        for component in networkx.topological_sort(condensed):
+            component_levels[component] = max((component_levels[p] + 1 for p in condensed.predecessors(component)), default=0)
+
+        return {node: component_levels[component] for node, component in condensed.graph["mapping"].items()}
+
+
+def _module(gear: GearNode) -> str:
+    """Module a gear function is defined in, gears are clustered by it."""
+    return str(getattr(gear.func, "__module__", None) or "__main__")
+
+
+def _node_key(node: NetworkNode, keys: Dict[NetworkNode, str]) -> str:
+    """Identifier of a node, assigned on first use."""
+    return keys.setdefault(node, f"n{len(keys)}")
+
+
+def sketch_nodes(graph: networkx.DiGraph) -> Sketch:
+    """Sketch every node of a graph, labels are node names."""
+    sketch = Sketch(str(graph.name))
+    keys: Dict[NetworkNode, str] = {}
+
+    node: NetworkNode
+    for node in graph.nodes:  # type: ignore
+        cluster = _module(node) if isinstance(node, GearNode) else None
+        sketch.add_node(_node_key(node, keys), node.name, node.shape, cluster)  # type: ignore
+
+    for src, dst in graph.edges():  # type: ignore
+        sketch.add_edge(keys[src], keys[dst])
+
+    return sketch
+
+
+def sketch_gears(graph: networkx.DiGraph) -> Sketch:
+    """Sketch gears of a graph, intermediate data nodes collapse into edges between gears."""
+    sketch = Sketch(str(graph.name))
+    keys: Dict[NetworkNode, str] = {}
+
+    node: NetworkNode
+    for node in graph.nodes:  # type: ignore
+        if isinstance(node, GearNode):
+            sketch.add_node(_node_key(node, keys), node.name, node.shape, _module(node))
+        elif not isinstance(node, GearInputOutput):
+            sketch.add_node(_node_key(node, keys), node.name, node.shape)  # type: ignore
+
+    for src, dst in graph.edges():  # type: ignore
+        if isinstance(dst, GearInputOutput):
+            for consumer in graph.successors(dst):  # type: ignore
+                sketch.add_edge(keys[src], keys[consumer], dst.name)
+        elif not isinstance(src, GearInputOutput):
+            sketch.add_edge(keys[src], keys[dst])
+
+    return sketch
+
+
+def sketch_modules(graph: networkx.DiGraph) -> Sketch:
+    """Sketch modules of gears, edges carry number of data nodes passed between modules."""
+    sketch = Sketch(str(graph.name))
+    counts: Dict[Tuple[str, str], int] = {}
+
+    node: NetworkNode
+    for node in graph.nodes:  # type: ignore
+        if isinstance(node, GearNode):
+            sketch.add_node(_module(node), _module(node), "box")
+
+    for data_node in graph.nodes:  # type: ignore
+        if not isinstance(data_node, GearInputOutput):
+            continue
+
+        for producer in graph.predecessors(data_node):  # type: ignore
+            for consumer in graph.successors(data_node):  # type: ignore
+                key = (_module(producer), _module(consumer))
+                if key[0] != key[1]:
+                    counts[key] = counts.get(key, 0) + 1
+
+    for (src, dst), count in counts.items():
+        sketch.add_edge(src, dst, str(count))
+
+    return sketch
+
+
+SKETCHES = {"nodes": sketch_nodes, "gears": sketch_gears, "modules": sketch_modules}
+
+
+def _quote(text: str) -> str:
+    """Quote DOT identifier."""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def sketch_to_dot(sketch: Sketch) -> str:
+    """Render sketch as DOT text."""
+    lines = [f"digraph {_quote(sketch.name)} {{", "  rankdir=TB;", "  node [fontsize=10];"]
+
+    clusters: Dict[Optional[str], List[str]] = {}
+    for key, (label, shape, cluster) in sketch.nodes.items():
+        clusters.setdefault(cluster, []).append(f"{_quote(key)} [label={_quote(label)}, shape={shape}];")
+
+    for i, (cluster, statements) in enumerate(clusters.items()):
+        if cluster is None:
+            lines.extend(f"  {statement}" for statement in statements)
+            continue
+
+        lines.append(f"  subgraph {_quote(f'cluster_{i}')} {{")
+        lines.append(f"    label={_quote(cluster)};")
+        lines.extend(f"    {statement}" for statement in statements)
+        lines.append("  }")
+
+    for src, dst, label in sketch.edges:
+        attributes = f" [label={_quote(label)}]" if label else ""
+        lines.append(f"  {_quote(src)} -> {_quote(dst)}{attributes};")
+
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _svg_node(x: int, y: int, label: str, shape: str) -> str:
+    """Render node as SVG elements."""
+    text = html.escape(label)
+    cx, cy = x + NODE_WIDTH // 2, y + NODE_HEIGHT // 2
+
+    if shape == "circle":
+        outline = f'<ellipse cx="{cx}" cy="{cy}" rx="{NODE_WIDTH // 2}" ry="{NODE_HEIGHT // 2}" class="gear"/>'
+    else:
+        outline = f'<rect x="{x}" y="{y}" width="{NODE_WIDTH}" height="{NODE_HEIGHT}" class="data"/>'
+
+    return f'{outline}<text x="{cx}" y="{cy}">{text}</text>'
+
+
+def sketch_to_svg(sketch: Sketch) -> str:
+    """Render sketch as SVG with a layered layout, no graphviz is involved."""
+    levels = sketch.levels()
+
+    positions: Dict[str, Tuple[int, int]] = {}
+    widths: Dict[int, int] = {}
+    for key in sketch.nodes:
+        level = levels[key]
+        column = widths.get(level, 0)
+        widths[level] = column + 1
+        positions[key] = (NODE_GAP + column * (NODE_WIDTH + NODE_GAP), NODE_GAP + level * (NODE_HEIGHT + LEVEL_GAP))
+
+    width = NODE_GAP + max(widths.values(), default=0) * (NODE_WIDTH + NODE_GAP)
+    height = NODE_GAP + (max(widths, default=-1) + 1) * (NODE_HEIGHT + LEVEL_GAP)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        "<style>.gear{fill:#e8f0fe;stroke:#3c6eb4}.data{fill:#fff8e1;stroke:#b48a3c}"
+        "text{font:10px sans-serif;text-anchor:middle;dominant-baseline:middle}line{stroke:#777}</style>",
+        '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="6" markerHeight="6" orient="auto">'
+        '<path d="M0,0 L10,5 L0,10 z" fill="#777"/></marker></defs>',
+    ]
+
+    for src, dst, label in sketch.edges:
+        (x1, y1), (x2, y2) = positions[src], positions[dst]
+        x1, y1, x2, y2 = x1 + NODE_WIDTH // 2, y1 + NODE_HEIGHT, x2 + NODE_WIDTH // 2, y2
+        parts.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" marker-end="url(#arrow)"/>')
+        if label:
+            parts.append(f'<text x="{(x1 + x2) // 2}" y="{(y1 + y2) // 2}">{html.escape(label)}</text>')
+
+    for key, (label, shape, _) in sketch.nodes.items():
+        parts.append(_svg_node(*positions[key], label, shape))
+
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
 
 
 class NetworkPlot(NetworkPlotAPI):
     """Network plotting utility."""
 
-    def __init__(self, graph: networkx.DiGraph) -> None:
-        """Network plot constructor."""
-        import pydot
+    def __init__(self, graph: networkx.DiGraph, fast: Optional[bool] = None, detail: Optional[str] = None) -> None:
+        """Network plot constructor.
+
+        Fast plots skip pydot and graphviz, they render DOT text or SVG of the graph reduced to `detail`.
+        Both default by size of the graph.
+        """
+        if detail is not None and detail not in DETAIL_LEVELS:
+            raise ValueError(f"unknown detail `{detail}` - use one of {DETAIL_LEVELS}")
 
         self._graph: networkx.DiGraph = graph
+        self._fast = graph.number_of_nodes() > FAST_PLOT_NODES if fast is None else fast
+        self._detail = detail or self._default_detail()
+        self._sketch: Optional[Sketch] = None
+        self._pydot_graph: Any = None
+
+        if self._fast:
+            self._meta: Dict[str, Any] = {"name": graph.name, "detail": self._detail, "nodes": graph.number_of_nodes(), "edges": graph.number_of_edges()}
+        else:
+            self._build_pydot()
+
+    def _default_detail(self) -> str:
+        """Most detailed level a graph of this size is readable at."""
+        if not self._fast:
+            return "nodes"
+
+        gears = sum(1 for node in self._graph.nodes if isinstance(node, GearNode))
+        return "gears" if gears <= GEAR_DETAIL_NODES else "modules"
+
+    def _build_pydot(self) -> None:
+        """Build full pydot graph."""
+        import pydot
 
         g = pydot.Dot(graph_type="digraph", rank="same")
 
@@ -29,7 +276,25 @@ class NetworkPlot(NetworkPlotAPI):
             g.add_edge(edge)  # type: ignore
 
         self._pydot_graph = g
-        self._meta: Dict[str, Any] = g.obj_dict  # type: ignore
+        self._meta = g.obj_dict  # type: ignore
+
+    @property
+    def fast(self) -> bool:
+        """Check if the plot is rendered without graphviz."""
+        return self._fast
+
+    @property
+    def detail(self) -> str:
+        """Level of detail of fast plots."""
+        return self._detail
+
+    @property
+    def sketch(self) -> Sketch:
+        """Graph reduced to the level of detail."""
+        if self._sketch is None:
+            self._sketch = SKETCHES[self._detail](self._graph)
+
+        return self._sketch
 
     @property
     def meta(self) -> Dict[str, Any]:
@@ -39,14 +304,44 @@ class NetworkPlot(NetworkPlotAPI):
     @property
     def show(self) -> None:
         """Render pydot for viewing in Jupyter notebook."""
-        from IPython.display import Image, display
+        from IPython.display import SVG, Image, display
+
+        if self._fast:
+            display(SVG(self.to_svg()))
+            return
 
-        _png: bytes = self._pydot_graph.create_png()  # type: ignore
+        _png: bytes = self._pydot_graph.create_png()
         display(Image(_png))
 
+    def to_dot(self) -> str:
+        """Return plot as DOT text."""
+        if self._fast:
+            return sketch_to_dot(self.sketch)
+
+        dot: str = self._pydot_graph.to_string()
+        return dot
+
+    def to_svg(self) -> str:
+        """Return plot as SVG, fast plots are laid out without graphviz."""
+        if self._fast:
+            return sketch_to_svg(self.sketch)
+
+        svg: bytes = self._pydot_graph.create_svg()
+        return svg.decode("utf-8")
+
     def to_file(self, filename: str) -> None:
-        """Write plot to a file."""
+        """Write plot to a file, fast plots are written as `.svg` or `.dot`."""
         if filename is None:
             raise ValueError("No filename provided.")
 
-        self._pydot_graph.write_png(filename)  # type: ignore
+        if not self._fast:
+            self._pydot_graph.write_png(filename)
+            return
+
+        suffix = Path(filename).suffix
+        if suffix == ".svg":
+            Path(filename).write_text(self.to_svg())
+        elif suffix in (".dot", ".gv"):
+            Path(filename).write_text(self.to_dot())
+        else:
+            raise ValueError(f"fast plots are written as `.svg` or `.dot`, not `{suffix}`")
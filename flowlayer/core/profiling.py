@@ -0,0 +1,221 @@
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+# NOTE: Wall clock start and end of a gear, its peak of traced allocations and high-water RSS of the executing process.
+Measurement = Tuple[float, float, int, int]
+
+SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
+def rss_high_water() -> int:
+    """High-water resident set size of the current process in bytes, `0` where unknown."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NOTE: Linux reports kilobytes, macOS bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def value_size(value: Any, depth: int = 2) -> int:
+    """Approximate size of a value in bytes, buffers of arrays are counted and containers are walked `depth` levels deep."""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+
+    if isinstance(value, dict):
+        return size + sum(value_size(k, depth - 1) + value_size(v, depth - 1) for k, v in value.items())
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(value_size(item, depth - 1) for item in value)
+
+    return size
+
+
+def profiled(call: Callable[..., Any], *args: Any) -> Tuple[Any, Measurement]:
+    """Execute `call` tracing allocations of the calling process, returns its result with the measurement."""
+    tracing = tracemalloc.is_tracing()
+    resettable = hasattr(tracemalloc, "reset_peak")
+
+    # NOTE: Python 3.8 cannot reset the peak, tracing restarts so the peak covers only the call.
+    if tracing and not resettable:
+        tracemalloc.stop()
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    baseline, _ = tracemalloc.get_traced_memory()
+    if resettable:
+        tracemalloc.reset_peak()
+
+    started = time.time()
+    try:
+        result = call(*args)
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        if not tracing or not resettable:
+            tracemalloc.stop()
+
+        if tracing and not resettable:
+            tracemalloc.start()
+
+    return result, (started, time.time(), max(peak - baseline, 0), rss_high_water())
+
+
+def format_size(size: float) -> str:
+    """Format byte size with a binary unit."""
+    for unit in SIZE_UNITS:
+        if abs(size) < 1024 or unit == SIZE_UNITS[-1]:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+        size /= 1024
+
+    return f"{size:.1f} {SIZE_UNITS[-1]}"
+
+
+class GearProfile:
+    """Memory used by a single gear execution."""
+
+    __slots__ = ("_gear", "_started", "_finished", "_peak_bytes", "_rss_bytes", "_value_bytes")
+
+    def __init__(self, gear: str, measurement: Measurement, value_bytes: int) -> None:
+        """Gear profile constructor."""
+        self._gear = gear
+        self._started, self._finished, self._peak_bytes, self._rss_bytes = measurement
+        self._value_bytes = value_bytes
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"GearProfile({self._gear}, peak={format_size(self._peak_bytes)}, value={format_size(self._value_bytes)})"
+
+    @property
+    def gear(self) -> str:
+        """Name of the gear."""
+        return self._gear
+
+    @property
+    def started(self) -> float:
+        """Wall clock start of the execution."""
+        return self._started
+
+    @property
+    def finished(self) -> float:
+        """Wall clock end of the execution."""
+        return self._finished
+
+    @property
+    def seconds(self) -> float:
+        """Duration of the execution."""
+        return self._finished - self._started
+
+    @property
+    def peak_bytes(self) -> int:
+        """Peak of memory allocated during the execution."""
+        return self._peak_bytes
+
+    @property
+    def rss_bytes(self) -> int:
+        """High-water RSS of the executing process after the execution."""
+        return self._rss_bytes
+
+    @property
+    def value_bytes(self) -> int:
+        """Size of the produced value."""
+        return self._value_bytes
+
+
+class MemoryProfile:
+    """Memory profile of a run, gears are recorded as they finish."""
+
+    def __init__(self, run_id: str, network: str) -> None:
+        """Memory profile constructor."""
+        self._run_id = run_id
+        self._network = network
+        self._started = time.time()
+        self._gears: List[GearProfile] = []
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"MemoryProfile({self._network}, {self._run_id}, high_water={format_size(self.high_water)})"
+
+    @property
+    def run_id(self) -> str:
+        """Identifier of the profiled run."""
+        return self._run_id
+
+    @property
+    def network(self) -> str:
+        """Name of the profiled network."""
+        return self._network
+
+    @property
+    def started(self) -> float:
+        """Wall clock start of the run."""
+        return self._started
+
+    @property
+    def gears(self) -> List[GearProfile]:
+        """Profiles of gear executions in order of completion."""
+        return list(self._gears)
+
+    def record(self, gear: str, measurement: Measurement, value: Any) -> GearProfile:
+        """Record finished gear execution and its produced value."""
+        profile = GearProfile(gear, measurement, value_size(value))
+        self._gears.append(profile)
+        return profile
+
+    def ranked(self, key: str = "peak_bytes") -> List[GearProfile]:
+        """Gear profiles ranked by `key`, largest first."""
+        return sorted(self._gears, key=lambda profile: getattr(profile, key), reverse=True)
+
+    def timeline(self) -> List[Tuple[float, int]]:
+        """Estimated memory over the run as seconds since its start and bytes.
+
+        Running gears hold their peak, produced values are held until the run ends.
+        """
+        events: Dict[float, int] = {}
+        for profile in self._gears:
+            events[profile.started] = events.get(profile.started, 0) + profile.peak_bytes
+            events[profile.finished] = events.get(profile.finished, 0) - profile.peak_bytes + profile.value_bytes
+
+        timeline: List[Tuple[float, int]] = []
+        level = 0
+        for moment in sorted(events):
+            level += events[moment]
+            timeline.append((moment - self._started, level))
+
+        return timeline
+
+    @property
+    def high_water(self) -> int:
+        """Estimated peak memory of the run."""
+        return max((level for _, level in self.timeline()), default=0)
+
+    def table(self, key: str = "peak_bytes") -> str:
+        """Ranked table of gear executions."""
+        rows = [("#", "gear", "peak", "value", "seconds", "rss")]
+        for rank, profile in enumerate(self.ranked(key), 1):
+            rows.append(
+                (
+                    str(rank),
+                    profile.gear,
+                    format_size(profile.peak_bytes),
+                    format_size(profile.value_bytes),
+                    f"{profile.seconds:.3f}",
+                    format_size(profile.rss_bytes),
+                )
+            )
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = ["  ".join(cell.ljust(width) if i == 1 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))) for row in rows]
+        lines.append(f"high-water {format_size(self.high_water)}")
+
+        return "\n".join(line.rstrip() for line in lines) + "\n"
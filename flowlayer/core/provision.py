@@ -0,0 +1,73 @@
+import hashlib
+import importlib
+import os
+import subprocess  # nosec
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+from distributed import WorkerPlugin  # type: ignore[import]
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "flowlayer" / "provision"
+
+
+def environment_digest(requirements: List[str], egg_path: Optional[Path]) -> str:
+    """Content hash of a worker environment."""
+    digest = hashlib.sha256()
+
+    for requirement in sorted(requirements):
+        digest.update(requirement.encode("utf-8"))
+
+    if egg_path is not None:
+        digest.update(Path(egg_path).read_bytes())
+
+    return digest.hexdigest()
+
+
+def is_provisioned(digest: str, cache_dir: str) -> bool:
+    """Check if a worker already holds an environment, executed on workers."""
+    return (Path(cache_dir) / digest / "ready").exists()
+
+
+class Provision(WorkerPlugin):  # type: ignore[misc]
+    """Worker plugin which installs an environment once per content hash."""
+
+    name = "flowlayer-provision"
+
+    def __init__(self, digest: str, cache_dir: str, requirements: List[str], egg_name: Optional[str], egg_data: Optional[bytes]) -> None:
+        """Provision plugin constructor, `egg_data` is omitted when all workers hold the environment."""
+        self.digest = digest
+        self.cache_dir = cache_dir
+        self.requirements = requirements
+        self.egg_name = egg_name
+        self.egg_data = egg_data
+
+    def setup(self, worker: Any) -> None:
+        """Install environment unless a worker already holds it and activate it."""
+        directory = Path(self.cache_dir) / self.digest
+
+        if not is_provisioned(self.digest, self.cache_dir):
+            if self.egg_name is not None and self.egg_data is None:
+                raise RuntimeError(f"environment {self.digest} is missing on {worker.address} - run engine setup again")
+
+            directory.mkdir(parents=True, exist_ok=True)
+
+            if self.requirements:
+                subprocess.check_call([sys.executable, "-m", "pip", "install", *self.requirements])  # nosec
+
+            if self.egg_name is not None and self.egg_data is not None:
+                (directory / self.egg_name).write_bytes(self.egg_data)
+
+            (directory / "ready").touch()
+
+        if self.egg_name is not None:
+            egg = str(directory / self.egg_name)
+            if egg not in sys.path:
+                sys.path.insert(0, egg)
+
+            importlib.invalidate_caches()
+
+
+def resolve_cache_dir(config_value: Optional[str]) -> str:
+    """Resolve worker cache directory."""
+    return str(config_value or os.getenv("FLOWLAYER_CACHE_DIR") or DEFAULT_CACHE_DIR)
@@ -0,0 +1,178 @@
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from flowlayer.core.artifact import NetworkArtifact
+
+if TYPE_CHECKING:
+    from flowlayer.core.api import EngineAPI
+    from flowlayer.core.network import Network
+
+ARTIFACT_SUFFIX = ".flow"
+
+# NOTE: Modification time and size of an artifact file, a change triggers reload.
+FileStamp = Tuple[int, int]
+VersionKey = Tuple[Tuple[int, Union[int, str]], ...]
+
+logger = logging.getLogger(__name__)
+
+
+def version_key(version: str) -> VersionKey:
+    """Sort key of a version, numeric parts compare as numbers."""
+    return tuple((0, int(part)) if part.isdigit() else (1, part) for part in version.split("."))
+
+
+class NetworkRegistry:
+    """Directory of published network artifacts with a warm in-process cache."""
+
+    def __init__(self, path: Union[str, Path], interval: float = 5.0) -> None:
+        """Network registry constructor, `interval` is the polling period in seconds."""
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._interval = interval
+        self._engine: Optional["EngineAPI"] = None
+
+        self._stamps: Dict[Path, FileStamp] = {}
+        self._networks: Dict[str, Dict[str, "Network"]] = {}
+        self._lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "NetworkRegistry":
+        """Start watching the registry."""
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop watching the registry."""
+        self.stop()
+
+    @property
+    def path(self) -> Path:
+        """Registry directory."""
+        return self._path
+
+    @property
+    def engine(self) -> Optional["EngineAPI"]:
+        """Engine executing loaded networks."""
+        return self._engine
+
+    def bind(self, engine: "EngineAPI") -> None:
+        """Execute loaded networks with an engine."""
+        with self._lock:
+            self._engine = engine
+            for versions in self._networks.values():
+                for network in versions.values():
+                    network._engine = engine
+
+    @property
+    def is_running(self) -> bool:
+        """Check if registry is watched in the background."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def publish(self, network: "Network") -> Path:
+        """Store network artifact, readers never observe a partially written file."""
+        directory = self._path / network.name
+        directory.mkdir(parents=True, exist_ok=True)
+
+        target = directory / f"{network.version}{ARTIFACT_SUFFIX}"
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(network.export().to_bytes())
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        return target
+
+    def refresh(self) -> List[str]:
+        """Load new and changed artifacts, returns `name-version` of every reloaded network."""
+        with self._lock:
+            stamps: Dict[Path, FileStamp] = {}
+            networks = {name: dict(versions) for name, versions in self._networks.items()}
+            reloaded: List[str] = []
+
+            for file in sorted(self._path.glob(f"*/*{ARTIFACT_SUFFIX}")):
+                stat = file.stat()
+                stamps[file] = (stat.st_mtime_ns, stat.st_size)
+                if self._stamps.get(file) == stamps[file]:
+                    continue
+
+                try:
+                    artifact = NetworkArtifact.from_bytes(file.read_bytes())
+                    network = artifact.build() if self._engine is None else artifact.build(engine=self._engine)
+                except Exception:
+                    # NOTE: Keep serving the previously loaded version, the file is retried once it changes.
+                    logger.exception(f"cannot load network artifact {file}")
+                    continue
+
+                networks.setdefault(artifact.name, {})[artifact.version] = network
+                reloaded.append(f"{artifact.name}-{artifact.version}")
+
+            for file in set(self._stamps) - set(stamps):
+                versions = networks.get(file.parent.name, {})
+                versions.pop(file.name[: -len(ARTIFACT_SUFFIX)], None)
+                if not versions:
+                    networks.pop(file.parent.name, None)
+
+            # NOTE: Swap the whole mapping at once, runs already holding a network keep using it.
+            self._networks = networks
+            self._stamps = stamps
+
+        return reloaded
+
+    def versions(self, name: str) -> List[str]:
+        """Loaded versions of a network, oldest first."""
+        return sorted(self._networks.get(name, {}), key=version_key)
+
+    def get(self, name: str, version: Optional[str] = None) -> "Network":
+        """Return loaded network, the latest version unless `version` is given."""
+        versions = self._networks.get(name)
+        if not versions:
+            raise KeyError(f"network `{name}` is not registered")
+
+        if version is None:
+            version = max(versions, key=version_key)
+
+        if version not in versions:
+            raise KeyError(f"network `{name}` has no version `{version}`")
+
+        return versions[version]
+
+    def networks(self) -> List["Network"]:
+        """Latest version of every loaded network."""
+        return [self.get(name) for name in sorted(self._networks)]
+
+    def _loop(self) -> None:
+        """Poll the registry until stopped."""
+        while not self._stop.wait(self._interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("network registry refresh failed")
+
+    def start(self) -> None:
+        """Load registry and keep polling it in the background."""
+        if self.is_running:
+            raise ValueError("registry already watched")
+
+        self.refresh()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="flowlayer-registry", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        if self._thread is None:
+            raise ValueError("registry not watched")
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
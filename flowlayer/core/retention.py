@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from flowlayer.core.api import FeatureStoreAPI
+
+RetentionEntry = Tuple[int, str, Optional[str]]
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionPolicy:
+    """Describe which stored features of a network are kept."""
+
+    def __init__(self, max_age: Optional[int] = None, max_count: Optional[int] = None, latest_per_entity: bool = False) -> None:
+        """Retention policy constructor, `max_age` is given in milliseconds."""
+        if max_age is not None and max_age < 0:
+            raise ValueError("max_age must be positive")
+
+        if max_count is not None and max_count < 0:
+            raise ValueError("max_count must be positive")
+
+        self._max_age = max_age
+        self._max_count = max_count
+        self._latest_per_entity = latest_per_entity
+
+    @property
+    def max_age(self) -> Optional[int]:
+        """Maximum age of kept features in milliseconds."""
+        return self._max_age
+
+    @property
+    def max_count(self) -> Optional[int]:
+        """Maximum number of kept features."""
+        return self._max_count
+
+    @property
+    def latest_per_entity(self) -> bool:
+        """Keep only the latest feature of every entity."""
+        return self._latest_per_entity
+
+    def expired(self, entries: List[RetentionEntry], now: int) -> Set[str]:
+        """Return keys which should be dropped, `entries` are ordered oldest first."""
+        dropped: Set[str] = set()
+
+        if self._max_age is not None:
+            dropped.update(key for ts, key, _ in entries if now - ts > self._max_age)
+
+        if self._latest_per_entity:
+            latest: Dict[Optional[str], str] = {}
+            for _, key, entity in entries:
+                if entity is None:
+                    continue
+
+                if entity in latest:
+                    dropped.add(latest[entity])
+
+                latest[entity] = key
+
+        if self._max_count is not None:
+            kept = [key for _, key, _ in entries if key not in dropped]
+            dropped.update(kept[: max(len(kept) - self._max_count, 0)])
+
+        return dropped
+
+
+class Compactor:
+    """Background worker which applies retention policies of a feature store."""
+
+    def __init__(self, store: FeatureStoreAPI, interval: float = 60.0) -> None:
+        """Compactor constructor, `interval` is given in seconds."""
+        self._store = store
+        self._interval = interval
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._removed = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Compactor":
+        """Start compaction in the background."""
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop compaction."""
+        self.stop()
+
+    @property
+    def removed(self) -> int:
+        """Number of keys removed since the compactor was created."""
+        return self._removed
+
+    @property
+    def is_running(self) -> bool:
+        """Check if compactor is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def compact(self) -> int:
+        """Run a single compaction pass."""
+        removed = self._store.compact(int(time.time() * 1e3))
+
+        with self._lock:
+            self._removed += removed
+
+        return removed
+
+    def _loop(self) -> None:
+        """Compact until stopped."""
+        while not self._stop.wait(self._interval):
+            try:
+                self.compact()
+            except Exception:
+                # NOTE: Keep the thread alive, a failed pass is retried on the next interval.
+                logger.exception("feature store compaction failed")
+
+    def start(self) -> None:
+        """Start the background thread."""
+        if self.is_running:
+            raise ValueError("compactor already running")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="flowlayer-compactor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        if self._thread is None:
+            raise ValueError("compactor not running")
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
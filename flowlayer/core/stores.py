@@ -1,3 +1,177 @@
+import sys
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from flowlayer.core.api import FeatureStoreAPI, NetworkAPI
+from flowlayer.core.index import FeatureIndex
+from flowlayer.core.retention import RetentionEntry, RetentionPolicy
+
+StreamId = Tuple[int, int]
+
+
+def _stream_bound(stream_id: str, upper: bool) -> Optional[Tuple[StreamId, bool]]:
+    """Parse stream id boundary into a `(timestamp, sequence)` id and its exclusivity.
+
+    Boundaries follow XRANGE: ids are inclusive unless prefixed with `(`, and a bare
+    timestamp covers every sequence written within that millisecond.
+    """
+    if stream_id in ("-", "+"):
+        return None
+
+    exclusive = stream_id.startswith("(")
+    timestamp, _, sequence = stream_id.lstrip("(").partition("-")
+
+    if sequence:
+        return (int(timestamp), int(sequence)), exclusive
+
+    return (int(timestamp), sys.maxsize if upper else 0), exclusive
+
+
+class MemoryFeatureStore(FeatureStoreAPI):
+    """In-process feature store backed by a timestamp index."""
+
+    def __init__(self) -> None:
+        """Memory feature store constructor."""
+        self._tensors: Dict[str, Any] = {}
+        self._stream_ids: Dict[str, StreamId] = {}
+        self._entities: Dict[str, str] = {}
+        self._outputs: Dict[str, Dict[str, Any]] = {}
+        self._index = FeatureIndex()
+        self._outputs_index = FeatureIndex()
+        self._policies: Dict[int, RetentionPolicy] = {}
+
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+        super().__init__()
+
+    @property
+    def index(self) -> FeatureIndex:
+        """Return secondary index of stored keys."""
+        return self._index
+
+    def set(self, tensor: Any, network: NetworkAPI, timestamp: Optional[int] = None, entity: Optional[str] = None) -> Tuple[str, str]:
+        """Store tensor to the feature store."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1e3)  # NOTE: Milliseconds
+
+        key: str = f"{network.identifier}-{timestamp}-{uuid.uuid4().hex}"
+
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+
+            self._tensors[key] = tensor
+            self._stream_ids[key] = (timestamp, sequence)
+            if entity is not None:
+                self._entities[key] = entity
+
+        self._index.add(network.identifier, timestamp, key)
+
+        return f"{timestamp}-{sequence}", key
+
+    def get(self, key: str) -> Any:
+        """Get tensor from the store."""
+        return self._tensors[key]
+
+    def get_keys(self, network: NetworkAPI, start: str = "-", end: str = "+", limit: int = 500) -> List[Tuple[str, str]]:
+        """Get slice of keys for a given features."""
+        lower = _stream_bound(start, upper=False)
+        upper = _stream_bound(end, upper=True)
+
+        entries = self._index.between(network.identifier, lower[0][0] if lower else None, upper[0][0] if upper else None)
+
+        results: List[Tuple[str, str]] = []
+        for _, key in entries:
+            stream_id = self._stream_ids[key]
+
+            # NOTE: The index narrows by timestamp, sequences are compared only at the boundaries.
+            if lower is not None and (stream_id < lower[0] or (lower[1] and stream_id == lower[0])):
+                continue
+
+            if upper is not None and (stream_id > upper[0] or (upper[1] and stream_id == upper[0])):
+                continue
+
+            results.append((f"{stream_id[0]}-{stream_id[1]}", key))
+            if len(results) == limit:
+                break
+
+        return results
+
+    def latest(self, network: NetworkAPI, n: int = 1) -> List[Tuple[int, str]]:
+        """Get `n` most recent keys of a given feature, newest first."""
+        return self._index.latest(network.identifier, n)
+
+    def get_range(self, network: NetworkAPI, start: Optional[int] = None, end: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Get keys of a given feature written within a time window."""
+        return self._index.between(network.identifier, start, end)
+
+    def as_of(self, network: NetworkAPI, timestamp: int) -> Optional[Tuple[int, str]]:
+        """Get the key of a given feature as it was at a point in time."""
+        return self._index.as_of(network.identifier, timestamp)
+
+    def get_outputs(self, network: NetworkAPI, key: str) -> Optional[Dict[str, Any]]:
+        """Get stored network outputs computed for a given input digest."""
+        return self._outputs.get(key)
+
+    def set_outputs(
+        self, network: NetworkAPI, key: str, outputs: Dict[str, Any], timestamp: Optional[int] = None, entity: Optional[str] = None
+    ) -> None:
+        """Store network outputs computed for a given input digest."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1e3)  # NOTE: Milliseconds
+
+        with self._lock:
+            indexed = key in self._outputs
+
+            self._outputs[key] = dict(outputs)
+            if entity is not None:
+                self._entities[key] = entity
+
+        # NOTE: Outputs are indexed like tensors so retention policies apply to them as well.
+        if not indexed:
+            self._outputs_index.add(network.identifier, timestamp, key)
+
+    def set_retention(self, network: NetworkAPI, policy: Optional[RetentionPolicy]) -> None:
+        """Set retention policy of a given feature."""
+        if policy is None:
+            self._policies.pop(network.identifier, None)
+            return
+
+        self._policies[network.identifier] = policy
+
+    def compact(self, now: Optional[int] = None) -> int:
+        """Drop features outside of their retention policy."""
+        if now is None:
+            now = int(time.time() * 1e3)
+
+        removed = 0
+        for identifier, policy in list(self._policies.items()):
+            removed += self._compact_index(self._index, self._tensors, identifier, policy, now)
+            removed += self._compact_index(self._outputs_index, self._outputs, identifier, policy, now)
+
+        return removed
+
+    def _compact_index(self, index: FeatureIndex, payloads: Dict[str, Any], identifier: int, policy: RetentionPolicy, now: int) -> int:
+        """Prune one index of a network and drop the payloads of pruned keys."""
+        entries: List[RetentionEntry] = [(ts, key, self._entities.get(key)) for ts, key in index.between(identifier)]
+        expired = policy.expired(entries, now)
+        if not expired:
+            return 0
+
+        removed = index.prune(identifier, expired)
+
+        with self._lock:
+            for key in expired:
+                payloads.pop(key, None)
+                self._stream_ids.pop(key, None)
+                self._entities.pop(key, None)
+
+        return removed
+
+
 # import os
 # import time
 # import uuid
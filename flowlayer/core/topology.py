@@ -0,0 +1,157 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy
+from networkx import MultiDiGraph
+from networkx.algorithms.dag import topological_sort
+
+from flowlayer.core.nodes import GearInputOutput, GearOutput, NetworkNode, OutputNode
+
+
+class NetworkGraph(MultiDiGraph):
+    """Network graph counting its structural changes, so compiled topologies notice any rewiring."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Network graph constructor."""
+        self.mutations = 0
+        super().__init__(*args, **kwargs)
+
+    def add_node(self, *args: Any, **kwargs: Any) -> None:
+        """Add a node."""
+        self.mutations += 1
+        super().add_node(*args, **kwargs)
+
+    def add_nodes_from(self, *args: Any, **kwargs: Any) -> None:
+        """Add nodes."""
+        self.mutations += 1
+        super().add_nodes_from(*args, **kwargs)
+
+    def remove_node(self, *args: Any, **kwargs: Any) -> None:
+        """Remove a node."""
+        self.mutations += 1
+        super().remove_node(*args, **kwargs)
+
+    def remove_nodes_from(self, *args: Any, **kwargs: Any) -> None:
+        """Remove nodes."""
+        self.mutations += 1
+        super().remove_nodes_from(*args, **kwargs)
+
+    def add_edge(self, *args: Any, **kwargs: Any) -> Any:
+        """Add an edge, edges added in bulk pass through here as well."""
+        self.mutations += 1
+        return super().add_edge(*args, **kwargs)
+
+    def remove_edge(self, *args: Any, **kwargs: Any) -> None:
+        """Remove an edge."""
+        self.mutations += 1
+        super().remove_edge(*args, **kwargs)
+
+    def remove_edges_from(self, *args: Any, **kwargs: Any) -> None:
+        """Remove edges."""
+        self.mutations += 1
+        super().remove_edges_from(*args, **kwargs)
+
+    def clear(self) -> None:
+        """Remove all nodes and edges."""
+        self.mutations += 1
+        super().clear()
+
+    def clear_edges(self) -> None:
+        """Remove all edges."""
+        self.mutations += 1
+        super().clear_edges()
+
+
+def _graph_version(graph: MultiDiGraph) -> Tuple[int, int, int]:
+    """Structural version of a graph, plain graphs fall back to their size."""
+    return (getattr(graph, "mutations", -1), graph.number_of_nodes(), graph.number_of_edges())
+
+
+class Topology:
+    """Integer indexed adjacency of a network graph in compressed sparse row form."""
+
+    __slots__ = ("_nodes", "_index", "_indptr", "_indices", "_outputs", "_version")
+
+    def __init__(self, graph: MultiDiGraph) -> None:
+        """Topology constructor, nodes are numbered in topological order so every edge points forward."""
+        self._nodes: List[NetworkNode] = list(topological_sort(graph))
+        self._index: Dict[NetworkNode, int] = {node: i for i, node in enumerate(self._nodes)}
+        self._version: Tuple[int, int, int] = _graph_version(graph)
+
+        indptr = numpy.zeros(len(self._nodes) + 1, dtype=numpy.int32)
+        indices: List[int] = []
+
+        for i, node in enumerate(self._nodes):
+            # NOTE: Parallel edges of the multigraph collapse into a single adjacency entry.
+            successors = sorted({self._index[dst] for dst in graph.successors(node)})  # type: ignore
+            indices.extend(successors)
+            indptr[i + 1] = len(indices)
+
+        self._indptr = indptr
+        self._indices = numpy.asarray(indices, dtype=numpy.int32)
+        self._outputs = numpy.asarray([i for i, node in enumerate(self._nodes) if isinstance(node, (GearOutput, GearInputOutput))], dtype=numpy.int32)
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> List[NetworkNode]:
+        """Nodes in topological order."""
+        return self._nodes
+
+    @property
+    def indptr(self) -> numpy.ndarray:
+        """Offsets of node adjacency in `indices`."""
+        return self._indptr
+
+    @property
+    def indices(self) -> numpy.ndarray:
+        """Successor indices of all nodes."""
+        return self._indices
+
+    def is_stale(self, graph: MultiDiGraph) -> bool:
+        """Check if graph changed since the topology was compiled, any rewiring of a `NetworkGraph` counts."""
+        return self._version != _graph_version(graph)
+
+    def successors(self, node: NetworkNode) -> List[NetworkNode]:
+        """Return successors of a node."""
+        i = self._index[node]
+        return [self._nodes[j] for j in self._indices[self._indptr[i] : self._indptr[i + 1]]]
+
+    def _needed(self) -> numpy.ndarray:
+        """Mark empty outputs some empty network result depends on, and gears computing them."""
+        needed = numpy.zeros(len(self._nodes), dtype=bool)
+
+        # NOTE: Edges point forward, so a reverse sweep sees every consumer before its producers.
+        for i in range(len(self._nodes) - 1, -1, -1):
+            node = self._nodes[i]
+            if isinstance(node, GearOutput):
+                needed[i] = node.is_empty
+            elif isinstance(node, GearInputOutput):
+                needed[i] = node.is_empty and needed[self._indices[self._indptr[i] : self._indptr[i + 1]]].any()
+            else:
+                needed[i] = needed[self._indices[self._indptr[i] : self._indptr[i + 1]]].any()
+
+        return needed
+
+    def compute_next(self) -> List[OutputNode]:
+        """Return needed empty outputs which do not depend on other empty outputs.
+
+        Outputs consumed only by gears whose results are already known, such as restored or chunked ones, are never computed.
+        """
+        needed = self._needed()
+        pending = numpy.zeros(len(self._nodes), dtype=bool)
+        pending[self._outputs] = needed[self._outputs]
+
+        waiting = numpy.flatnonzero(pending)
+        if not len(waiting):
+            return []
+
+        # NOTE: Forward edges let a single sweep mark every node downstream of a pending output.
+        blocked = numpy.zeros(len(self._nodes), dtype=bool)
+        for i in range(waiting[0], len(self._nodes)):
+            if pending[i] or blocked[i]:
+                blocked[self._indices[self._indptr[i] : self._indptr[i + 1]]] = True
+
+        ready: List[OutputNode] = [self._nodes[i] for i in self._outputs if pending[i] and not blocked[i]]  # type: ignore
+        return ready
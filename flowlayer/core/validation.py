@@ -0,0 +1,171 @@
+import inspect
+import numbers
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union, get_args, get_origin
+
+Checker = Callable[[Any], bool]
+
+VALIDATION_MODES = ("off", "fast", "strict")
+
+# NOTE: Numeric annotations follow the numeric tower, which also covers NumPy scalars.
+NUMERIC_TOWER: Dict[type, type] = {int: numbers.Integral, float: numbers.Real, complex: numbers.Complex}
+
+
+class ArrayContract:
+    """Shape and dtype contract of an array, checked in strict mode."""
+
+    def __init__(self, dtype: Optional[Any] = None, shape: Optional[Tuple[Optional[int], ...]] = None) -> None:
+        """Array contract constructor, `None` in shape matches any size of the dimension."""
+        self._dtype = dtype
+        self._shape = shape
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"ArrayContract(dtype={self._dtype}, shape={self._shape})"
+
+    def __hash__(self) -> int:
+        """Hash of the contract."""
+        return hash((str(self._dtype), self._shape))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare contracts."""
+        if not isinstance(other, ArrayContract):
+            return NotImplemented
+
+        return (str(self._dtype), self._shape) == (str(other._dtype), other._shape)
+
+    def check(self, value: Any) -> bool:
+        """Check dtype and shape of an array."""
+        if self._dtype is not None:
+            import numpy
+
+            if not numpy.issubdtype(value.dtype, self._dtype):
+                return False
+
+        if self._shape is not None:
+            shape = value.shape
+            if len(shape) != len(self._shape):
+                return False
+
+            return all(expected is None or expected == actual for expected, actual in zip(self._shape, shape))
+
+        return True
+
+
+def _accept(_: Any) -> bool:
+    """Accept any value."""
+    return True
+
+
+def _class_checker(cls: type) -> Checker:
+    """Check instances of a class, exact types take the fast path."""
+    target = NUMERIC_TOWER.get(cls, cls)
+
+    def check(value: Any) -> bool:
+        return type(value) is cls or isinstance(value, target)
+
+    return check
+
+
+def _array_checker(origin: type, contract: ArrayContract) -> Checker:
+    """Check arrays against a contract."""
+
+    def check(value: Any) -> bool:
+        return isinstance(value, origin) and contract.check(value)
+
+    return check
+
+
+def _items_checker(origin: type, args: Tuple[Any, ...], mode: str) -> Checker:
+    """Check containers and their items."""
+    if origin is dict and len(args) == 2:
+        check_key, check_value = compile_checker(args[0], mode), compile_checker(args[1], mode)
+        return lambda value: isinstance(value, dict) and all(check_key(k) and check_value(v) for k, v in value.items())
+
+    if origin is tuple and args and args[-1] is not Ellipsis:
+        checkers = [compile_checker(arg, mode) for arg in args]
+        return lambda value: isinstance(value, tuple) and len(value) == len(checkers) and all(c(v) for c, v in zip(checkers, value))
+
+    check_item = compile_checker(args[0], mode)
+    return lambda value: isinstance(value, origin) and all(check_item(item) for item in value)  # type: ignore
+
+
+def _dtype_of(args: Tuple[Any, ...]) -> Optional[Any]:
+    """Extract scalar type out of `numpy.typing.NDArray` arguments."""
+    if len(args) != 2:
+        return None
+
+    dtype_args = get_args(args[1])
+    if not dtype_args or not isinstance(dtype_args[0], type):
+        return None
+
+    return dtype_args[0]
+
+
+def _generic_checker(origin: Any, args: Tuple[Any, ...], mode: str) -> Checker:
+    """Build checker of a parametrized generic, only strict mode looks inside of values."""
+    if not isinstance(origin, type):
+        return _accept
+
+    dtype = _dtype_of(args) if origin.__name__ == "ndarray" else None
+    if mode == "strict" and dtype is not None:
+        return _array_checker(origin, ArrayContract(dtype=dtype))
+
+    if mode == "strict" and args and origin in (list, set, frozenset, tuple, dict):
+        return _items_checker(origin, args, mode)
+
+    return _class_checker(origin)
+
+
+def _compile(annotation: Any, mode: str) -> Checker:
+    """Build checker of an annotation."""
+    if annotation in (Any, object, inspect.Parameter.empty) or isinstance(annotation, (str, TypeVar)):
+        return _accept
+
+    # NOTE: `Annotated[...]` keeps its metadata, a contract is only checked in strict mode.
+    metadata = getattr(annotation, "__metadata__", None)
+    if metadata is not None:
+        base = compile_checker(annotation.__origin__, mode)
+        contracts = [meta for meta in metadata if isinstance(meta, ArrayContract)]
+        if mode != "strict" or not contracts:
+            return base
+
+        return lambda value: base(value) and all(contract.check(value) for contract in contracts)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union:
+        checkers = [compile_checker(arg, mode) for arg in args]
+        if _accept in checkers:
+            return _accept
+
+        return lambda value: any(check(value) for check in checkers)
+
+    if origin is not None:
+        return _generic_checker(origin, args, mode)
+
+    if isinstance(annotation, type):
+        return _class_checker(annotation)
+
+    return _accept
+
+
+_compiled: Dict[Tuple[Any, str], Checker] = {}
+
+
+def compile_checker(annotation: Any, mode: str = "fast") -> Checker:
+    """Compile annotation into a value checker, compiled checkers are shared between nodes."""
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"unknown validation mode `{mode}` - use one of {VALIDATION_MODES}")
+
+    if mode == "off":
+        return _accept
+
+    try:
+        return _compiled[(annotation, mode)]
+    except KeyError:
+        checker = _compiled[(annotation, mode)] = _compile(annotation, mode)
+    except TypeError:
+        checker = _compile(annotation, mode)
+
+    return checker
@@ -0,0 +1,108 @@
+import pickle
+from pathlib import Path
+from typing import Any
+
+import numpy
+import pytest
+from numpy import ndarray
+
+from flowlayer.core.arrow import SharedBatch, arrow_inputs, column_to_numpy, read_ipc, results_to_batch, share, write_ipc
+from flowlayer.core.engine import PoolEngine
+from flowlayer.core.network import Depends, Maybe, Network
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+def revenue(price: ndarray, qty: ndarray) -> ndarray:
+    total: ndarray = price * qty
+    return total
+
+
+def discounted(revenue: Maybe[ndarray] = Depends(revenue), rate: float = 0.0) -> ndarray:
+    return revenue * (1 - rate)
+
+
+def shared_revenue(batch: SharedBatch) -> SharedBatch:
+    price = batch.column("price")
+    return share(pyarrow.table({"revenue": price * 2}), batch.path.parent)
+
+
+def revenue_total(revenue: Maybe[SharedBatch] = Depends(shared_revenue)) -> float:
+    return float(revenue.column("revenue").sum())
+
+
+@pytest.fixture
+def batch() -> Any:
+    return pyarrow.record_batch({"price": numpy.arange(5, dtype=numpy.float64), "qty": numpy.full(5, 2.0), "other": ["a", "b", "c", "d", "e"]})
+
+
+def test_arrow_inputs(batch: Any) -> None:
+    """Test columns are mapped to inputs sharing Arrow buffers."""
+    inputs = arrow_inputs(batch, ["price", "qty", "rate"])
+
+    assert sorted(inputs) == ["price", "qty"]
+    assert inputs["price"].ctypes.data == batch.column("price").buffers()[1].address
+
+    chunked = pyarrow.chunked_array([[1, 2], [3]])
+    assert column_to_numpy(chunked).tolist() == [1, 2, 3]
+    assert column_to_numpy(pyarrow.array([1, None])).tolist()[0] == 1
+
+
+def test_run_arrow(batch: Any) -> None:
+    """Test network runs over a record batch and returns one."""
+    network = Network("arrow-network", outputs=[discounted])
+
+    result = network.run_arrow(batch, rate=0.5)
+
+    assert isinstance(result, pyarrow.RecordBatch)
+    assert result.schema.names == ["discounted"]
+    assert result.column("discounted").to_pylist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    with pytest.raises(ValueError):
+        network.run_arrow(batch)
+
+
+def test_results_to_batch() -> None:
+    """Test result arrays are wrapped without copying."""
+    network = Network("arrow-network", outputs=[discounted])
+    network_run = network.run(price=numpy.arange(3.0), qty=numpy.ones(3), rate=0.0)
+
+    result = results_to_batch(network_run.results)
+    assert result.column("discounted").buffers()[1].address == network_run.results[0].value.ctypes.data
+
+
+def test_ipc(tmp_path: Path, batch: Any) -> None:
+    """Test IPC files are memory mapped."""
+    path = write_ipc(batch, tmp_path / "batch.arrow")
+    table = read_ipc(path)
+
+    assert table.equals(pyarrow.Table.from_batches([batch]))
+    assert table.column("price").chunk(0).to_numpy(zero_copy_only=True).flags.writeable is False
+
+    network = Network("arrow-network", outputs=[discounted])
+    assert network.run_arrow(table, rate=0.0).column("discounted").to_pylist() == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+def test_shared_batch(tmp_path: Path) -> None:
+    """Test shared batches pickle as a path and map the file on arrival."""
+    shared = share(pyarrow.table({"qty": numpy.full(100_000, 2.0)}), tmp_path)
+    restored = pickle.loads(pickle.dumps(shared))
+
+    assert len(pickle.dumps(shared)) < 1000
+    assert restored.column("qty").sum() == 200_000.0
+
+    restored.release()
+    assert not shared.path.exists()
+
+
+def test_shared_batch_pool(tmp_path: Path, batch: Any) -> None:
+    """Test Arrow data is handed between pool workers through IPC files."""
+    engine = PoolEngine(max_workers=2)
+    engine.setup()
+
+    network = Network("shared-network", outputs=[revenue_total], engine=engine)  # type: ignore
+    network_run = network.run(batch=share(batch, tmp_path))
+    engine.teardown()
+
+    assert network_run.results[0].value == 20.0
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
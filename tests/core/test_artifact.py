@@ -0,0 +1,81 @@
+import inspect
+
+import pytest
+from numpy import ndarray
+
+from flowlayer.core.artifact import NetworkArtifact, func_ref, resolve_ref
+from flowlayer.core.network import Network
+from flowlayer.core.nodes import GearNode, MapGear
+from tests.fixtures.core.fixture_network import add
+from tests.fixtures.core.generics import Fixture
+
+
+def test_func_ref() -> None:
+    """Test gear references by import path."""
+    assert func_ref(add) == "tests.fixtures.core.fixture_network:add"
+    assert resolve_ref(func_ref(add)) is add
+
+    def local() -> int:
+        return 1
+
+    with pytest.raises(ValueError):
+        func_ref(local)
+
+
+def test_artifact_roundtrip(mynetwork: Fixture[Network], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test network loaded from an artifact computes same results."""
+    network: Network = mynetwork
+    data = network.export().to_bytes()
+
+    artifact = NetworkArtifact.from_bytes(data)
+    assert artifact.name == network.name
+    assert artifact.version == network.version
+    assert artifact.identifier == network.identifier
+
+    # NOTE: Loading and running must not introspect gear functions again.
+    monkeypatch.setattr(inspect, "signature", lambda *_: pytest.fail("gear introspected"))
+    loaded = Network.load(data)
+    loaded.run(a=1, b=2, c1=3)
+    monkeypatch.undo()
+
+    assert loaded.identifier == network.identifier
+    assert loaded.input_shape == network.input_shape
+    assert loaded.output_shape == network.output_shape
+    assert sorted(map(str, loaded.graph.nodes)) == sorted(map(str, network.graph.nodes))
+    assert {str(gear) for gear in loaded.roots} == {"add", "add_one"}
+
+    expected = network.run(a=1, b=2, c1=3).results[0].value
+    result = loaded.run(a=1, b=2, c1=3).results[0].value
+    assert isinstance(result, ndarray)
+    assert (result == expected).all()
+
+    assert (Network.load(loaded.export()).run(a=1, b=2, c1=3).results[0].value == expected).all()
+
+
+def test_artifact_settings(mynetwork: Fixture[Network]) -> None:
+    """Test settings are carried by artifacts and can be overridden."""
+    network = Network("mynet", outputs=mynetwork.outputting_nodes, validation="strict", entity_key="a", read_through=True)
+
+    loaded = Network.load(network.export().to_bytes())
+    assert loaded.settings == network.settings
+
+    assert Network.load(network.export(), validation="off").validation == "off"
+    assert all(isinstance(node, GearNode) or node.graph is loaded.graph for node in loaded.graph.nodes)
+
+
+def test_artifact_format() -> None:
+    """Test unknown artifacts are rejected."""
+    with pytest.raises(ValueError):
+        NetworkArtifact({"format": 0})
+
+    with pytest.raises(ValueError):
+        NetworkArtifact.from_bytes(b"\x80\x04N.")
+
+
+def test_artifact_map(mapnetwork: Fixture[Network]) -> None:
+    """Test mapped gears survive artifacts."""
+    loaded = Network.load(mapnetwork.export().to_bytes())
+
+    [mapped] = [node for node in loaded.graph.nodes if isinstance(node, MapGear)]
+    assert mapped.item == "shard"
+    assert loaded.run(count=3, scale=1).results[0].value == 5
@@ -0,0 +1,45 @@
+import pytest
+from numpy import array
+
+from flowlayer.core.cache import LRUCache, input_digest
+
+
+def test_input_digest() -> None:
+    """Test input digest is stable and order independent."""
+    assert input_digest({"a": 1, "b": "x"}) == input_digest({"b": "x", "a": 1})
+    assert input_digest({"a": 1}) != input_digest({"a": 2})
+    assert input_digest({"a": array([1, 2])}) == input_digest({"a": array([1, 2])})
+    assert input_digest({"a": array([1, 2])}) != input_digest({"a": array([1.0, 2.0])})
+    assert input_digest({"a": array([1, 2])}) != input_digest({"a": array([[1, 2]])})
+
+    # NOTE: Object arrays hash their elements, not the pointers held in their buffer.
+    assert input_digest({"a": array(["x" * 10, 1], dtype=object)}) == input_digest({"a": array(["x" * 10, 1], dtype=object)})
+    assert input_digest({"a": array(["x", 1], dtype=object)}) != input_digest({"a": array(["y", 1], dtype=object)})
+
+
+def test_lru_cache() -> None:
+    """Test eviction of least recently used entries."""
+    cache: LRUCache[int] = LRUCache(maxsize=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert len(cache) == 2
+
+    assert cache.get("b") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+    disabled: LRUCache[int] = LRUCache(maxsize=0)
+    disabled.put("a", 1)
+    assert disabled.get("a") is None
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
@@ -0,0 +1,128 @@
+from pathlib import Path
+from typing import List
+
+import numpy
+import pytest
+from numpy import ndarray
+
+from flowlayer.core.api import EngineAPI
+from flowlayer.core.checkpoint import CheckpointStore, checkpoint_key
+from flowlayer.core.network import Depends, Maybe, Network
+from flowlayer.core.nodes import GearException
+from tests.fixtures.core.generics import Fixture
+
+
+def test_checkpoint_key(mynetwork: Fixture[Network]) -> None:
+    """Test data nodes are keyed by producing gear and name."""
+    network: Network = mynetwork
+    keys = sorted(checkpoint_key(node) for node in network.outputs)
+
+    assert keys == ["add.sum", "add_one.add_one", "my_out.my_out", "reduce.reduced"]
+
+
+def test_resume_after_failure(tmp_path: Path) -> None:
+    """Test resumed runs only execute gears without persisted results."""
+    calls: List[str] = []
+    crash = [True]
+
+    def upstream(x: int) -> ndarray:
+        calls.append("upstream")
+        return numpy.arange(x)
+
+    def leaf(values: Maybe[ndarray] = Depends(upstream)) -> int:
+        calls.append("leaf")
+        if crash[0]:
+            raise RuntimeError("driver died")
+
+        return int(values.sum())
+
+    store = CheckpointStore(tmp_path)
+    network = Network("backfill", outputs=[leaf], checkpoints=store)  # type: ignore
+
+    with pytest.raises(GearException):
+        network.run(x=5)
+
+    [run_id] = store.runs()
+    assert store.manifest(run_id)["identifier"] == network.identifier
+    assert store.inputs(run_id) == {"x": 5}
+
+    persisted = store.values(run_id)
+    assert list(persisted) == ["upstream.values"]
+    assert isinstance(persisted["upstream.values"], numpy.memmap)
+
+    crash[0] = False
+    calls.clear()
+
+    result = Network("backfill", outputs=[leaf], checkpoints=store).resume(run_id)  # type: ignore
+    assert result.results[0].value == 10
+    assert calls == ["leaf"]
+    assert store.runs() == []
+
+
+def logged_upstream(x: int, log: str) -> ndarray:
+    with open(log, "a") as f:
+        f.write("upstream\n")
+
+    return numpy.arange(x)
+
+
+def logged_leaf(log: str, values: Maybe[ndarray] = Depends(logged_upstream)) -> int:
+    with open(log, "a") as f:
+        f.write("leaf\n")
+
+    if Path(log).with_suffix(".crash").exists():
+        raise RuntimeError("driver died")
+
+    return int(values.sum())
+
+
+def test_resume_on_dask(tmp_path: Path, local_dask_engine: Fixture[EngineAPI]) -> None:
+    """Test dask resumes only gears without persisted results."""
+    log = tmp_path / "calls.log"
+    log.with_suffix(".crash").touch()
+
+    store = CheckpointStore(tmp_path / "checkpoints")
+    with pytest.raises(GearException):
+        Network("backfill", outputs=[logged_leaf], checkpoints=store).run(x=5, log=str(log))  # type: ignore
+
+    [run_id] = store.runs()
+    log.with_suffix(".crash").unlink()
+    log.unlink()
+
+    network = Network("backfill", outputs=[logged_leaf], engine=local_dask_engine, checkpoints=store)  # type: ignore
+    result = network.resume(run_id)
+
+    assert result.results[0].value == 10
+    assert log.read_text().split() == ["leaf"]
+
+
+def test_completed_runs_dropped(mynetwork: Fixture[Network], tmp_path: Path) -> None:
+    """Test checkpoints of successful runs are removed."""
+    store = CheckpointStore(tmp_path)
+    network = Network("my-network", outputs=mynetwork.outputting_nodes, checkpoints=store)
+
+    assert list(network.run(a=1, b=3, c1=10).results[0].value) == [-6, 1]
+    assert network.copy().checkpoints is store
+    assert store.runs() == []
+
+
+def test_resume_errors(mynetwork: Fixture[Network], tmp_path: Path) -> None:
+    """Test invalid resumes."""
+    network: Network = mynetwork
+
+    with pytest.raises(ValueError):
+        network.resume("missing")
+
+    store = CheckpointStore(tmp_path)
+    with pytest.raises(KeyError):
+        Network("my-network", outputs=network.outputting_nodes, checkpoints=store).resume("missing")
+
+    (tmp_path / "foreign").mkdir()
+    (tmp_path / "foreign" / "manifest.json").write_text('{"identifier": 0, "name": "other", "version": "1.0.0"}')
+
+    with pytest.raises(ValueError):
+        Network("my-network", outputs=network.outputting_nodes, checkpoints=store).resume("foreign")
+
+    # NOTE: A torn journal line left by a crash is skipped.
+    (tmp_path / "foreign" / "journal").write_text('{"key": "add.su')
+    assert store.values("foreign") == {}
@@ -0,0 +1,178 @@
+import time
+from pathlib import Path
+from typing import List
+
+import numpy
+import pytest
+from numpy import ndarray
+
+from flowlayer.core.chunking import ChunkPlan, plan_chunks
+from flowlayer.core.engine import PoolEngine, SerialEngine
+from flowlayer.core.hints import Resources, chunkable, resources
+from flowlayer.core.network import Depends, Maybe, Network
+
+SEEN: List[int] = []
+
+
+@chunkable()
+def scaled(values: ndarray, factor: float) -> ndarray:
+    SEEN.append(len(values))
+    result: ndarray = values * factor
+    return result
+
+
+@chunkable(reduce=numpy.add)
+def scaled_sum(scaled: Maybe[ndarray] = Depends(scaled)) -> float:
+    return float(scaled.sum())
+
+
+def scaled_mean(values: ndarray, total: Maybe[float] = Depends(scaled_sum)) -> float:
+    return total / len(values)
+
+
+@pytest.fixture
+def values(tmp_path: Path) -> ndarray:
+    numpy.save(tmp_path / "values.npy", numpy.arange(1000, dtype=numpy.float64))
+    mapped: ndarray = numpy.load(tmp_path / "values.npy", mmap_mode="r")
+    return mapped
+
+
+@pytest.fixture
+def chunknetwork() -> Network:
+    return Network("chunk-network", outputs=[scaled, scaled_mean])  # type: ignore
+
+
+def test_chunk_plan(chunknetwork: Network, values: ndarray) -> None:
+    """Test chunkable region and split inputs of a network."""
+    chunknetwork.set_input({"values": values, "factor": 2.0})
+    plan = ChunkPlan(chunknetwork, chunk_bytes=800)
+
+    assert [gear.name for gear in plan.gears] == ["scaled", "scaled_sum"]
+    assert [gear.name for gear in plan.reduced] == ["scaled", "scaled_sum"]
+    assert plan.split == {"values": 0}
+    assert (plan.length, plan.rows, plan.chunks) == (1000, 100, 10)
+
+    inputs = plan.chunk_inputs(9)
+    assert inputs["factor"] == 2.0
+    assert inputs["values"].tolist() == list(range(900, 1000))
+    assert isinstance(inputs["values"], numpy.memmap)
+
+    assert plan_chunks(chunknetwork, chunk_bytes=800) is not None
+    for gear in plan.reduced:
+        for node in chunknetwork.graph.successors(gear):
+            node.set_value(numpy.zeros(1) if gear.name == "scaled" else 0.0)
+
+    # NOTE: Restored results of the region are not computed again.
+    assert plan.known
+    assert plan_chunks(chunknetwork, chunk_bytes=800) is None
+
+    chunknetwork.set_input({"values": numpy.arange(10.0), "factor": 2.0})
+    assert plan_chunks(chunknetwork, chunk_bytes=800) is None
+
+
+def test_chunk_plan_errors() -> None:
+    """Test inputs which cannot be chunked together."""
+
+    @chunkable()
+    def pair(left: ndarray, right: ndarray) -> ndarray:
+        result: ndarray = left + right
+        return result
+
+    network = Network("pair-network", outputs=[pair])
+    network.set_input({"left": numpy.zeros(100), "right": numpy.zeros(200)})
+
+    with pytest.raises(ValueError):
+        ChunkPlan(network, chunk_bytes=100)
+
+    with pytest.raises(ValueError):
+        SerialEngine(chunk_bytes=0)
+
+
+def test_serial_chunked_run(chunknetwork: Network, values: ndarray) -> None:
+    """Test chunkable gears never see whole inputs on the serial engine."""
+    expected = SerialEngine().run(chunknetwork.copy(), values=numpy.asarray(values), factor=2.0)
+
+    SEEN.clear()
+    network_run = SerialEngine(chunk_bytes=800).run(chunknetwork, values=values, factor=2.0)
+
+    assert SEEN == [100] * 10
+    assert {node.name: node.value for node in network_run.results}.keys() == {"scaled", "scaled_mean"}
+    for result, reference in zip(network_run.results, expected.results):
+        assert numpy.array_equal(result.value, reference.value)
+
+
+def test_pool_chunked_run(chunknetwork: Network, values: ndarray) -> None:
+    """Test chunks are spread over pool workers and folded in order."""
+    engine = PoolEngine(max_workers=2, chunk_bytes=2000)
+    engine.setup()
+
+    network_run = engine.run(chunknetwork, values=values, factor=2.0)
+    engine.teardown()
+
+    results = {node.name: node.value for node in network_run.results}
+    assert numpy.array_equal(results["scaled"], numpy.arange(1000) * 2.0)
+    assert results["scaled_mean"] == 999.0
+
+
+@chunkable(reduce=numpy.add)
+def ones_total(ones: ndarray) -> float:
+    return float(ones.sum())
+
+
+@chunkable()
+def normalized(ones: ndarray, total: Maybe[float] = Depends(ones_total)) -> ndarray:
+    result: ndarray = ones / total
+    return result
+
+
+def normalized_sum(normalized: Maybe[ndarray] = Depends(normalized)) -> float:
+    return float(normalized.sum())
+
+
+def test_reduce_feeds_chunkable_consumer() -> None:
+    """Test consumers of a reducing gear run on the combined result, not on partial ones."""
+    network = Network("normalize-network", outputs=[normalized_sum])  # type: ignore
+    ones = numpy.ones(1000)
+
+    expected = SerialEngine().run(network.copy(), ones=ones).results[0].value
+    chunked = SerialEngine(chunk_bytes=800).run(network.copy(), ones=ones).results[0].value
+    assert chunked == pytest.approx(expected) == 1.0
+
+    network.set_input({"ones": ones})
+    plan = ChunkPlan(network, chunk_bytes=800)
+    assert [gear.name for gear in plan.gears] == ["ones_total"]
+    assert [gear.name for gear in plan.reduced] == ["ones_total"]
+
+
+@chunkable(reduce=numpy.add)
+@resources(memory=600)
+def heavy_total(ones: ndarray) -> float:
+    return float(ones.sum())
+
+
+def test_pool_chunks_claim_budget() -> None:
+    """Test chunks claim their resources from the pool budget shared with other runs."""
+    network = Network("heavy-chunk-network", outputs=[heavy_total])  # type: ignore
+    ones = numpy.ones(1000)
+
+    network.set_input({"ones": ones})
+    plan = ChunkPlan(network, chunk_bytes=800)
+    assert plan.resources == Resources(memory=600)
+
+    engine = PoolEngine(max_workers=4, memory_limit=1000, chunk_bytes=800)
+    engine.setup()
+    assert engine._chunk_executor(plan.resources)[1] == 1
+
+    # NOTE: Another run holds the whole machine, chunks wait for it.
+    blocker = Resources(exclusive=True)
+    engine._claim(blocker)
+    handle = engine.submit(network, ones=ones)
+    time.sleep(0.5)
+    assert not handle.done()
+
+    engine._release(blocker)
+    assert handle.result(timeout=30).results[0].value == 1000.0
+    engine.teardown()
+
+    assert engine._budget.idle
+    assert engine.metrics.value("flowlayer_pool_memory_used_bytes") == 0
@@ -1,11 +1,30 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List
+
 import pytest
+from numpy import ndarray
 
-from flowlayer.core.engine import PoolEngine, SerialEngine
+from flowlayer.core.engine import DaskEngine, DurationHistory, PoolEngine, ResourceBudget, Run, SerialEngine, call_gear
+from flowlayer.core.hints import Resources, pure, retry
 from flowlayer.core.network import Network
-from flowlayer.core.nodes import GearNode, InvalidGraph, OutputNode
+from flowlayer.core.nodes import GearException, GearInputOutput, GearNode, InvalidGraph, OutputNode
 from tests.fixtures.core.generics import Fixture
 
 
+@pure
+def straggle(marker: str) -> int:
+    """First execution stalls, later ones return at once."""
+    path = Path(marker)
+    if not path.exists():
+        path.touch()
+        time.sleep(3)
+
+    return 1
+
+
 class TestSerialEngine:
     """Check all aspects of SerialEngine implementation."""
 
@@ -51,13 +70,120 @@ class TestSerialEngine:
 
         mynet.set_input({"a": 1, "b": 3, "c1": 10})
 
-        engine._network = mynet  # type: ignore
-        result = engine._submit_next()  # type: ignore
-        assert result is True
+        assert engine._submit_next(Run(mynet, {})) is True  # type: ignore
+        while engine._submit_next(Run(mynet, {})):  # type: ignore
+            pass
 
-        engine._network = None  # type: ignore
-        with pytest.raises(ValueError):
-            engine._submit_next()  # type: ignore
+        assert mynet.compute_next() == []
+        assert engine._submit_next(Run(mynet, {})) is False  # type: ignore
+
+    def test_concurrent_runs(self, mynetwork: Fixture[Network]) -> None:
+        """Check a single engine serves overlapping runs."""
+        engine = SerialEngine()
+        network = Network("concurrent", outputs=mynetwork.outputting_nodes, engine=engine)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            runs = list(pool.map(lambda a: network.run(a=a, b=1, c1=0), range(32)))
+
+        assert [list(run.results[0].value) for run in runs] == [[a + 1, 1] for a in range(32)]
+        assert engine.runs == []
+
+
+class TestRetry:
+    """Check gear retries preserve completed work."""
+
+    def test_call_gear_retries(self) -> None:
+        """Test failed attempts are repeated until the policy gives up."""
+        attempts = []
+
+        @retry(max_attempts=3, exceptions=(ConnectionError,))
+        def flaky(fails: int) -> int:
+            attempts.append(fails)
+            if len(attempts) <= fails:
+                raise ConnectionError("transient")
+
+            return len(attempts)
+
+        assert call_gear(GearNode(flaky), {"fails": 2}) == 3
+
+        attempts.clear()
+        with pytest.raises(GearException) as exp:
+            call_gear(GearNode(flaky), {"fails": 5})
+
+        assert exp.value.attempts == 3
+        assert isinstance(exp.value.raised_exception, ConnectionError)
+        assert len(attempts) == 3
+
+        @retry(max_attempts=3, exceptions=(ConnectionError,))
+        def broken() -> int:
+            attempts.append(0)
+            raise KeyError("permanent")
+
+        attempts.clear()
+        with pytest.raises(GearException) as exp:
+            call_gear(GearNode(broken), {})
+
+        assert exp.value.attempts == 1
+        assert len(attempts) == 1
+
+    def test_upstream_kept(self) -> None:
+        """Test only the failed gear is executed again."""
+        from flowlayer.core.network import Depends, Maybe
+
+        calls: List[str] = []
+
+        def upstream(x: int) -> int:
+            calls.append("upstream")
+            return x + 1
+
+        @retry(max_attempts=2)
+        def leaf(value: Maybe[int] = Depends(upstream)) -> int:
+            calls.append("leaf")
+            if calls.count("leaf") == 1:
+                raise RuntimeError("transient")
+
+            return value * 2
+
+        network = Network("retries", outputs=[leaf])  # type: ignore
+        assert network.run(x=1).results[0].value == 4
+        assert calls == ["upstream", "leaf", "leaf"]
+
+
+class TestResourceBudget:
+    """Check packing of gears by declared resources."""
+
+    def test_budget(self) -> None:
+        """Test cpu, memory and exclusive accounting."""
+        budget = ResourceBudget(cpus=4, memory=100)
+        assert budget.idle
+
+        big = Resources(cpus=8, memory=1000)
+        assert budget.fits(big)
+
+        budget.acquire(Resources(cpus=2, memory=60))
+        assert budget.fits(Resources(cpus=2, memory=40))
+        assert not budget.fits(Resources(cpus=3))
+        assert not budget.fits(Resources(memory=50))
+        assert not budget.fits(Resources(exclusive=True))
+        budget.release(Resources(cpus=2, memory=60))
+
+        budget.acquire(Resources(exclusive=True))
+        assert not budget.fits(Resources())
+        budget.release(Resources(exclusive=True))
+        assert budget.fits(Resources(cpus=4))
+
+        assert ResourceBudget(cpus=1).fits(Resources(memory=10**15)) is True
+
+    def test_slots(self) -> None:
+        """Test number of executions an idle budget holds at once."""
+        budget = ResourceBudget(cpus=4, memory=100)
+
+        assert budget.slots(Resources(), 8) == 4
+        assert budget.slots(Resources(), 2) == 2
+        assert budget.slots(Resources(memory=40), 8) == 2
+        assert budget.slots(Resources(cpus=8), 8) == 1
+        assert budget.slots(Resources(exclusive=True), 8) == 1
+        assert ResourceBudget(cpus=4).slots(Resources(memory=10**15), 8) == 4
 
 
 class TestPoolEngine:
@@ -107,27 +233,283 @@ class TestPoolEngine:
 
         mynet.set_input({"a": 1, "b": 3, "c1": 10})
 
-        engine._network = mynet  # type: ignore
-        result = engine._submit_next()  # type: ignore
+        result = engine._submit_next(Run(mynet, {}))  # type: ignore
         assert set(result)
 
+        engine.teardown()
         engine._executor = None  # type: ignore
         with pytest.raises(ValueError):
-            engine._submit_next()  # type: ignore
+            engine._submit_next(Run(mynet, {}))  # type: ignore
+
+    def test_concurrent_runs(self, mynetwork: Fixture[Network], heavynetwork: Fixture[Network]) -> None:
+        """Check runs of different networks share one pool and one budget."""
+        engine = PoolEngine(max_workers=2, memory_limit=1000)
+        engine.setup()
+
+        def run(i: int) -> Any:
+            if i % 2:
+                return list(engine.run(mynetwork._clone(), a=i, b=1, c1=0).results[0].value)  # type: ignore
+
+            return list(engine.run(heavynetwork._clone(), x=i, y=i).results[0].value)  # type: ignore
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(run, range(12)))
+
+        engine.teardown()
+
+        assert results == [[i + 1, 1] if i % 2 else [i + 1, i * 2] for i in range(12)]
+        assert engine._budget.idle  # type: ignore
+        assert engine.runs == []
+
+    def test_submit(self, mynetwork: Fixture[Network]) -> None:
+        """Check runs submitted to the pool resolve in the background."""
+        engine = PoolEngine()
+        engine.setup()
+
+        handles = [engine.submit(mynetwork._clone(), a=a, b=3, c1=10) for a in range(4)]  # type: ignore
+        results = [list(handle.result(timeout=30).results[0].value) for handle in handles]
+        engine.teardown()
+
+        assert results == [[a - 7, 1] for a in range(4)]
+        assert [list(handle.outputs) for handle in handles] == [["my_out"]] * 4
 
-        engine._network = None  # type: ignore
         with pytest.raises(ValueError):
-            engine._submit_next()  # type: ignore
+            engine.submit(None)  # type: ignore
+
+    @pytest.mark.parametrize("memory_limit, peak", [(1000, 600), (2000, 1200)])
+    def test_resource_packing(self, heavynetwork: Fixture[Network], memory_limit: int, peak: int) -> None:
+        """Check memory heavy gears are not co-scheduled beyond the memory limit."""
+        engine = PoolEngine(max_workers=4, memory_limit=memory_limit)
+        engine.setup()
+
+        used = []
+        acquire = engine._budget.acquire  # type: ignore
+
+        def spy(resources: Resources) -> None:
+            acquire(resources)
+            used.append(engine._budget._used_memory)  # type: ignore
+
+        engine._budget.acquire = spy  # type: ignore
+
+        new_net = engine.run(heavynetwork, x=3, y=3)
+        engine.teardown()
+
+        assert max(used) == peak
+        assert engine._budget.idle  # type: ignore
+        assert [list(result.value) for result in new_net.results] == [[4, 6]]
+
+    def test_duration_history(self) -> None:
+        """Check percentiles of recorded gear durations."""
+        history = DurationHistory(size=4, min_samples=2)
+        history.record("gear", 1.0)
+        assert history.percentile("gear", 50) is None
+
+        for seconds in [4.0, 2.0, 3.0, 5.0]:
+            history.record("gear", seconds)
+
+        assert history.percentile("gear", 50) == 3.0
+        assert history.percentile("gear", 100) == 5.0
+        assert history.percentile("unknown", 50) is None
+
+    def test_speculative_execution(self, tmp_path: Path) -> None:
+        """Check a straggling pure gear is duplicated and the first result wins."""
+        with pytest.raises(ValueError):
+            PoolEngine(speculate=0)
+
+        engine = PoolEngine(max_workers=2, speculate=50)
+        for _ in range(5):
+            engine.durations.record("straggle", 0.05)
+
+        engine.setup()
+        network = Network("straggler", outputs=[straggle], engine=engine)  # type: ignore
+
+        start = time.monotonic()
+        result = network.run(marker=str(tmp_path / "marker"))
+        elapsed = time.monotonic() - start
+        engine.teardown()
+
+        assert result.results[0].value == 1
+        assert elapsed < 2
+        assert engine._budget.idle  # type: ignore
+
+    def test_map_fan_out(self, mapnetwork: Fixture[Network]) -> None:
+        """Check every element of a mapped gear is a separate pool task."""
+        engine = PoolEngine(max_workers=2)
+        engine.setup()
+
+        submitted: List[str] = []
+        submit = engine._executor.submit  # type: ignore
+
+        def spy(fn: Any, gear: GearNode, params: Any) -> Any:
+            submitted.append(gear.name)
+            return submit(fn, gear, params)
+
+        engine._executor.submit = spy  # type: ignore
+
+        new_net = engine.run(mapnetwork, count=5, scale=1)
+        engine.teardown()
+
+        assert new_net.results[0].value == 30
+        assert submitted.count("square_shard") == 5
+        assert engine._budget.idle  # type: ignore
 
     def test_teardown(self) -> None:
         """Check teardown step."""
         engine = PoolEngine()
 
-        with pytest.raises(NotImplementedError):
-            engine.register()
+        with pytest.raises(ValueError):
+            engine.get_networks()
 
         with pytest.raises(ValueError):
             engine.teardown()
 
         engine.setup()
         engine.teardown()
+
+
+class TestDaskEngine:
+    """Check all aspects of DaskEngine implementation."""
+
+    def test_construction(self, mynetwork: Fixture[Network], local_dask_engine: Fixture[DaskEngine]) -> None:
+        """Test dask engine on a local cluster."""
+        engine: DaskEngine = local_dask_engine
+        assert engine.is_ready()
+
+        new_net = engine.run(mynetwork, a=1, b=3, c1=10)
+
+        assert [list(result.value) for result in new_net.results] == [[-6, 1]]
+
+    def test_map_fan_out(self, mapnetwork: Fixture[Network], local_dask_engine: Fixture[DaskEngine]) -> None:
+        """Test mapped gears fan out on workers."""
+        engine: DaskEngine = local_dask_engine
+
+        new_net = engine.run(mapnetwork, count=4, scale=3)
+
+        assert new_net.results[0].value == 42
+
+    def test_intermediates_stay_on_workers(
+        self, mynetwork: Fixture[Network], local_dask_engine: Fixture[DaskEngine], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Check only final outputs are gathered and gears are not executed on the client."""
+        engine: DaskEngine = local_dask_engine
+
+        def client_call(*_: Any, **__: Any) -> Any:
+            raise AssertionError("gear executed on the client")
+
+        monkeypatch.setattr(GearNode, "__call__", client_call)
+
+        new_net = engine.run(mynetwork, a=1, b=3, c1=10)
+
+        intermediates = [node for node in new_net.outputs if isinstance(node, GearInputOutput)]
+        assert intermediates
+        assert all(node.is_empty for node in intermediates)
+        assert all(not result.is_empty for result in new_net.results)
+
+    def test_single_graph_submission(
+        self, mynetwork: Fixture[Network], local_dask_engine: Fixture[DaskEngine], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Check the whole network is submitted to the scheduler in a single call."""
+        engine: DaskEngine = local_dask_engine
+        executor: Any = engine._executor
+        submitted = []
+
+        compute = executor.compute
+
+        def spy(collections: Any, **kwargs: Any) -> Any:
+            submitted.append(collections)
+            return compute(collections, **kwargs)
+
+        monkeypatch.setattr(executor, "compute", spy)
+        monkeypatch.setattr(executor, "submit", lambda *_, **__: pytest.fail("gear submitted separately"))
+
+        new_net = engine.run(mynetwork, a=1, b=3, c1=10)
+
+        assert len(submitted) == 1
+        assert [list(result.value) for result in new_net.results] == [[-6, 1]]
+
+        gears = [node for node in mynetwork.graph.nodes if isinstance(node, GearNode)]
+        assert len(submitted[0][0].__dask_graph__()) == len(gears)
+
+    def test_partial_construction(self, mynetwork: Fixture[Network], local_dask_engine: Fixture[DaskEngine]) -> None:
+        """Test DaskEngine with invalid graph."""
+        engine: DaskEngine = local_dask_engine
+
+        with pytest.raises(ValueError):
+            _ = engine.run(None, a=3, b=2, c=10)  # type: ignore
+
+        mynet: Network = mynetwork
+        dst: OutputNode = mynet.outputs[-1]
+        mynet.graph.add_edge(GearNode(lambda x: x**2), dst)  # type: ignore
+
+        with pytest.raises(InvalidGraph):
+            _ = engine.run(mynet, a=5, b=20, c1=30)
+
+    def test_gear_exception(self, local_dask_engine: Fixture[DaskEngine]) -> None:
+        """Check gear exceptions are raised on the client."""
+        engine: DaskEngine = local_dask_engine
+
+        def fail(p: int) -> ndarray:
+            raise KeyError(p)
+
+        with pytest.raises(GearException) as exp:
+            engine.run(Network("failing", outputs=[fail]), p=1)
+
+        assert isinstance(exp.value.raised_exception, KeyError)
+
+    def test_resource_annotations(self, heavynetwork: Fixture[Network]) -> None:
+        """Check gears carry resource annotations to workers declaring them."""
+        from distributed import LocalCluster
+
+        resources = {"CPU": 2, "MEMORY": 1000}
+        with LocalCluster(n_workers=1, threads_per_worker=2, processes=False, dashboard_address=None, resources=resources) as cluster:
+            engine = DaskEngine(cluster.scheduler_address, [], None, resources=True)
+            engine.setup()
+
+            heavynetwork.set_input({"x": 3, "y": 3})
+            futures = engine._executor.compute(list(engine._build_graph(Run(heavynetwork, {})).values()))  # type: ignore
+
+            def restrictions(dask_scheduler: Any) -> Any:
+                return {str(key).split("-")[0]: task.resource_restrictions for key, task in dask_scheduler.tasks.items()}
+
+            deadline = time.time() + 5
+            while "heavy_right" not in (found := engine._executor.run_on_scheduler(restrictions)) and time.time() < deadline:  # type: ignore
+                time.sleep(0.01)
+
+            assert found["heavy_right"] == {"CPU": 2, "MEMORY": 600}
+            engine._executor.gather(futures)  # type: ignore
+
+            new_net = engine.run(heavynetwork, x=3, y=3)
+            assert [list(result.value) for result in new_net.results] == [[4, 6]]
+
+            engine.teardown()
+
+    def test_cached_provisioning(self, local_dask_engine: Fixture[DaskEngine], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Check environments are shipped once per content hash."""
+        import zipfile
+
+        from flowlayer.core import provision
+
+        egg = tmp_path / "provisioned.egg"
+        with zipfile.ZipFile(egg, "w") as archive:
+            archive.writestr("provisioned_module.py", "VALUE = 42\n")
+
+        shipped = []
+        plugin_init = provision.Provision.__init__
+
+        def spy(self: Any, *args: Any) -> None:
+            plugin_init(self, *args)
+            shipped.append(self.egg_data is not None)
+
+        monkeypatch.setattr(provision.Provision, "__init__", spy)
+        monkeypatch.setattr(sys, "path", list(sys.path))
+
+        for _ in range(2):
+            engine = DaskEngine(local_dask_engine._address, [], egg, cache_dir=str(tmp_path / "cache"))  # type: ignore
+            engine.setup()
+            assert engine.digest == provision.environment_digest([], egg)
+
+            values = engine._executor.run(lambda: __import__("provisioned_module").VALUE)  # type: ignore
+            assert set(values.values()) == {42}
+            engine.teardown()
+
+        assert shipped == [True, False]
@@ -0,0 +1,121 @@
+import numpy
+import pytest
+from numpy import ndarray
+
+from flowlayer.core.hints import (
+    DEFAULT_RESOURCES,
+    NO_RETRY,
+    Chunking,
+    Resources,
+    Retry,
+    chunkable,
+    get_chunking,
+    get_resources,
+    get_retry,
+    is_pure,
+    pure,
+    resources,
+    retry,
+)
+from flowlayer.core.nodes import GearNode
+
+
+def test_resources_hint() -> None:
+    """Test declaring gear resources."""
+
+    @resources(cpus=4, memory=1024, exclusive=True)
+    def heavy(x: int) -> int:
+        return x
+
+    def light(x: int) -> int:
+        return x
+
+    assert heavy(3) == 3
+    assert get_resources(heavy) == Resources(cpus=4, memory=1024, exclusive=True)
+    assert get_resources(light) is DEFAULT_RESOURCES
+    assert GearNode(heavy).resources.cpus == 4
+    assert str(GearNode(light).resources) == "Resources(cpus=1, memory=0, exclusive=False)"
+
+    assert get_resources(heavy).as_dask() == {"CPU": 4, "MEMORY": 1024, "EXCLUSIVE": 1}
+    assert DEFAULT_RESOURCES.as_dask() == {"CPU": 1}
+    assert DEFAULT_RESOURCES != "cpus"
+
+
+def test_resources_validation() -> None:
+    """Test invalid resources."""
+    with pytest.raises(ValueError):
+        Resources(cpus=0)
+
+    with pytest.raises(ValueError):
+        Resources(memory=-1)
+
+
+def test_retry_hint() -> None:
+    """Test declaring gear retry policies."""
+
+    @retry(max_attempts=4, backoff=0.5, exceptions=(IOError,))
+    def flaky(x: int) -> int:
+        return x
+
+    def stable(x: int) -> int:
+        return x
+
+    policy = get_retry(flaky)
+    assert flaky(3) == 3
+    assert policy == Retry(max_attempts=4, backoff=0.5, exceptions=(IOError,))
+    assert get_retry(stable) is NO_RETRY
+    assert GearNode(flaky).retry is policy
+    assert str(NO_RETRY) == "Retry(max_attempts=1, backoff=0.0, factor=2.0, exceptions=(Exception))"
+
+    assert [policy.delay(attempt) for attempt in (1, 2, 3)] == [0.5, 1.0, 2.0]
+    assert policy.should_retry(IOError(), 3)
+    assert not policy.should_retry(IOError(), 4)
+    assert not policy.should_retry(KeyError(), 1)
+    assert not NO_RETRY.should_retry(Exception(), 1)
+
+
+def test_retry_validation() -> None:
+    """Test invalid retry policies."""
+    with pytest.raises(ValueError):
+        Retry(max_attempts=0)
+
+    with pytest.raises(ValueError):
+        Retry(backoff=-1)
+
+    with pytest.raises(ValueError):
+        Retry(factor=0.5)
+
+
+def test_pure_hint() -> None:
+    """Test declaring pure gears."""
+
+    @pure
+    def square(x: int) -> int:
+        return x * x
+
+    def impure(x: int) -> int:
+        return x
+
+    assert square(3) == 9
+    assert is_pure(square)
+    assert not is_pure(impure)
+    assert GearNode(square).pure
+    assert not GearNode(impure).pure
+
+
+def test_chunkable_hint() -> None:
+    """Test declaring chunkable gears."""
+
+    @chunkable(axis=1, reduce=numpy.add)
+    def total(x: ndarray) -> ndarray:
+        result: ndarray = x.sum(axis=1)
+        return result
+
+    def whole(x: ndarray) -> ndarray:
+        return x
+
+    assert get_chunking(total) == Chunking(axis=1, reduce=numpy.add)
+    assert repr(get_chunking(total)) == "Chunking(axis=1, reduce=add)"
+    assert get_chunking(whole) is None
+    assert GearNode(total).chunking == Chunking(axis=1, reduce=numpy.add)
+    assert GearNode(whole).chunking is None
@@ -0,0 +1,47 @@
+from flowlayer.core.index import FeatureIndex
+
+
+def test_feature_index_ordering() -> None:
+    """Test index keeps entries ordered by timestamp."""
+    index = FeatureIndex()
+
+    index.add(1, 20, "b")
+    index.add(1, 10, "a")
+    index.add(1, 30, "c")
+    index.add(2, 15, "x")
+
+    assert len(index) == 4
+    assert index.count(1) == 3
+    assert index.count(3) == 0
+    assert set(index.identifiers) == {1, 2}
+
+    assert index.between(1) == [(10, "a"), (20, "b"), (30, "c")]
+    assert index.between(1, 15, 30) == [(20, "b"), (30, "c")]
+    assert index.between(1, end=20) == [(10, "a"), (20, "b")]
+    assert index.between(3) == []
+
+
+def test_feature_index_latest() -> None:
+    """Test latest-N lookup."""
+    index = FeatureIndex()
+    for ts in range(5):
+        index.add(1, ts, f"key-{ts}")
+
+    assert index.latest(1) == [(4, "key-4")]
+    assert index.latest(1, n=2) == [(4, "key-4"), (3, "key-3")]
+    assert len(index.latest(1, n=10)) == 5
+    assert index.latest(1, n=0) == []
+    assert index.latest(2) == []
+
+
+def test_feature_index_as_of() -> None:
+    """Test point-in-time lookup."""
+    index = FeatureIndex()
+    index.add(1, 10, "a")
+    index.add(1, 20, "b")
+
+    assert index.as_of(1, 5) is None
+    assert index.as_of(1, 10) == (10, "a")
+    assert index.as_of(1, 19) == (10, "a")
+    assert index.as_of(1, 100) == (20, "b")
+    assert index.as_of(2, 100) is None
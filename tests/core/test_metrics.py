@@ -0,0 +1,171 @@
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from flowlayer.core.engine import PoolEngine, SerialEngine
+from flowlayer.core.hints import Resources
+from flowlayer.core.metrics import FileExporter, HTTPExporter, MetricsRegistry
+from flowlayer.core.network import Network
+from flowlayer.core.nodes import GearException
+from tests.fixtures.core.generics import Fixture
+
+
+def test_metrics_render() -> None:
+    """Test metrics are rendered in Prometheus text format."""
+    metrics = MetricsRegistry(buckets=(0.1, 1.0))
+    assert metrics.render() == ""
+
+    metrics.inc("flowlayer_runs_total", network="net", status="completed")
+    metrics.inc("flowlayer_runs_total", 2, network="net", status="completed")
+    metrics.set("flowlayer_runs_active", 3)
+    metrics.add("flowlayer_runs_active", -1)
+    metrics.observe("flowlayer_run_duration_seconds", 0.05, network='quoted "net"')
+    metrics.observe("flowlayer_run_duration_seconds", 0.5, network='quoted "net"')
+
+    assert metrics.value("flowlayer_runs_total", network="net", status="completed") == 3
+    assert metrics.value("flowlayer_run_duration_seconds", network='quoted "net"').count == 2
+
+    assert metrics.render() == (
+        "# HELP flowlayer_run_duration_seconds Run latency by network.\n"
+        "# TYPE flowlayer_run_duration_seconds histogram\n"
+        'flowlayer_run_duration_seconds_bucket{network="quoted \\"net\\"",le="0.1"} 1\n'
+        'flowlayer_run_duration_seconds_bucket{network="quoted \\"net\\"",le="1"} 2\n'
+        'flowlayer_run_duration_seconds_bucket{network="quoted \\"net\\"",le="+Inf"} 2\n'
+        'flowlayer_run_duration_seconds_sum{network="quoted \\"net\\""} 0.55\n'
+        'flowlayer_run_duration_seconds_count{network="quoted \\"net\\""} 2\n'
+        "# HELP flowlayer_runs_active Runs in flight.\n"
+        "# TYPE flowlayer_runs_active gauge\n"
+        "flowlayer_runs_active 2\n"
+        "# HELP flowlayer_runs_total Finished runs by network and status.\n"
+        "# TYPE flowlayer_runs_total counter\n"
+        'flowlayer_runs_total{network="net",status="completed"} 3\n'
+    )
+
+
+def test_metrics_errors() -> None:
+    """Test invalid metric updates."""
+    metrics = MetricsRegistry()
+
+    with pytest.raises(KeyError):
+        metrics.inc("unknown_total")
+
+    with pytest.raises(ValueError):
+        metrics.observe("flowlayer_runs_total", 1.0)
+
+    with pytest.raises(ValueError):
+        metrics.inc("flowlayer_runs_total", -1)
+
+    with pytest.raises(ValueError):
+        metrics.declare("custom", "summary", "Unsupported kind.")
+
+    metrics.declare("custom_total", "counter", "Custom counter.")
+    metrics.inc("custom_total")
+    assert "custom_total 1\n" in metrics.render()
+
+
+def test_file_exporter(tmp_path: Path) -> None:
+    """Test metrics are dumped into a file."""
+    metrics = MetricsRegistry()
+    metrics.set("flowlayer_runs_active", 1)
+
+    exporter = FileExporter(metrics, tmp_path / "flowlayer.prom")
+    exporter.export()
+
+    assert exporter.path.read_text() == metrics.render()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_http_exporter() -> None:
+    """Test metrics are served over HTTP."""
+    metrics = MetricsRegistry()
+    metrics.set("flowlayer_runs_active", 1)
+
+    with HTTPExporter(metrics, port=0) as exporter:
+        host, port = exporter.address
+
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:  # nosec
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert response.read().decode("utf-8") == metrics.render()
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)  # nosec
+
+        with pytest.raises(ValueError):
+            exporter.export()
+
+    with pytest.raises(ValueError):
+        exporter.stop()
+
+
+def test_serial_engine_metrics(mynetwork: Fixture[Network]) -> None:
+    """Test serial engine records runs and gears."""
+    engine = SerialEngine()
+    engine.run(mynetwork, a=1, b=3, c1=10)
+
+    metrics = engine.metrics
+    assert metrics.value("flowlayer_runs_total", network="my-network", status="completed") == 1
+    assert metrics.value("flowlayer_runs_active") == 0
+    assert metrics.value("flowlayer_gear_duration_seconds", network="my-network", gear="add").count == 1
+
+    def broken(x: int) -> int:
+        raise RuntimeError("broken")
+
+    with pytest.raises(GearException):
+        engine.run(Network("broken", outputs=[broken]), x=1)  # type: ignore
+
+    assert metrics.value("flowlayer_runs_total", network="broken", status="failed") == 1
+    assert metrics.value("flowlayer_gear_failures_total", network="broken", gear="broken") == 1
+
+
+def test_pool_engine_metrics(heavynetwork: Fixture[Network]) -> None:
+    """Test pool engine records utilization of its budget."""
+    metrics = MetricsRegistry()
+    engine = PoolEngine(max_workers=4, metrics=metrics)
+    engine.setup()
+
+    engine.run(heavynetwork, x=3, y=3)
+    engine.teardown()
+
+    assert engine.metrics is metrics
+    assert metrics.value("flowlayer_pool_cpus") == 4
+    assert metrics.value("flowlayer_pool_cpus_used") == 0
+    assert metrics.value("flowlayer_queued_gears", network="heavy-network") == 0
+    assert metrics.value("flowlayer_gear_duration_seconds", network="heavy-network", gear="heavy_out").count == 1
+    assert 'flowlayer_runs_total{network="heavy-network",status="completed"} 1' in metrics.render()
+
+
+def test_shared_metrics(heavynetwork: Fixture[Network]) -> None:
+    """Test engines sharing a registry add up their gauges."""
+    metrics = MetricsRegistry()
+    left = PoolEngine(max_workers=2, metrics=metrics)
+    right = PoolEngine(max_workers=3, metrics=metrics)
+    serial = SerialEngine(metrics=metrics)
+    assert metrics.value("flowlayer_pool_cpus") == 5
+
+    # NOTE: Hold part of the left budget while the right engine runs, its gauges must not overwrite the claim.
+    claimed = Resources(cpus=2, memory=100)
+    left.setup()
+    right.setup()
+    with left._capacity:
+        left._budget.acquire(claimed)
+        left._report_budget()
+
+    handle = right.submit(heavynetwork, x=3, y=3)
+    serial.run(heavynetwork, x=1, y=1)
+    handle.result()
+
+    assert metrics.value("flowlayer_pool_cpus_used") == 2
+    assert metrics.value("flowlayer_pool_memory_used_bytes") == 100
+    assert metrics.value("flowlayer_runs_active") == 0
+
+    with left._capacity:
+        left._budget.release(claimed)
+        left._report_budget()
+
+    left.teardown()
+    right.teardown()
+
+    assert metrics.value("flowlayer_pool_cpus_used") == 0
+    assert metrics.value("flowlayer_runs_total", network="heavy-network", status="completed") == 2
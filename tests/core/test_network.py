@@ -1,8 +1,10 @@
+from typing import List
+
 import pytest
 from numpy import array, ndarray
 
-from flowlayer.core.network import Network
-from flowlayer.core.nodes import GearNode
+from flowlayer.core.network import Depends, Map, Maybe, Network
+from flowlayer.core.nodes import GearNode, MapGear
 from tests.fixtures.core.generics import Fixture
 
 
@@ -99,3 +101,194 @@ def test_network_run(mynetwork: Fixture[Network]) -> None:
 
     _ = network.run(a=1, b=3, c1=10)
     network._engine.setup.assert_called_once_with()  # type: ignore
+
+
+def test_network_read_through(mynetwork: Fixture[Network]) -> None:
+    """Test read-through results skip computation."""
+    from unittest.mock import Mock
+
+    from flowlayer.core.stores import MemoryFeatureStore
+
+    store = MemoryFeatureStore()
+    network = Network("my-network", outputs=mynetwork._outputting_nodes, feature_store=store, read_through=True, cache_size=4)
+
+    first = network.run(a=1, b=3, c1=10)
+    assert len(network.cache) == 1
+
+    network._engine = Mock(wraps=network._engine)  # type: ignore
+    second = network.run(a=1, b=3, c1=10)
+    network._engine.execute.assert_not_called()  # type: ignore
+
+    assert [str(out.value) for out in second.results] == [str(out.value) for out in first.results]
+    assert network.cache.hits == 1
+
+    # NOTE: A cold in-process cache falls back to the feature store.
+    network.cache.clear()
+    third = network.run(a=1, b=3, c1=10)
+    network._engine.execute.assert_not_called()  # type: ignore
+    assert str(third.results[0].value) == str(array([-6, 1]))
+
+    network.run(a=2, b=3, c1=10)
+    network._engine.execute.assert_called_once()  # type: ignore
+
+
+def test_network_read_through_isolation(mynetwork: Fixture[Network]) -> None:
+    """Test cache hits are cheap and isolated from caller mutations."""
+    from unittest.mock import patch
+
+    from flowlayer.core.stores import MemoryFeatureStore
+
+    store = MemoryFeatureStore()
+    network = Network("my-network", outputs=mynetwork._outputting_nodes, feature_store=store, read_through=True)
+
+    first = network.run(a=1, b=3, c1=10)
+    assert network._last_results
+
+    first.results[0].value[0] = 100
+
+    with patch.object(Network, "copy", side_effect=AssertionError("network rebuilt on a cache hit")):
+        second = network.run(a=1, b=3, c1=10)
+
+    assert list(second.results[0].value) == [-6, 1]
+    assert network._last_results == []
+    assert second.graph is not network.graph
+    assert all(node.is_empty for node in second.outputs if node not in second.results)
+
+    second.results[0].value[0] = 200
+    network.cache.clear()
+    assert list(network.run(a=1, b=3, c1=10).results[0].value) == [-6, 1]
+
+
+def test_network_submit(mynetwork: Fixture[Network]) -> None:
+    """Test non-blocking runs resolve to the same results as blocking ones."""
+    network: Network = mynetwork
+
+    handle = network.submit(a=1, b=3, c1=10)
+    assert isinstance(handle.run_id, str)
+
+    result = handle.result(timeout=5)
+    assert list(result.results[0].value) == [-6, 1]
+    assert list(handle.output("my_out", timeout=5)) == [-6, 1]
+    assert list(handle.outputs) == ["my_out"]
+
+    assert handle.done()
+    assert handle.exception() is None
+    assert not handle.cancel()
+    assert not handle.cancelled()
+
+
+def test_network_submit_partial_and_cancel() -> None:
+    """Test early outputs are streamed and cancellation stops remaining gears."""
+    import threading
+
+    from flowlayer.core.engine import RunCancelled
+
+    gate = threading.Event()
+    executed = []
+
+    def fast() -> int:
+        return 1
+
+    def slow(value: Maybe[int] = Depends(fast)) -> int:
+        gate.wait(5)
+        return value
+
+    def after(value: Maybe[int] = Depends(slow)) -> int:
+        executed.append(value)
+        return value
+
+    handle = Network("partial", outputs=[fast, after]).submit()  # type: ignore
+    assert handle.output("fast", timeout=5) == 1
+
+    with pytest.raises(TimeoutError):
+        handle.result(timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        handle.output("after", timeout=0.01)
+
+    assert handle.cancel()
+    gate.set()
+
+    with pytest.raises(RunCancelled):
+        handle.result(timeout=5)
+
+    assert handle.cancelled()
+    assert executed == []
+    assert handle.outputs == {"fast": 1}
+
+
+def test_nested_network() -> None:
+    """Test networks are inlined into networks depending on them."""
+    calls: List[str] = []
+
+    def base(a: int, b: int = 10) -> int:
+        calls.append("base")
+        return a + b
+
+    def doubled(total: Maybe[int] = Depends(base)) -> int:
+        return total * 2
+
+    inner = Network("inner", outputs=[doubled])  # type: ignore
+
+    def scaled(a: int, doubled: Maybe[int] = Depends(inner), total: Maybe[int] = Depends(base)) -> int:
+        return doubled * a + total
+
+    outer = Network("outer", outputs=[scaled, inner])  # type: ignore
+    assert outer.outputting_nodes == [scaled, doubled]
+    assert outer.input_shape.keys() == {"a", "b"}
+
+    # NOTE: Gears shared across the network boundary join the graph once.
+    gears = sorted(str(node) for node in outer.graph.nodes if isinstance(node, GearNode))
+    assert gears == ["base", "doubled", "scaled"]
+
+    result = outer.run(a=2, b=3)
+    assert {node.name: node.value for node in result.results} == {"scaled": 25, "doubled": 10}
+    assert calls == ["base"]
+
+    with pytest.raises(ValueError):
+        Depends(outer)
+
+    with pytest.raises(ValueError):
+        Depends(outer, output="unknown")
+
+    with pytest.raises(ValueError):
+        Depends(base, output="base")
+
+    assert Depends(outer, output="doubled").func is doubled
+
+
+def test_map_network(mapnetwork: Fixture[Network]) -> None:
+    """Test mapped gears expand into one execution per element and are gathered in order."""
+    network: Network = mapnetwork
+    assert network.input_shape.keys() == {"count", "scale"}
+
+    [mapped] = [node for node in network.graph.nodes if isinstance(node, MapGear)]
+    assert mapped.item == "shard"
+    assert mapped.output_type == List[int]
+
+    result = network.run(count=4, scale=2)
+    values = {node.name: node.value for node in result.outputs}
+    assert values == {"shard": [0, 1, 2, 3], "squares": [0, 2, 8, 18], "shard_total": 28}
+
+    assert network.run(count=0, scale=2).results[0].value == 0
+
+
+def test_map_errors() -> None:
+    """Test invalid mapped gears."""
+
+    def source() -> List[int]:
+        return [1]
+
+    def constant() -> int:
+        return 1
+
+    def double(x: int) -> int:
+        return x * 2
+
+    with pytest.raises(ValueError):
+        Map(constant, over=source)
+
+    with pytest.raises(ValueError):
+        Map(double, over=source, item="y")
+
+    assert Map(double, over=Depends(source)).over.func is source
@@ -1,4 +1,5 @@
 import inspect
+import pickle
 import types
 from inspect import Parameter
 from typing import Any, Dict
@@ -161,3 +162,32 @@ def test_graph_data_node() -> None:
 
     data_node.set_graph(mynet.graph)
     assert data_node.graph == mynet.graph
+
+
+def test_data_node_validation_modes() -> None:
+    """Check validation modes of data nodes."""
+    import numpy
+
+    from flowlayer.core.network import Network
+    from flowlayer.core.nodes import DataNode
+
+    unchecked = DataNode("p", None, int, validation="off")
+    unchecked.set_value("x")
+    assert unchecked.value == "x"
+
+    data_node = DataNode("p", None, float)
+    data_node.set_value(numpy.float64(1.0))
+    assert data_node.value == 1.0
+
+    restored = pickle.loads(pickle.dumps(data_node))
+    with pytest.raises(TypeError):
+        restored.set_value("x")
+
+    def f(p: int = 3) -> ndarray:
+        return numpy.array([p + 1])
+
+    assert Network("mynet", outputs=[f]).validation == "fast"
+    assert Network("mynet", outputs=[f], validation="off").copy().validation == "off"
+
+    with pytest.raises(ValueError):
+        Network("mynet", outputs=[f], validation="paranoid")
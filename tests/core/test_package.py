@@ -52,3 +52,48 @@ class TestPackage:
         """Test make egg exceptions."""
         package = egg_path
         assert package.exists() is True
+
+    def test_make_egg_cached(self, egg_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test unchanged sources reuse the built egg."""
+        package = Package()
+        fingerprint = package.fingerprint()
+        assert fingerprint == package.fingerprint()
+        assert Path("setup.py") in package.sources()
+        assert not any(part in {"dist", "build", ".git"} for path in package.sources() for part in path.parts)
+        assert {path.parts[0] for path in package.sources() if len(path.parts) > 1} == set(package.packages())
+        assert Path("pyproject.toml") in package.sources()
+
+        monkeypatch.setattr(os, "system", lambda _: pytest.fail("egg rebuilt"))
+        assert package.make_egg() == egg_path
+
+        monkeypatch.setattr(Package, "BUILD_EGG_CMD", "python setup.py bdist_egg --quiet")
+        assert package.fingerprint() != fingerprint
+
+    def test_make_zip(self, tmp_path: Path) -> None:
+        """Test in-process zip builds are keyed by fingerprint and importable."""
+        import subprocess
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        package = Package(dist_dir=tmp_path / "dist")
+        assert package.packages() == ["flowlayer"]
+
+        stale = tmp_path / "dist" / f"{package.root.name}-0000000000000000.zip"  # type: ignore
+        stale.parent.mkdir()
+        stale.write_bytes(b"")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = set(executor.map(lambda _: package.make_zip(), range(4)))
+
+        assert len(paths) == 1
+        path = paths.pop()
+        assert path.suffix == ".zip"
+        assert [child.name for child in path.parent.iterdir()] == [path.name]
+
+        mtime = path.stat().st_mtime_ns
+        assert package.make_zip() == path
+        assert path.stat().st_mtime_ns == mtime
+
+        code = "import flowlayer.core.nodes as n; print(n.__file__)"
+        output = subprocess.check_output([sys.executable, "-c", code], env={"PYTHONPATH": str(path)}, cwd=tmp_path)
+        assert str(path) in output.decode("utf-8")
@@ -1,9 +1,14 @@
 from pathlib import Path
+from typing import Any
 
 import pytest
+from networkx import MultiDiGraph
 
+import flowlayer.core.plot as plot_module
 from flowlayer.core.api import NetworkPlotAPI
 from flowlayer.core.network import Network
+from flowlayer.core.nodes import GearInput, GearInputOutput, GearNode
+from flowlayer.core.plot import NetworkPlot
 
 
 def test_network_plot(mynetwork: Network) -> None:
@@ -17,3 +22,67 @@ def test_network_plot(mynetwork: Network) -> None:
 
     with pytest.raises(ValueError):
         plot.to_file(None)  # type: ignore
+
+
+def test_fast_plot(mynetwork: Network, tmp_path: Path) -> None:
+    """Test fast plots render without graphviz."""
+    plot = NetworkPlot(mynetwork.graph, fast=True)
+    assert plot.fast
+    assert plot.detail == "gears"
+    assert plot.meta["nodes"] == mynetwork.graph.number_of_nodes()
+
+    dot = plot.to_dot()
+    assert dot.startswith('digraph "my-network" {')
+    assert 'label="tests.fixtures.core.fixture_network";' in dot
+    assert '[label="sum"];' in dot
+    assert "input_output" not in dot
+
+    svg = plot.to_svg()
+    assert svg.startswith("<svg")
+    assert ">reduce</text>" in svg
+    assert ">sum</text>" in svg
+
+    plot.to_file(str(tmp_path / "plot.svg"))
+    plot.to_file(str(tmp_path / "plot.dot"))
+    assert (tmp_path / "plot.dot").read_text() == dot
+
+    with pytest.raises(ValueError):
+        plot.to_file(str(tmp_path / "plot.png"))
+
+    with pytest.raises(ValueError):
+        NetworkPlot(mynetwork.graph, detail="pixels")
+
+
+def test_plot_detail(mynetwork: Network) -> None:
+    """Test levels of detail of fast plots."""
+    nodes = NetworkPlot(mynetwork.graph, fast=True, detail="nodes").sketch
+    assert len(nodes.nodes) == mynetwork.graph.number_of_nodes()
+
+    gears = NetworkPlot(mynetwork.graph, fast=True, detail="gears").sketch
+    assert sorted(label for label, shape, _ in gears.nodes.values() if shape == "circle") == ["add", "add_one", "my_out", "reduce"]
+    assert sorted(label for _, _, label in gears.edges if label) == ["add_one", "reduced", "sum"]
+
+    modules = NetworkPlot(mynetwork.graph, fast=True, detail="modules").sketch
+    assert list(modules.nodes) == ["tests.fixtures.core.fixture_network"]
+    assert modules.edges == []
+
+
+def test_large_plot(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test large graphs default to fast plots."""
+    graph = MultiDiGraph(name="large")
+    gears = [GearNode(lambda x: x) for _ in range(2000)]
+    for gear in gears:
+        graph.add_edge(GearInput("x", None, Any), gear)
+
+    for src, dst in zip(gears, gears[1:]):
+        data_node = GearInputOutput("x", None, Any)
+        graph.add_edge(src, data_node)
+        graph.add_edge(data_node, dst)
+
+    plot = NetworkPlot(graph)
+    assert plot.fast
+    assert plot.detail == "gears"
+    assert plot.to_svg().count("<ellipse") == len(gears)
+
+    monkeypatch.setattr(plot_module, "GEAR_DETAIL_NODES", 100)
+    assert NetworkPlot(graph).detail == "modules"
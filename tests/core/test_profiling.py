@@ -0,0 +1,119 @@
+import tracemalloc
+
+import numpy
+import pytest
+from numpy import ndarray
+
+from flowlayer.core.engine import PoolEngine, SerialEngine
+from flowlayer.core.network import Depends, Maybe, Network
+from flowlayer.core.profiling import MemoryProfile, format_size, profiled, value_size
+from tests.fixtures.core.generics import Fixture
+
+MEBIBYTE = 1024 * 1024
+
+
+def test_value_size() -> None:
+    """Test sizes of produced values."""
+    assert value_size(numpy.zeros(1000, dtype=numpy.uint8)) == 1000
+    assert value_size([numpy.zeros(10, dtype=numpy.uint8)] * 3) > 30
+    assert value_size({"key": "value"}) > value_size({})
+
+    assert format_size(512) == "512 B"
+    assert format_size(3 * MEBIBYTE) == "3.0 MiB"
+
+
+def test_profiled() -> None:
+    """Test allocations of a call are traced."""
+
+    def allocate(size: int) -> int:
+        buffer = bytearray(size)
+        return len(buffer)
+
+    result, (started, finished, peak, rss) = profiled(allocate, 10 * MEBIBYTE)
+
+    assert result == 10 * MEBIBYTE
+    assert started <= finished
+    assert peak >= 10 * MEBIBYTE
+    assert rss > 0
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.parametrize("resettable", [True, False])
+def test_profiled_while_tracing(resettable: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test peak covers only the call when tracing is already active, with and without `reset_peak`."""
+    if not resettable:
+        monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+
+    tracemalloc.start()
+    try:
+        buffer = bytearray(20 * MEBIBYTE)
+        del buffer
+
+        _, (_, _, peak, _) = profiled(lambda: len(bytearray(MEBIBYTE)))
+        assert MEBIBYTE <= peak < 10 * MEBIBYTE
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_profile() -> None:
+    """Test ranking and high-water timeline of a run."""
+    profile = MemoryProfile("run", "network")
+    t0 = profile.started
+
+    profile.record("left", (t0, t0 + 1, 100, 0), numpy.zeros(10, dtype=numpy.uint8))
+    profile.record("right", (t0 + 0.5, t0 + 2, 200, 0), numpy.zeros(20, dtype=numpy.uint8))
+
+    assert [gear.gear for gear in profile.ranked()] == ["right", "left"]
+    assert [gear.gear for gear in profile.ranked("seconds")] == ["right", "left"]
+    assert profile.timeline() == [(0, 100), (0.5, 300), (1, 210), (2, 30)]
+    assert profile.high_water == 300
+
+    lines = profile.table().splitlines()
+    assert lines[0].split() == ["#", "gear", "peak", "value", "seconds", "rss"]
+    assert lines[1].split()[:2] == ["1", "right"]
+    assert lines[-1] == "high-water 300 B"
+
+
+def big() -> ndarray:
+    return numpy.ones(MEBIBYTE, dtype=numpy.uint8)
+
+
+def small(values: Maybe[ndarray] = Depends(big)) -> int:
+    return int(values.sum())
+
+
+def test_serial_engine_profile() -> None:
+    """Test serial engine profiles gears of runs."""
+    engine = SerialEngine(profile=True)
+    network = Network("profiled", outputs=[small], engine=engine)  # type: ignore
+
+    assert network.run().results[0].value == MEBIBYTE
+
+    [profile] = engine.profiles
+    assert profile.network == "profiled"
+
+    top = profile.ranked("value_bytes")[0]
+    assert top.gear == "big"
+    assert top.value_bytes == MEBIBYTE
+    assert top.peak_bytes >= MEBIBYTE
+    assert profile.high_water >= MEBIBYTE
+
+    unprofiled = SerialEngine()
+    unprofiled.run(network)
+    assert unprofiled.profiles == []
+
+
+def test_pool_engine_profile(heavynetwork: Fixture[Network]) -> None:
+    """Test pool engine profiles gears inside its workers."""
+    engine = PoolEngine(profile=True)
+    engine.setup()
+
+    handle = engine.submit(heavynetwork, x=3, y=3)
+    assert [list(result.value) for result in handle.result(timeout=30).results] == [[4, 6]]
+    engine.teardown()
+
+    assert handle.profile is not None
+    assert sorted(gear.gear for gear in handle.profile.gears) == ["heavy_left", "heavy_out", "heavy_right"]
+    assert all(gear.rss_bytes > 0 for gear in handle.profile.gears)
+    assert engine.profiles == [handle.profile]
@@ -0,0 +1,101 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from flowlayer.core.engine import SerialEngine
+from flowlayer.core.network import Network
+from flowlayer.core.registry import NetworkRegistry, version_key
+from tests.fixtures.core.generics import Fixture
+
+
+def test_version_key() -> None:
+    """Test versions sort numerically."""
+    assert sorted(["0.10.0", "0.2.0", "0.9.1"], key=version_key) == ["0.2.0", "0.9.1", "0.10.0"]
+    assert version_key("1.0.0rc1") > version_key("1.0.0")
+
+
+def test_registry_publish(mynetwork: Fixture[Network], tmp_path: Path) -> None:
+    """Test networks are published and loaded from a registry."""
+    registry = NetworkRegistry(tmp_path)
+
+    path = registry.publish(mynetwork)
+    assert path == tmp_path / "my-network" / "0.1.0.flow"
+    assert not list(path.parent.glob("*.tmp"))
+
+    assert registry.refresh() == ["my-network-0.1.0"]
+    assert registry.refresh() == []
+
+    loaded = registry.get("my-network")
+    assert loaded.identifier == mynetwork.identifier
+    assert registry.networks() == [loaded]
+
+    with pytest.raises(KeyError):
+        registry.get("unknown")
+
+    with pytest.raises(KeyError):
+        registry.get("my-network", "9.9.9")
+
+
+def test_registry_versions(mynetwork: Fixture[Network], tmp_path: Path) -> None:
+    """Test new versions are swapped in while held networks stay usable."""
+    registry = NetworkRegistry(tmp_path)
+    registry.publish(mynetwork)
+    registry.refresh()
+
+    held = registry.get("my-network")
+
+    registry.publish(mynetwork.copy(version="0.10.0"))
+    assert registry.refresh() == ["my-network-0.10.0"]
+    assert registry.versions("my-network") == ["0.1.0", "0.10.0"]
+    assert registry.get("my-network").version == "0.10.0"
+
+    assert held.run(a=1, b=2, c1=3).results[0].value is not None
+
+    os.unlink(tmp_path / "my-network" / "0.10.0.flow")
+    registry.refresh()
+    assert registry.get("my-network").version == "0.1.0"
+
+
+def test_registry_broken_artifact(mynetwork: Fixture[Network], tmp_path: Path) -> None:
+    """Test broken artifacts keep previous version loaded."""
+    registry = NetworkRegistry(tmp_path)
+    path = registry.publish(mynetwork)
+    registry.refresh()
+
+    path.write_bytes(b"broken")
+    assert registry.refresh() == []
+    assert registry.get("my-network").version == "0.1.0"
+
+
+def test_engine_registry(mynetwork: Fixture[Network], tmp_path: Path) -> None:
+    """Test networks registered through engines are picked up by workers."""
+    engine = SerialEngine(registry=NetworkRegistry(tmp_path))
+    network = Network("my-network", outputs=mynetwork.outputting_nodes, engine=engine)
+    network.register()
+
+    worker_registry = NetworkRegistry(tmp_path, interval=0.01)
+    worker_engine = SerialEngine(registry=worker_registry)
+    assert worker_registry.engine is worker_engine
+
+    with worker_registry:
+        assert worker_registry.is_running
+
+        networks = worker_engine.get_networks()
+        assert [str(n) for n in networks] == ["my-network-0.1.0"]
+        assert networks[0]._engine is worker_engine  # type: ignore
+
+        engine.register(Network("my-network", outputs=mynetwork.outputting_nodes, version="0.2.0"))
+
+        deadline = time.monotonic() + 5
+        while worker_registry.versions("my-network") != ["0.1.0", "0.2.0"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert worker_engine.get_networks()[0].version == "0.2.0"
+        assert worker_engine.get_networks()[0]._engine is worker_engine  # type: ignore
+
+    assert not worker_registry.is_running
+
+    with pytest.raises(ValueError):
+        worker_registry.stop()
@@ -0,0 +1,78 @@
+import time
+from typing import Iterator, Union
+
+import pytest
+
+from flowlayer.core.network import Network
+from flowlayer.core.retention import Compactor, RetentionPolicy
+from flowlayer.core.stores import MemoryFeatureStore
+from tests.fixtures.core.generics import Fixture
+
+
+def test_retention_policy() -> None:
+    """Test selection of expired keys."""
+    entries = [(0, "a", "x"), (5, "b", "y"), (10, "c", "x"), (15, "d", None)]
+
+    assert RetentionPolicy().expired(entries, 20) == set()
+    assert RetentionPolicy(max_age=10).expired(entries, 20) == {"a", "b"}
+    assert RetentionPolicy(max_count=2).expired(entries, 20) == {"a", "b"}
+    assert RetentionPolicy(latest_per_entity=True).expired(entries, 20) == {"a"}
+    assert RetentionPolicy(max_age=12, max_count=1, latest_per_entity=True).expired(entries, 20) == {"a", "b", "c"}
+
+    with pytest.raises(ValueError):
+        RetentionPolicy(max_age=-1)
+
+    with pytest.raises(ValueError):
+        RetentionPolicy(max_count=-1)
+
+
+def test_compactor(mynetwork: Fixture[Network]) -> None:
+    """Test background compaction."""
+    store = MemoryFeatureStore()
+    store.set_retention(mynetwork, RetentionPolicy(max_count=1))
+    for ts in range(3):
+        store.set(ts, mynetwork, timestamp=ts)
+
+    compactor = Compactor(store, interval=0.01)
+    with pytest.raises(ValueError):
+        compactor.stop()
+
+    with compactor:
+        assert compactor.is_running
+        with pytest.raises(ValueError):
+            compactor.start()
+
+        deadline = time.time() + 5
+        while compactor.removed < 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+    assert compactor.is_running is False
+    assert compactor.removed == 2
+    assert [ts for ts, _ in store.latest(mynetwork, n=5)] == [2]
+
+
+def test_compactor_survives_failures(mynetwork: Fixture[Network], caplog: pytest.LogCaptureFixture) -> None:
+    """Test compactor keeps running when a pass fails."""
+    from unittest.mock import Mock
+
+    results: Iterator[Union[int, Exception]] = iter([RuntimeError("boom"), 3])
+
+    def compact(now: int) -> int:
+        result = next(results, 0)
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    store = Mock()
+    store.compact.side_effect = compact
+
+    with Compactor(store, interval=0.01) as compactor:
+        deadline = time.time() + 5
+        while compactor.removed < 3 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert compactor.is_running
+
+    assert compactor.removed == 3
+    assert "feature store compaction failed" in caplog.text
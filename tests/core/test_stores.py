@@ -0,0 +1,136 @@
+import pytest
+from numpy import array
+
+from flowlayer.core.network import Network
+from flowlayer.core.stores import MemoryFeatureStore
+from tests.fixtures.core.generics import Fixture
+
+
+def test_memory_store_set_get(mynetwork: Fixture[Network]) -> None:
+    """Test storing and retrieving tensors."""
+    store = MemoryFeatureStore()
+
+    stream_id, key = store.set(array([1, 2]), mynetwork, timestamp=100)
+    assert stream_id.startswith("100-")
+    assert key.startswith(f"{mynetwork.identifier}-100-")
+    assert list(store.get(key)) == [1, 2]
+
+    assert store.get_keys(mynetwork) == [(stream_id, key)]
+
+
+def test_memory_store_time_queries(mynetwork: Fixture[Network]) -> None:
+    """Test latest, range and point-in-time queries."""
+    store = MemoryFeatureStore()
+    keys = [store.set(array([ts]), mynetwork, timestamp=ts)[1] for ts in (10, 20, 30, 40)]
+
+    assert store.latest(mynetwork) == [(40, keys[3])]
+    assert [key for _, key in store.latest(mynetwork, n=2)] == [keys[3], keys[2]]
+    assert [key for _, key in store.get_range(mynetwork, 15, 30)] == [keys[1], keys[2]]
+    assert store.as_of(mynetwork, 25) == (20, keys[1])
+    assert store.as_of(mynetwork, 5) is None
+
+    assert [key for _, key in store.get_keys(mynetwork, start="20-0", end="+", limit=2)] == [keys[1], keys[2]]
+
+
+def test_network_run_with_store(mynetwork: Fixture[Network]) -> None:
+    """Test network pushes results into the store."""
+    store = MemoryFeatureStore()
+    network = Network("my-network", outputs=mynetwork._outputting_nodes, feature_store=store)
+
+    network.run(a=1, b=3, c1=10)
+
+    latest = store.latest(network)
+    assert len(latest) == 1
+    assert list(store.get(latest[0][1])) == [-6, 1]
+
+
+def test_memory_store_retention(mynetwork: Fixture[Network]) -> None:
+    """Test compaction of stored features."""
+    from flowlayer.core.retention import RetentionPolicy
+
+    store = MemoryFeatureStore()
+    keys = [store.set(array([ts]), mynetwork, timestamp=ts, entity=str(ts % 2))[1] for ts in range(10)]
+
+    assert store.compact(now=100) == 0
+
+    store.set_retention(mynetwork, RetentionPolicy(max_age=5))
+    assert store.compact(now=10) == 5
+    assert [key for _, key in store.get_range(mynetwork)] == keys[5:]
+
+    store.set_retention(mynetwork, RetentionPolicy(latest_per_entity=True))
+    assert store.compact(now=10) == 3
+    assert [key for _, key in store.get_range(mynetwork)] == keys[8:]
+
+    store.set_retention(mynetwork, RetentionPolicy(max_count=1))
+    assert store.compact(now=10) == 1
+    assert store.latest(mynetwork, n=5) == [(9, keys[9])]
+
+    with pytest.raises(KeyError):
+        store.get(keys[0])
+
+    store.set_retention(mynetwork, None)
+    store.set(array([20]), mynetwork, timestamp=20)
+    assert store.compact(now=1000) == 0
+
+
+def test_network_run_with_entity(mynetwork: Fixture[Network]) -> None:
+    """Test network tags stored results with an entity."""
+    from flowlayer.core.retention import RetentionPolicy
+
+    store = MemoryFeatureStore()
+    network = Network("my-network", outputs=mynetwork._outputting_nodes, feature_store=store, entity_key="a")
+    store.set_retention(network, RetentionPolicy(latest_per_entity=True))
+
+    for a in (1, 2, 1):
+        network.run(a=a, b=3, c1=10)
+
+    assert store.compact() == 1
+    assert len(store.get_range(network)) == 2
+
+    with pytest.raises(ValueError):
+        Network("my-network", outputs=mynetwork._outputting_nodes, feature_store=store, entity_key="missing")
+
+
+def test_memory_store_stream_paging(mynetwork: Fixture[Network]) -> None:
+    """Test stream id boundaries compare sequences within a millisecond."""
+    store = MemoryFeatureStore()
+    written = [store.set(array([i]), mynetwork, timestamp=20) for i in range(3)] + [store.set(array([3]), mynetwork, timestamp=30)]
+    ids = [stream_id for stream_id, _ in written]
+
+    assert store.get_keys(mynetwork, start=ids[1]) == written[1:]
+    assert store.get_keys(mynetwork, start=f"({ids[1]}") == written[2:]
+    assert store.get_keys(mynetwork, end=ids[1]) == written[:2]
+    assert store.get_keys(mynetwork, end=f"({ids[1]}") == written[:1]
+    assert store.get_keys(mynetwork, start="20", end="20") == written[:3]
+    assert store.get_keys(mynetwork, start="(20-0", limit=1) == written[:1]
+
+    # NOTE: Paging from the last seen id never repeats it.
+    pages, start = [], "-"
+    while True:
+        page = store.get_keys(mynetwork, start=start, limit=2)
+        if not page:
+            break
+
+        pages += page
+        start = f"({page[-1][0]}"
+
+    assert pages == written
+
+
+def test_memory_store_outputs_retention(mynetwork: Fixture[Network]) -> None:
+    """Test read-through outputs are subject to retention."""
+    from flowlayer.core.retention import RetentionPolicy
+
+    store = MemoryFeatureStore()
+    for ts in range(4):
+        store.set_outputs(mynetwork, f"key-{ts}", {"my_out": array([ts])}, timestamp=ts)
+
+    store.set_outputs(mynetwork, "key-3", {"my_out": array([30])}, timestamp=3)
+    assert list(store.get_outputs(mynetwork, "key-3")["my_out"]) == [30]  # type: ignore
+
+    store.set_retention(mynetwork, RetentionPolicy(max_count=2))
+    assert store.compact(now=10) == 2
+
+    assert store.get_outputs(mynetwork, "key-0") is None
+    assert store.get_outputs(mynetwork, "key-1") is None
+    assert store.get_outputs(mynetwork, "key-2") is not None
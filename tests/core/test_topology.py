@@ -0,0 +1,95 @@
+import pickle
+
+import pytest
+
+from flowlayer.core.network import Network
+from flowlayer.core.nodes import GearInput, GearNode, GearOutput
+from flowlayer.core.topology import Topology
+from tests.fixtures.core.generics import Fixture
+
+
+def test_topology_construction(mynetwork: Fixture[Network]) -> None:
+    """Test compressed adjacency of a network."""
+    network: Network = mynetwork
+    topology = network.topology
+
+    assert len(topology) == network.graph.number_of_nodes()
+    assert len(topology.indptr) == len(topology) + 1
+    assert topology.indptr[-1] == len(topology.indices)
+
+    # NOTE: Nodes are numbered topologically, all edges point forward.
+    position = {node: i for i, node in enumerate(topology.nodes)}
+    for src, dst in network.graph.edges():
+        assert position[src] < position[dst]
+
+    for node in topology.nodes:
+        assert set(topology.successors(node)) == set(network.graph.successors(node))
+
+
+def test_topology_compute_next(mynetwork: Fixture[Network]) -> None:
+    """Test evaluation order driven by compressed adjacency."""
+    network: Network = mynetwork
+
+    first = {str(node) for node in network.compute_next()}
+    assert first == {"reduce(sum[int] = None, ...)", "my_out(add_one[int] = None, ...)"}
+
+    network_run = network.run(a=1, b=2, c1=3)
+    assert network_run.compute_next() == []
+
+
+def test_topology_compute_next_on_demand(mynetwork: Fixture[Network]) -> None:
+    """Test outputs consumed only by gears with known results are skipped."""
+    network: Network = mynetwork
+
+    reduced = next(node for node in network.outputs if node.name == "reduced")
+    reduced.set_value(7)
+
+    assert {str(node) for node in network.compute_next()} == {"my_out(add_one[int] = None, ...)"}
+
+
+def test_topology_rebuilt_on_change(mynetwork: Fixture[Network]) -> None:
+    """Test topology follows graph mutations."""
+    network: Network = mynetwork
+    topology = network.topology
+    assert network.topology is topology
+
+    def extra(z: int) -> int:
+        return z
+
+    gear = GearNode(extra, graph=network.graph)
+    network.graph.add_edge(GearInput("z", None, int, graph=network.graph), gear)
+    network.graph.add_edge(gear, GearOutput("extra", None, int, graph=network.graph))
+
+    assert topology.is_stale(network.graph)
+    assert network.topology is not topology
+    assert len(network.topology) == len(topology) + 3
+    assert isinstance(Topology(network.graph), Topology)
+
+
+def test_topology_rebuilt_on_rewire(mynetwork: Fixture[Network]) -> None:
+    """Test topology follows rewiring which keeps node and edge counts."""
+    network: Network = mynetwork
+    topology = network.topology
+
+    src, dst, _ = next(iter(network.graph.edges(keys=True)))
+    network.graph.remove_edge(src, dst)
+    network.graph.add_edge(src, dst)
+
+    assert topology.is_stale(network.graph)
+    assert network.topology is not topology
+
+
+def test_slotted_nodes(mynetwork: Fixture[Network]) -> None:
+    """Test nodes do not carry per-instance dictionaries."""
+    network: Network = mynetwork
+
+    for node in network.graph.nodes:
+        assert not hasattr(node, "__dict__")
+
+        with pytest.raises(AttributeError):
+            node.unknown = 1
+
+    gear = next(node for node in network.graph.nodes if isinstance(node, GearNode))
+    restored = pickle.loads(pickle.dumps(gear.detach()))
+    assert restored.name == gear.name
+    assert restored.params.keys() == gear.params.keys()
@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy
+import pytest
+
+from flowlayer.core.validation import ArrayContract, compile_checker
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+class ArraySubclass(numpy.ndarray):
+    pass
+
+
+@pytest.mark.parametrize("mode", ["fast", "strict"])
+def test_checker_scalars(mode: str) -> None:
+    """Test subclasses and NumPy scalars satisfy builtin annotations."""
+    assert compile_checker(int, mode)(3)
+    assert compile_checker(int, mode)(numpy.int64(3))
+    assert not compile_checker(int, mode)(3.5)
+
+    assert compile_checker(float, mode)(numpy.float64(1.5))
+    assert compile_checker(float, mode)(2)
+    assert not compile_checker(float, mode)("2")
+
+    assert compile_checker(Base, mode)(Child())
+    assert compile_checker(numpy.ndarray, mode)(numpy.zeros(2).view(ArraySubclass))
+    assert not compile_checker(str, mode)(2)
+
+
+@pytest.mark.parametrize("mode", ["fast", "strict"])
+def test_checker_generics(mode: str) -> None:
+    """Test typing constructs."""
+    assert compile_checker(Optional[int], mode)(None)
+    assert compile_checker(Optional[int], mode)(1)
+    assert not compile_checker(Optional[int], mode)("1")
+
+    assert compile_checker(Union[Any, int], mode)("anything")
+    assert compile_checker(Any, mode)(object())
+    assert compile_checker("ForwardRef", mode)(object())
+
+    assert compile_checker(List[int], mode)([1, 2])
+    assert not compile_checker(List[int], mode)((1, 2))
+
+
+def test_checker_strict_items() -> None:
+    """Test strict mode checks container items."""
+    assert compile_checker(List[int], "fast")([1, "2"])
+    assert not compile_checker(List[int], "strict")([1, "2"])
+
+    assert compile_checker(Dict[str, int], "strict")({"a": 1})
+    assert not compile_checker(Dict[str, int], "strict")({"a": "1"})
+
+    assert compile_checker(Tuple[int, str], "strict")((1, "a"))
+    assert not compile_checker(Tuple[int, str], "strict")((1, 2))
+    assert compile_checker(Tuple[int, ...], "strict")((1, 2, 3))
+
+
+def test_checker_array_contracts() -> None:
+    """Test strict mode checks dtype and shape of arrays."""
+    from typing import Annotated
+
+    from numpy.typing import NDArray
+
+    assert compile_checker(NDArray[numpy.float64], "fast")(numpy.zeros(2, dtype=numpy.int32))
+    assert compile_checker(NDArray[numpy.float64], "strict")(numpy.zeros(2))
+    assert not compile_checker(NDArray[numpy.float64], "strict")(numpy.zeros(2, dtype=numpy.int32))
+
+    matrix = Annotated[numpy.ndarray, ArrayContract(dtype=numpy.floating, shape=(None, 3))]
+    assert compile_checker(matrix, "fast")(numpy.zeros((2, 2)))
+    assert compile_checker(matrix, "strict")(numpy.zeros((5, 3)))
+    assert not compile_checker(matrix, "strict")(numpy.zeros((5, 2)))
+    assert not compile_checker(matrix, "strict")(numpy.zeros(3))
+    assert not compile_checker(matrix, "strict")(numpy.zeros((5, 3), dtype=int))
+    assert not compile_checker(matrix, "strict")([1, 2, 3])
+
+    assert ArrayContract(shape=(1,)) == ArrayContract(shape=(1,))
+    assert "shape=(1,)" in repr(ArrayContract(shape=(1,)))
+
+
+def test_checker_modes() -> None:
+    """Test off mode and invalid modes."""
+    assert compile_checker(int, "off")("not an int")
+    assert compile_checker(int, "fast") is compile_checker(int, "fast")
+
+    with pytest.raises(ValueError):
+        compile_checker(int, "paranoid")
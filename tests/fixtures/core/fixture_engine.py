@@ -33,3 +33,20 @@ def dask_engine(egg_path: Path) -> Iterator[EngineAPI]:
 
         engine._executor = _executor  # type: ignore
         engine.teardown()
+
+
+@pytest.fixture(scope="session")
+def local_dask_engine() -> Iterator[EngineAPI]:
+    """Create dask engine backed by an in-process local cluster."""
+    pytest.importorskip("distributed")
+    from distributed import LocalCluster
+
+    from flowlayer.core.engine import DaskEngine
+
+    with LocalCluster(n_workers=2, threads_per_worker=1, processes=False, dashboard_address=None) as cluster:
+        engine = DaskEngine(cluster.scheduler_address, [], None)
+        engine.setup()
+
+        yield engine
+
+        engine.teardown()
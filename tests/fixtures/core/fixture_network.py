@@ -1,7 +1,10 @@
+from typing import List
+
 import pytest
 from numpy import array, ndarray
 
-from flowlayer.core.network import Depends, Maybe, Network
+from flowlayer.core.hints import resources
+from flowlayer.core.network import Depends, Map, Maybe, Network
 
 
 def add(a: int, b: int = 10) -> int:
@@ -29,3 +32,41 @@ def mynetwork() -> Network:
 
     network = Network("my-network", outputs=[my_out])
     return network
+
+
+@resources(memory=600)
+def heavy_left(x: int) -> int:
+    return x + 1
+
+
+@resources(cpus=2, memory=600)
+def heavy_right(y: int) -> int:
+    return y * 2
+
+
+def heavy_out(left: Maybe[int] = Depends(heavy_left), right: Maybe[int] = Depends(heavy_right)) -> ndarray:
+    return array([left, right])
+
+
+@pytest.fixture
+def heavynetwork() -> Network:
+    """Testing fixture for a network with resource hints."""
+    return Network("heavy-network", outputs=[heavy_out])
+
+
+def shards(count: int) -> List[int]:
+    return list(range(count))
+
+
+def square_shard(shard: int, scale: int = 1) -> int:
+    return shard * shard * scale
+
+
+def shard_total(squares: Maybe[List[int]] = Map(square_shard, over=shards)) -> int:
+    return sum(squares)
+
+
+@pytest.fixture
+def mapnetwork() -> Network:
+    """Testing fixture for a network fanning out over a collection."""
+    return Network("map-network", outputs=[shard_total])  # type: ignore
@@ -0,0 +1,41 @@
+import json
+import subprocess  # nosec
+import sys
+from typing import List
+
+import pytest
+
+HEAVY_MODULES = ["numpy", "networkx", "distributed", "concurrent.futures.process"]
+
+
+def loaded_modules(statement: str) -> List[str]:
+    """Return heavy modules loaded by a statement in a fresh interpreter."""
+    probe = f"import json, sys; {statement}; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    output = subprocess.check_output([sys.executable, "-c", probe])  # nosec
+
+    modules: List[str] = json.loads(output)
+    return modules
+
+
+@pytest.mark.parametrize("statement", ["import flowlayer", "from flowlayer import Depends, Flow, Map"])
+def test_import_is_lazy(statement: str) -> None:
+    """Test heavy dependencies are deferred until a network is built."""
+    assert loaded_modules(statement) == []
+
+
+def test_network_loads_dependencies() -> None:
+    """Test dependencies are loaded on first use."""
+    assert "networkx" in loaded_modules("from flowlayer import Flow; Flow('lazy')")
+
+
+def test_import_time() -> None:
+    """Guard cumulative import time of the public API, including modules `__getattr__` imports on access."""
+    statement = "from flowlayer import Flow"
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True)  # nosec
+
+    # NOTE: Lazily imported modules are reported as top level imports next to the package itself.
+    rows = [line.split("|") for line in output.stderr.splitlines() if line.startswith("import time:")]
+    top_level = {fields[2].strip(): int(fields[1]) for fields in rows if not fields[2].startswith("  ") and fields[2].strip().startswith("flowlayer")}
+
+    assert set(top_level) == {"flowlayer", "flowlayer.core.network"}
+    assert sum(top_level.values()) < 150_000